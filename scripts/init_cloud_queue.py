@@ -4,6 +4,8 @@ Initialize cloud job queue for batch translation.
 
 Merges Internet Archive and ChinaXiv datasets, marks already-translated
 papers as completed, and creates the queue file for GitHub Actions workflows.
+Papers from the latest ``lanes.fresh_months`` months go into the fresh lane,
+everything else into backfill.
 """
 
 import argparse
@@ -11,13 +13,17 @@ import glob
 import json
 import os
 import sys
+from datetime import date
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+# Add the repository root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from cloud_job_queue import cloud_queue
+from src.cloud_job_queue import LANE_BACKFILL, LANE_FRESH, cloud_queue
+from src.config import get_config
+from src.publish import is_full
+from src.records_store import record_month
 
 
 def load_ia_papers() -> List[str]:
@@ -70,19 +76,44 @@ def load_chinaxiv_papers() -> List[str]:
 
 
 def get_translated_papers() -> Set[str]:
-    """Get set of already-translated paper IDs."""
+    """Get set of already-translated paper IDs (abstract-only saves excluded)."""
     translated_dir = Path("data/translated")
 
     if not translated_dir.exists():
         return set()
 
-    translated_files = list(translated_dir.glob("*.json"))
-    translated_ids = {f.stem for f in translated_files}
+    translated_ids = set()
+    for path in translated_dir.glob("*.json"):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                translation = json.load(f)
+        except (OSError, ValueError):
+            continue
+        # Still waiting for its full text: keep it in the queue
+        if isinstance(translation, dict) and is_full(translation):
+            translated_ids.add(path.stem)
 
     print(f"Found {len(translated_ids)} already-translated papers")
     return translated_ids
 
 
+def fresh_cutoff(months: int, today: Optional[date] = None) -> str:
+    """First month (YYYYMM) counted as fresh when keeping the latest ``months``."""
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1 - max(months - 1, 0)
+    return f"{index // 12:04d}{index % 12 + 1:02d}"
+
+
+def split_fresh(paper_ids: List[str], months: int) -> Set[str]:
+    """Paper IDs whose month (from the ChinaXiv ID) is within the fresh window."""
+    if months <= 0:
+        return set()
+    cutoff = fresh_cutoff(months)
+    return {
+        pid for pid in paper_ids if (record_month({"id": pid}) or "") >= cutoff
+    }
+
+
 def merge_and_deduplicate(ia_ids: List[str], chinaxiv_ids: List[str]) -> List[str]:
     """Merge and deduplicate paper IDs, prioritizing ChinaXiv."""
     # Use set for deduplication
@@ -109,6 +140,8 @@ def initialize_queue(
     all_paper_ids: List[str],
     translated_ids: Set[str],
     force: bool = False,
+    estimate: bool = True,
+    fresh_months: Optional[int] = None,
 ) -> None:
     """
     Initialize cloud job queue.
@@ -117,6 +150,8 @@ def initialize_queue(
         all_paper_ids: All paper IDs to process
         translated_ids: Already-translated paper IDs
         force: If True, re-initialize even if queue exists
+        estimate: Store per-job cost estimates for scheduled claiming
+        fresh_months: Months counted as fresh (default: config lanes.fresh_months)
     """
     queue_file = Path("data/cloud_jobs.json")
 
@@ -134,9 +169,26 @@ def initialize_queue(
     print(f"  Pending: {len(pending)}")
     print(f"  Already completed: {len(completed)}")
 
-    # Add pending jobs
-    added = cloud_queue.add_jobs(pending)
-    print(f"  Added {added} pending jobs")
+    # Add pending jobs (with cost estimates for lpt/spt claiming)
+    estimates = None
+    if estimate and pending:
+        from src.job_estimates import estimate_papers
+
+        estimates = estimate_papers(pending)
+        hours = sum(e["est_seconds"] for e in estimates.values()) / 3600
+        print(f"  Estimated work: {hours:,.1f} h")
+    if fresh_months is None:
+        fresh_months = int((get_config().get("lanes") or {}).get("fresh_months", 2))
+    fresh = split_fresh(pending, fresh_months)
+    added = cloud_queue.add_jobs(
+        [pid for pid in pending if pid in fresh], estimates=estimates, lane=LANE_FRESH
+    )
+    added += cloud_queue.add_jobs(
+        [pid for pid in pending if pid not in fresh],
+        estimates=estimates,
+        lane=LANE_BACKFILL,
+    )
+    print(f"  Added {added} pending jobs ({len(fresh)} fresh)")
 
     # Mark completed jobs
     if completed:
@@ -177,6 +229,16 @@ def main():
         type=int,
         help="Limit total papers (for testing)",
     )
+    parser.add_argument(
+        "--fresh-months",
+        type=int,
+        help="Put papers from the latest N months in the fresh lane (default: config lanes.fresh_months)",
+    )
+    parser.add_argument(
+        "--skip-estimates",
+        action="store_true",
+        help="Do not store per-job cost estimates",
+    )
 
     args = parser.parse_args()
 
@@ -205,7 +267,13 @@ def main():
     translated_ids = get_translated_papers()
 
     # Initialize queue
-    initialize_queue(all_ids, translated_ids, force=args.force)
+    initialize_queue(
+        all_ids,
+        translated_ids,
+        force=args.force,
+        estimate=not args.skip_estimates,
+        fresh_months=args.fresh_months,
+    )
 
     print("\n" + "=" * 60)
     print("NEXT STEPS")
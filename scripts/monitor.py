@@ -204,15 +204,19 @@ def check_worker_health() -> Dict[str, any]:
             pid_file.unlink()
     
     # Check job queue if database exists
-    db_path = Path("data/jobs.db")
+    db_path = Path("data/job_queue.db")
     if db_path.exists():
         try:
             import sqlite3
             conn = sqlite3.connect(str(db_path))
             cursor = conn.cursor()
             
-            # Get job counts
-            cursor.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+            # Get job counts (materialized by the queue; older databases
+            # without the counters table are counted directly)
+            try:
+                cursor.execute("SELECT status, n FROM job_counts")
+            except sqlite3.OperationalError:
+                cursor.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
             for status, count in cursor.fetchall():
                 if status == 'pending':
                     health['jobs_pending'] = count
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Parse-throughput benchmark: lxml abstract-page parser vs the BeautifulSoup baseline."""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.chinaxiv_parse import parse_abstract_page, parse_many  # noqa: E402
+
+FIXTURE_DIR = ROOT / "tests/fixtures/harvest/abs_pages"
+
+
+def parse_bs4(html: str, paper_id: str) -> dict | None:
+    """The scrapers' original BeautifulSoup parse (fields only, for timing)."""
+    soup = BeautifulSoup(html, "html.parser")
+    title_elem = soup.find("h1")
+    title = title_elem.get_text(strip=True) if title_elem else ""
+    if not title or len(title) < 10:
+        return None
+    creators = [
+        a.get_text(strip=True)
+        for a in soup.find_all("a", href=lambda x: x and "field=author" in x)
+        if a.get_text(strip=True)
+    ]
+    fields = {}
+    for key, pattern in (("abstract", r"摘要[:：]"), ("date", r"提交时间[:：]"), ("cat", r"分类[:：]")):
+        marker = soup.find("b", string=re.compile(pattern))
+        if marker and marker.parent:
+            fields[key] = marker.parent.get_text(strip=False)
+    pdf = soup.find("a", href=lambda x: x and "filetype=pdf" in x)
+    return {"title": title, "creators": creators, "pdf": pdf, **fields}
+
+
+def bench(label: str, fn, pages: list[tuple[str, str]], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for paper_id, html in pages:
+            fn(html, paper_id)
+    elapsed = time.perf_counter() - start
+    rate = rounds * len(pages) / elapsed
+    print(f"{label:<12} {rate:10.0f} pages/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    pages = [(p.stem, p.read_text(encoding="utf-8")) for p in sorted(FIXTURE_DIR.glob("*.html"))]
+
+    print(f"Parse throughput over {len(pages)} fixture pages x {args.rounds} rounds")
+    base = bench("bs4", parse_bs4, pages, args.rounds)
+    fast = bench("lxml", parse_abstract_page, pages, args.rounds)
+    print(f"speedup      {fast / base:10.1f}x")
+
+    batch = pages * args.rounds
+    start = time.perf_counter()
+    for _ in parse_many(batch, workers=args.workers, chunksize=64):
+        pass
+    rate = len(batch) / (time.perf_counter() - start)
+    print(f"lxml x{args.workers:<7} {rate:10.0f} pages/s (process pool)")
+
+
+if __name__ == "__main__":
+    main()
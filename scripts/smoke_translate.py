@@ -95,7 +95,7 @@ def main() -> int:
 
     selected_path = REPO_ROOT / "data" / "selected.json"
 
-    # Selection (also fetches PDFs and updates seen.json to ensure dedupe)
+    # Selection (also fetches PDFs and updates data/seen to ensure dedupe)
     sel_rc = run(
         f"{PY} -m src.select_and_fetch --records {records_path} --limit {args.limit} --output {selected_path}"
     )
@@ -10,7 +10,8 @@ from pathlib import Path
 from typing import List
 
 from .job_queue import job_queue
-from .streaming import process_papers_streaming
+from .supervisor import WorkerSupervisor
+from .throughput import format_eta
 from .utils import log
 from .monitoring import alert_info, alert_warning
 
@@ -26,7 +27,7 @@ def init_queue(
     years: List[str], limit: int = None, use_harvested: bool = False
 ) -> None:
     """Initialize job queue with papers."""
-    # Job queue is file-based, no schema initialization needed
+    # Job queue creates its SQLite schema on first use
 
     # Load papers from harvested records
     if use_harvested:
@@ -61,49 +62,36 @@ def init_queue(
     log(f"Initialized {added} jobs in queue")
 
 
-def start_workers(num_workers: int) -> None:
-    """Process jobs using streaming to reduce memory usage."""
-    log(f"Processing jobs using streaming (workers={num_workers} for compatibility)...")
+def start_workers(num_workers: int, threads: int = None) -> None:
+    """
+    Process pending jobs with supervised worker processes.
 
-    # Get pending jobs
+    Args:
+        num_workers: Worker processes to run
+        threads: Concurrent jobs per process (default: config workers.threads)
+    """
     stats = job_queue.get_stats()
     if stats["pending"] == 0:
         log("No pending jobs to process")
         return
 
-    log(f"Processing {stats['pending']} pending jobs...")
+    log(f"Processing {stats['pending']} pending jobs with {num_workers} workers...")
 
-    # Get all pending paper IDs using queue abstraction
-    pending_ids = job_queue.get_pending_job_ids()
-
-    # Process papers one at a time
-    completed = 0
-    failed = 0
-
-    try:
-        for result in process_papers_streaming(pending_ids):
-            if result["status"] == "completed":
-                completed += 1
-                job_queue.complete_job(result["id"])
-            else:
-                failed += 1
-                job_queue.fail_job(result["id"], result.get("error", "Unknown error"))
-
-            if (completed + failed) % 10 == 0:
-                log(f"Progress: {completed + failed}/{len(pending_ids)} processed")
-
-    except KeyboardInterrupt:
-        log("Interrupted by user")
+    supervisor = WorkerSupervisor(num_workers, threads=threads)
+    result = supervisor.run()
 
     # Final stats
+    stats = job_queue.get_stats()
     log(
-        f"Processing complete: {completed}/{len(pending_ids)} completed, {failed} failed"
+        f"Processing complete: {result['completed']} completed "
+        f"({result['jobs_per_hour']:.1f}/h), {stats['pending']} pending, "
+        f"{stats['failed']} failed"
     )
 
-    if failed > 0:
+    if stats["failed"] > 0:
         alert_warning(
             "Processing Completed with Failures",
-            f"Processing completed with {failed} failures",
+            f"Processing completed with {stats['failed']} failures",
         )
     else:
         alert_info(
@@ -111,8 +99,13 @@ def start_workers(num_workers: int) -> None:
         )
 
 
-def stop_workers() -> None:
-    """Stop all running workers."""
+def stop_workers(timeout: float = 30.0) -> None:
+    """
+    Stop all running workers.
+
+    Workers (and the supervisor) get SIGTERM and finish the jobs they hold;
+    any still running after ``timeout`` seconds are killed.
+    """
     pid_dir = Path("data/workers")
 
     if not pid_dir.exists():
@@ -138,8 +131,10 @@ def stop_workers() -> None:
         except (OSError, ValueError) as e:
             log(f"Failed to stop {pid_file.stem}: {e}")
 
-    # Wait for graceful shutdown
-    time.sleep(2)
+    # Wait for graceful shutdown (each process removes its PID file on exit)
+    deadline = time.time() + timeout
+    while time.time() < deadline and any(pid_dir.glob("*.pid")):
+        time.sleep(1)
 
     # Send alert about worker shutdown
     if pid_files:
@@ -196,12 +191,27 @@ def show_status() -> None:
     else:
         print("Active Workers: 0")
 
-    # Estimated time
-    if stats["completed"] > 0 and stats["pending"] > 0:
-        # Rough estimate: 25 seconds per paper
-        est_seconds = stats["pending"] * 25
-        est_minutes = est_seconds / 60
-        print(f"Est. Time:      {est_minutes:.0f} minutes")
+    # Rolling-window throughput per worker and per model
+    rate = job_queue.get_throughput()
+    recent = rate["by_worker"]
+    for w in job_queue.get_worker_stats():
+        if not w["active"]:
+            continue
+        current = recent.get(w["worker_id"], {}).get("jobs_per_hour", 0.0)
+        print(
+            f"  {w['worker_id']}: {w['jobs_completed']} done, {w['jobs_failed']} failed, "
+            f"{current:.1f}/h now ({w['jobs_per_hour']:.1f}/h overall)"
+        )
+    for model, m in rate["by_model"].items():
+        print(f"  {model}: {m['jobs_per_hour']:.1f}/h")
+
+    # Estimated time from the recent completion rate
+    if stats["pending"] + stats["in_progress"] > 0:
+        print(
+            f"Throughput:     {rate['jobs_per_hour']:.1f} jobs/h "
+            f"(last {rate['window'] / 60:.0f} min)"
+        )
+        print(f"Est. Time:      {format_eta(rate['eta_seconds'])}")
 
     print("=" * 60)
     print()
@@ -235,7 +245,7 @@ def watch_status() -> None:
 
 
 def resume() -> None:
-    """Resume from crash - reset stuck jobs."""
+    """Resume from crash - requeue jobs whose lease expired."""
     log("Resetting stuck jobs...")
 
     reset_count = job_queue.reset_stuck_jobs(timeout_minutes=10)
@@ -306,11 +316,23 @@ def run_cli() -> None:
     # Start command
     start_parser = subparsers.add_parser("start", help="Start worker processes")
     start_parser.add_argument(
-        "--workers", type=int, default=10, help="Number of workers"
+        "--workers", type=int, default=10, help="Number of worker processes"
+    )
+    start_parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Concurrent jobs per worker process (default: config workers.threads)",
     )
 
     # Stop command
-    subparsers.add_parser("stop", help="Stop all workers")
+    stop_parser = subparsers.add_parser("stop", help="Stop all workers")
+    stop_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to let workers drain before killing them",
+    )
 
     # Status command
     subparsers.add_parser("status", help="Show queue status")
@@ -338,10 +360,10 @@ def run_cli() -> None:
         init_queue(years, limit=args.limit, use_harvested=args.use_harvested)
 
     elif args.command == "start":
-        start_workers(args.workers)
+        start_workers(args.workers, threads=args.threads)
 
     elif args.command == "stop":
-        stop_workers()
+        stop_workers(timeout=args.timeout)
 
     elif args.command == "status":
         show_status()
@@ -1,40 +1,129 @@
 from __future__ import annotations
 
 import os
+import posixpath
 import re
 import tarfile
 import zipfile
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+from .boilerplate import strip_page_furniture_from_config
 from .utils import log
 
 
+# Single-pass archive reader limits
+MAIN_TEX_PREFIX_CHARS = 64 * 1024  # main-file scoring only looks at this prefix
+MAX_TEX_FILE_BYTES = 4 * 1024 * 1024
+MAX_TEX_TOTAL_BYTES = 32 * 1024 * 1024
+MAX_INCLUDE_DEPTH = 8
+MAIN_TEX_NAMES = {"main.tex", "ms.tex", "paper.tex", "manuscript.tex"}
+
+_INCLUDE_RE = re.compile(r"\\(?:input|include)\s*\{([^}]+)\}")
+
+# In-process cache of extracted paragraphs keyed by (path, mtime, size)
+_LATEX_CACHE: "OrderedDict[Tuple[str, float, int], List[str]]" = OrderedDict()
+_LATEX_CACHE_SIZE = 64
+
+
 def _read_text_file(path: str) -> str:
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
         return f.read()
 
 
-def _find_main_tex(files: List[str], read_file) -> Optional[str]:
-    # Prefer files with \documentclass and \begin{document}
-    candidates = []
-    for name in files:
-        if not name.lower().endswith(".tex"):
-            continue
-        try:
-            txt = read_file(name)
-        except Exception:
-            continue
-        if "\\documentclass" in txt and "\\begin{document}" in txt:
-            candidates.append((name, len(txt)))
-    if candidates:
-        candidates.sort(key=lambda x: -x[1])
-        return candidates[0][0]
-    # Fallback: largest .tex
-    texes = [n for n in files if n.lower().endswith(".tex")]
-    if texes:
-        # Cannot measure size here reliably; pick first
-        return texes[0]
-    return None
+def _read_tex_sources(archive_path: str) -> Dict[str, str]:
+    """
+    Walk a .zip or tarball once and decode every .tex member.
+
+    Tarballs are read in streaming mode, so non-TeX members (figures, data)
+    are skipped without being buffered. Each file and the total are capped.
+    """
+    sources: Dict[str, str] = {}
+    total = 0
+
+    def _keep(name: str, raw: bytes) -> bool:
+        nonlocal total
+        total += len(raw)
+        if total > MAX_TEX_TOTAL_BYTES:
+            log(f"latex sources exceed {MAX_TEX_TOTAL_BYTES} bytes; ignoring the rest")
+            return False
+        sources[_normalize_tex_path(name)] = raw.decode("utf-8", errors="ignore")
+        return True
+
+    if archive_path.lower().endswith(".zip"):
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(".tex"):
+                    continue
+                with zf.open(info) as f:
+                    if not _keep(info.filename, f.read(MAX_TEX_FILE_BYTES)):
+                        break
+    else:
+        with tarfile.open(archive_path, "r|*") as tf:
+            for member in tf:
+                if not member.isfile() or not member.name.lower().endswith(".tex"):
+                    continue
+                f = tf.extractfile(member)
+                if f is None:
+                    continue
+                with f:
+                    if not _keep(member.name, f.read(MAX_TEX_FILE_BYTES)):
+                        break
+    return sources
+
+
+def _normalize_tex_path(name: str) -> str:
+    path = posixpath.normpath(name.replace("\\", "/"))
+    return path[2:] if path.startswith("./") else path
+
+
+def _score_main_tex(name: str, text: str) -> int:
+    """Score how likely a file is the main document, from a bounded prefix."""
+    head = text[:MAIN_TEX_PREFIX_CHARS]
+    score = 0
+    if "\\documentclass" in head:
+        score += 4
+    if "\\begin{document}" in head:
+        score += 2
+    if posixpath.basename(name).lower() in MAIN_TEX_NAMES:
+        score += 1
+    return score
+
+
+def _find_main_tex(sources: Dict[str, str]) -> Optional[str]:
+    # Prefer files with \documentclass and \begin{document}; ties go to the largest
+    if not sources:
+        return None
+    return max(sources, key=lambda n: (_score_main_tex(n, sources[n]), len(sources[n])))
+
+
+def _strip_comment_lines(tex: str) -> str:
+    return "\n".join(ln for ln in tex.splitlines() if not ln.strip().startswith("%"))
+
+
+def _resolve_includes(
+    name: str, sources: Dict[str, str], depth: int = 0, stack: Tuple[str, ...] = ()
+) -> str:
+    """Inline \\input/\\include targets found in the archive, recursively."""
+    tex = _strip_comment_lines(sources.get(name, ""))
+    if depth >= MAX_INCLUDE_DEPTH:
+        return tex
+    # LaTeX resolves paths against the main file's directory; also accept
+    # paths relative to the including file or the archive root
+    main_dir = posixpath.dirname(stack[0] if stack else name)
+    base_dirs = (main_dir, posixpath.dirname(name), "")
+
+    def _inline(m: "re.Match[str]") -> str:
+        target = m.group(1).strip()
+        if not target.lower().endswith(".tex"):
+            target += ".tex"
+        for base_dir in base_dirs:
+            cand = _normalize_tex_path(posixpath.join(base_dir, target))
+            if cand in sources and cand not in stack:
+                return _resolve_includes(cand, sources, depth + 1, stack + (name,))
+        return m.group(0)
+
+    return _INCLUDE_RE.sub(_inline, tex)
 
 
 def _extract_tex_content(tex: str) -> str:
@@ -63,37 +152,26 @@ def _split_paragraphs(text: str) -> List[str]:
 def extract_from_latex(archive_path: str) -> Optional[List[str]]:
     if not archive_path or not os.path.exists(archive_path):
         return None
+    st = os.stat(archive_path)
+    key = (os.path.abspath(archive_path), st.st_mtime, st.st_size)
+    if key in _LATEX_CACHE:
+        _LATEX_CACHE.move_to_end(key)
+        return list(_LATEX_CACHE[key])
     try:
-        if archive_path.lower().endswith(".zip"):
-            with zipfile.ZipFile(archive_path) as zf:
-                names = zf.namelist()
-
-                def read_file(n):
-                    with zf.open(n) as f:
-                        return f.read().decode("utf-8", errors="ignore")
-
-                main = _find_main_tex(names, read_file)
-                if not main:
-                    return None
-                tex = read_file(main)
-        else:
-            with tarfile.open(archive_path, "r:gz") as tf:
-                names = [m.name for m in tf.getmembers() if m.isfile()]
-
-                def read_file(n):
-                    member = tf.getmember(n)
-                    with tf.extractfile(member) as f:
-                        return f.read().decode("utf-8", errors="ignore")
-
-                main = _find_main_tex(names, read_file)
-                if not main:
-                    return None
-                tex = read_file(main)
+        sources = _read_tex_sources(archive_path)
     except Exception as e:
         log(f"latex extract failed: {e}")
         return None
+    main = _find_main_tex(sources)
+    if not main:
+        return None
+    tex = _resolve_includes(main, sources)
     content = _extract_tex_content(tex)
-    return _split_paragraphs(content)
+    paras = _split_paragraphs(content)
+    _LATEX_CACHE[key] = paras
+    if len(_LATEX_CACHE) > _LATEX_CACHE_SIZE:
+        _LATEX_CACHE.popitem(last=False)
+    return list(paras)
 
 
 def extract_from_pdf(pdf_path: str) -> Optional[List[str]]:
@@ -106,10 +184,23 @@ def extract_from_pdf(pdf_path: str) -> Optional[List[str]]:
     except Exception as e:
         log(f"pdf extract failed: {e}")
         return None
-    # Coalesce into paragraphs using blank lines
-    # pdfminer might insert many newlines; compact multiple newlines
-    txt = re.sub(r"\n{2,}", "\n\n", txt)
-    return _split_paragraphs(txt)
+    # pdfminer separates pages with form feeds; keep per-page blocks so
+    # running headers/footers can be recognized by position and repetition
+    pages = []
+    for page_txt in txt.split("\f"):
+        # Coalesce into paragraphs using blank lines
+        # pdfminer might insert many newlines; compact multiple newlines
+        page_txt = re.sub(r"\n{2,}", "\n\n", page_txt)
+        blocks = _split_paragraphs(page_txt)
+        if blocks:
+            pages.append(blocks)
+    result = strip_page_furniture_from_config(pages)
+    if result.dropped:
+        log(
+            f"{os.path.basename(pdf_path)}: stripped {len(result.dropped)} page-furniture "
+            f"paragraphs (~{result.tokens_saved} tokens, {result.saved_ratio:.1%})"
+        )
+    return result.paragraphs
 
 
 def extract_body_paragraphs(rec: dict) -> List[str]:
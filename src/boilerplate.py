@@ -0,0 +1,123 @@
+"""
+Page-furniture stripping for PDF-extracted text.
+
+Running headers, footers, page numbers and journal banners repeat on every
+page of a PDF and would otherwise be translated once per page. Blocks near
+the top or bottom of a page whose normalized text recurs on many pages are
+dropped before translation.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .config import get_config
+from .token_utils import estimate_tokens
+
+
+PAGE_NUMBER_RE = re.compile(
+    r"^(?:page\s*)?[-–—]?\s*\d{1,4}\s*[-–—]?(?:\s*(?:/|of)\s*\d{1,4})?$"
+    r"|^第\s*\d{1,4}\s*页(?:\s*[,，]?\s*共\s*\d{1,4}\s*页)?$",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class BoilerplateResult:
+    """Paragraphs kept after stripping plus what was dropped."""
+
+    paragraphs: List[str]
+    dropped: List[str] = field(default_factory=list)
+    tokens_saved: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(estimate_tokens(p) for p in self.paragraphs) + self.tokens_saved
+
+    @property
+    def saved_ratio(self) -> float:
+        total = self.total_tokens
+        return self.tokens_saved / total if total else 0.0
+
+
+def _furniture_key(text: str) -> str:
+    """Normalize a block so running headers match across pages."""
+    key = re.sub(r"\d+", "#", text.lower())
+    return re.sub(r"\s+", " ", key).strip()
+
+
+def strip_page_furniture(
+    pages: List[List[str]],
+    *,
+    edge_blocks: int = 3,
+    min_page_ratio: float = 0.4,
+    min_pages: int = 3,
+    max_chars: int = 200,
+) -> BoilerplateResult:
+    """
+    Drop repeated header/footer blocks and page numbers from per-page blocks.
+
+    Args:
+        pages: Paragraph blocks per page, in reading order
+        edge_blocks: How many blocks at the top and bottom of a page count as
+            header/footer positions
+        min_page_ratio: Fraction of pages a block must repeat on
+        min_pages: Never treat blocks seen on fewer pages as furniture
+        max_chars: Longer blocks are assumed to be body text
+
+    Returns:
+        BoilerplateResult with the flattened kept paragraphs
+    """
+
+    def _edge(page: List[str], idx: int) -> bool:
+        return idx < edge_blocks or idx >= len(page) - edge_blocks
+
+    # Count on how many pages each short edge block appears
+    page_counts: Counter = Counter()
+    for page in pages:
+        keys = {
+            _furniture_key(block)
+            for idx, block in enumerate(page)
+            if _edge(page, idx) and len(block) <= max_chars
+        }
+        page_counts.update(keys)
+
+    threshold = max(min_pages, math.ceil(min_page_ratio * len(pages)))
+    repeated = {k for k, n in page_counts.items() if n >= threshold}
+
+    kept: List[str] = []
+    dropped: List[str] = []
+    for page in pages:
+        for idx, block in enumerate(page):
+            if _edge(page, idx) and len(block) <= max_chars:
+                if PAGE_NUMBER_RE.match(block.strip()) or _furniture_key(block) in repeated:
+                    dropped.append(block)
+                    continue
+            kept.append(block)
+
+    return BoilerplateResult(
+        paragraphs=kept,
+        dropped=dropped,
+        tokens_saved=sum(estimate_tokens(b) for b in dropped),
+    )
+
+
+def strip_page_furniture_from_config(
+    pages: List[List[str]], config: Optional[Dict[str, Any]] = None
+) -> BoilerplateResult:
+    """Apply :func:`strip_page_furniture` using ``extraction.boilerplate`` settings."""
+    cfg = (config if config is not None else get_config()).get("extraction") or {}
+    bp = cfg.get("boilerplate") or {}
+    if bp.get("enabled", True) is False:
+        return BoilerplateResult(paragraphs=[b for page in pages for b in page])
+    return strip_page_furniture(
+        pages,
+        edge_blocks=int(bp.get("edge_blocks", 3)),
+        min_page_ratio=float(bp.get("min_page_ratio", 0.4)),
+        min_pages=int(bp.get("min_pages", 3)),
+        max_chars=int(bp.get("max_chars", 200)),
+    )
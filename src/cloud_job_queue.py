@@ -1,17 +1,77 @@
 """
 Cloud-native job queue for batch translation in GitHub Actions.
 
-Uses a single JSON file for all jobs, optimized for Git-based workflows.
-Atomic operations via file locking prevent race conditions between parallel workers.
+State is kept as a snapshot plus an append-only event log:
+
+    data/cloud_jobs.json        snapshot committed by the workflows
+    data/cloud_jobs.log.jsonl   one line per job change since the snapshot
+    data/cloud_jobs.lock        flock target
+
+Every operation takes one exclusive lock, catches up on log lines appended
+by other processes, applies its change to an in-memory ``paper_id -> job``
+index and appends the changed jobs to the log. A completion is therefore a
+dictionary update plus one appended line instead of a parse and rewrite of
+the whole queue. Compaction folds the log into the snapshot (one job per
+line, so Git diffs stay small) and starts an empty log; it runs every
+``compact_every`` events and via ``python -m src.cloud_job_queue compact``.
+
+Parallel runners can split the queue into N shard files
+(``data/cloud_jobs/shard-KKK-of-NNN.json``, each with its own log and lock)
+by CRC32 of the paper ID. See :class:`ShardedCloudQueue`.
+
+Status counts are kept up to date as each change is applied, and recent
+completions are kept for the rolling throughput and ETA of
+:meth:`CloudJobQueue.get_throughput` (see ``src/throughput.py``).
+
+Pending jobs sit in priority lanes (``fresh``, ``retry``, ``backfill``,
+``rework``; see :func:`lane_of`). ``claim_batch`` reserves a share of every
+batch for fresh papers and fills the rest by weighted round robin over the
+lanes, so a large backfill cannot starve newly harvested papers. Weights
+and the reserve live under ``lanes`` in ``config.yaml``.
+
+Jobs may carry cost estimates (``est_tokens``, ``est_seconds``,
+``est_basis``; see ``src/job_estimates.py``). ``claim_batch`` can order
+claims by them (``lpt``: longest first, ``spt``: shortest first) and cap a
+batch by estimated seconds instead of job count.
 """
 
 import fcntl
+import heapq
 import json
+import math
 import os
+import re
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+from .config import get_config
+from .throughput import format_eta, iso_to_epoch, summarize, window_seconds
+
+COMPACT_EVERY = 5000
+SHARD_DIR = "data/cloud_jobs"
+
+# Claim orders accepted by claim_batch
+SCHEDULE_POLICIES = ("fifo", "lpt", "spt")
+# Cost assumed for jobs without an estimate (a typical 12-page paper)
+DEFAULT_EST_SECONDS = 60.0
+# Completions older than this are not kept for throughput
+RECENT_RETENTION = 24 * 3600
+
+# Priority lanes, highest priority first
+LANE_FRESH = "fresh"
+LANE_RETRY = "retry"
+LANE_BACKFILL = "backfill"
+LANE_REWORK = "rework"
+LANES = (LANE_FRESH, LANE_RETRY, LANE_BACKFILL, LANE_REWORK)
+LANE_WEIGHTS = {LANE_FRESH: 4, LANE_RETRY: 2, LANE_BACKFILL: 3, LANE_REWORK: 1}
+FRESH_RESERVE = 0.25
 
 
 @dataclass
@@ -25,82 +85,322 @@ class JobStatus:
     QA_FLAGGED = "qa_flagged"
 
 
+def _new_job(paper_id: str) -> Dict:
+    return {
+        "paper_id": paper_id,
+        "status": JobStatus.PENDING,
+        "created_at": datetime.now().isoformat(),
+        "attempts": 0,
+        "worker_id": None,
+        "started_at": None,
+        "completed_at": None,
+        "error": None,
+    }
+
+
+def lane_of(job: Dict) -> str:
+    """
+    Lane a pending job is claimed from.
+
+    Jobs keep the lane they were added with (``backfill`` if none). Backfill
+    jobs that have already been attempted move to ``retry``; fresh papers
+    stay fresh on retry so their latency stays bounded.
+    """
+    lane = job.get("lane") or LANE_BACKFILL
+    if lane == LANE_BACKFILL and job.get("attempts"):
+        return LANE_RETRY
+    return lane if lane in LANES else LANE_BACKFILL
+
+
+def lane_config() -> Dict:
+    """``lanes`` config section: ``weights`` per lane and ``fresh_reserve``."""
+    cfg = get_config().get("lanes") or {}
+    weights = {**LANE_WEIGHTS, **(cfg.get("weights") or {})}
+    return {
+        "weights": {lane: max(0.0, float(weights[lane])) for lane in LANES},
+        "fresh_reserve": float(cfg.get("fresh_reserve", FRESH_RESERVE)),
+    }
+
+
+def job_cost(job: Dict) -> float:
+    """Estimated seconds to process a job (``est_seconds`` or the default)."""
+    return float(job.get("est_seconds") or DEFAULT_EST_SECONDS)
+
+
+def _write_snapshot_file(path: Path, jobs: Iterable[Dict], metadata: Dict) -> None:
+    """Atomically write ``{"jobs": [...], "metadata": {...}}``, one job per line."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write('{\n"jobs": [')
+        for i, job in enumerate(jobs):
+            f.write(",\n" if i else "\n")
+            f.write(json.dumps(job, ensure_ascii=False))
+        f.write('\n],\n"metadata": ')
+        f.write(json.dumps(metadata, ensure_ascii=False))
+        f.write("\n}\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 class CloudJobQueue:
     """
-    Cloud-native job queue using single JSON file.
+    Cloud-native job queue backed by a snapshot and an event log.
 
     Designed for GitHub Actions workflows with larger runners.
     Supports atomic batch claiming and progress tracking.
     """
 
-    def __init__(self, queue_file: str = "data/cloud_jobs.json"):
+    def __init__(
+        self,
+        queue_file: str = "data/cloud_jobs.json",
+        compact_every: int = COMPACT_EVERY,
+    ):
+        """
+        Args:
+            queue_file: Snapshot path; the log and lock file sit next to it
+            compact_every: Fold the log into the snapshot after this many
+                events written by this process (0 disables)
+        """
         self.queue_file = Path(queue_file)
+        self.log_file = self.queue_file.with_name(self.queue_file.stem + ".log.jsonl")
+        self.lock_file = self.queue_file.with_name(self.queue_file.stem + ".lock")
         self.queue_file.parent.mkdir(parents=True, exist_ok=True)
+        self.compact_every = compact_every
+
+        self._mutex = threading.RLock()
+        self._jobs: Dict[str, Dict] = {}
+        # Insertion-ordered sets of pending paper IDs per lane (claim order)
+        self._lanes: Dict[str, Dict[str, None]] = {lane: {} for lane in LANES}
+        # Smooth weighted round-robin credit per lane, kept across claims
+        self._lane_credit: Dict[str, float] = {lane: 0.0 for lane in LANES}
+        self._counts: Counter = Counter()
+        # (ts, worker_id, model, seconds) of recent completions
+        self._recent: deque = deque()
+        self._metadata: Dict = {}
+        self._snapshot_sig = None
+        self._log_ino = None
+        self._log_pos = 0
+        self._events_since_compact = 0
 
         # Initialize queue file if it doesn't exist
+        with self._locked():
+            if not self.queue_file.exists():
+                self._metadata = {"created_at": datetime.now().isoformat()}
+                self._write_snapshot()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive lock (threads and processes) with the index caught up."""
+        with self._mutex:
+            with open(self.lock_file, "a") as lock:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    self._refresh()
+                    yield
+                finally:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        """Apply log lines written since our last look; reload after compaction."""
+        try:
+            st = os.stat(self.queue_file)
+            snapshot_sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            snapshot_sig = None
+        try:
+            log_st = os.stat(self.log_file)
+        except FileNotFoundError:
+            log_st = None
+        log_ino = log_st.st_ino if log_st else None
+        log_size = log_st.st_size if log_st else 0
+
+        if (
+            snapshot_sig != self._snapshot_sig
+            or log_ino != self._log_ino
+            or log_size < self._log_pos
+        ):
+            self._load_snapshot()
+            self._snapshot_sig = snapshot_sig
+            self._log_ino = log_ino
+            self._log_pos = 0
+        if log_size > self._log_pos:
+            self._replay_log()
+
+    def _load_snapshot(self) -> None:
+        self._jobs, self._counts = {}, Counter()
+        self._lanes = {lane: {} for lane in LANES}
+        self._recent = deque()
+        self._metadata = {}
         if not self.queue_file.exists():
-            self._write_queue({"jobs": [], "metadata": {"created_at": datetime.now().isoformat()}})
-
-    def _read_queue(self) -> Dict:
-        """Read queue with file locking."""
+            return
         with open(self.queue_file, "r") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            data = json.load(f)
+        self._metadata = data.get("metadata") or {}
+        for job in data.get("jobs") or []:
+            self._apply(job)
+
+    def _replay_log(self) -> None:
+        with open(self.log_file, "rb") as f:
+            f.seek(self._log_pos)
+            chunk = f.read()
+        # Only consume complete lines; a torn tail is re-read next time
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
             try:
-                data = json.load(f)
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-        return data
-
-    def _write_queue(self, data: Dict) -> None:
-        """Write queue with file locking."""
-        with open(self.queue_file, "w") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-    def add_jobs(self, paper_ids: List[str], force: bool = False) -> int:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if "job" in event:
+                self._apply(event["job"])
+            if "ts" in event:
+                self._metadata["last_updated"] = event["ts"]
+        self._log_pos += end
+
+    def _apply(self, job: Dict) -> None:
+        """Update the index and counters with a job's new state."""
+        paper_id = job["paper_id"]
+        old = self._jobs.get(paper_id)
+        # A pending job that stays pending in the same lane (e.g. new
+        # estimates) keeps its place in the lane's FIFO order
+        old_lane = lane_of(old) if old and old["status"] == JobStatus.PENDING else None
+        new_lane = lane_of(job) if job["status"] == JobStatus.PENDING else None
+        if old is not None:
+            self._counts[old["status"]] -= 1
+            if old_lane is not None and old_lane != new_lane:
+                self._lanes[old_lane].pop(paper_id, None)
+        self._jobs[paper_id] = job
+        self._counts[job["status"]] += 1
+        if job["status"] in (JobStatus.COMPLETED, JobStatus.QA_FLAGGED) and (
+            old is None or old.get("completed_at") != job.get("completed_at")
+        ):
+            self._record_completion(job)
+        if new_lane is not None and new_lane != old_lane:
+            self._lanes[new_lane][paper_id] = None
+
+    def _record_completion(self, job: Dict) -> None:
+        # Only jobs a worker actually ran (not ones marked done on import)
+        ts = iso_to_epoch(job.get("completed_at"))
+        started = iso_to_epoch(job.get("started_at"))
+        cutoff = time.time() - RECENT_RETENTION
+        if ts is None or started is None or ts < cutoff:
+            return
+        self._recent.append((ts, job.get("worker_id"), job.get("model"), ts - started))
+        while self._recent and self._recent[0][0] < cutoff:
+            self._recent.popleft()
+
+    def _commit(self, jobs: Iterable[Dict]) -> None:
+        """Apply changed jobs and append them to the log (lock held)."""
+        ts = datetime.now().isoformat()
+        lines = []
+        for job in jobs:
+            self._apply(job)
+            lines.append(json.dumps({"job": job, "ts": ts}, ensure_ascii=False))
+        if not lines:
+            return
+        self._metadata["last_updated"] = ts
+        with open(self.log_file, "a+b") as f:
+            # A writer that crashed mid-append left a torn line; appending
+            # after it would corrupt this batch's first event too
+            _truncate_torn_tail(f)
+            f.write(("\n".join(lines) + "\n").encode("utf-8"))
+            f.flush()
+            st = os.fstat(f.fileno())
+        self._log_ino, self._log_pos = st.st_ino, st.st_size
+        self._events_since_compact += len(lines)
+        if self.compact_every and self._events_since_compact >= self.compact_every:
+            self._compact()
+
+    def _write_snapshot(self) -> None:
+        _write_snapshot_file(self.queue_file, self._jobs.values(), self._metadata)
+        st = os.stat(self.queue_file)
+        self._snapshot_sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _compact(self) -> None:
+        """Write the snapshot and start a new empty log (lock held)."""
+        self._metadata["compacted_at"] = datetime.now().isoformat()
+        self._write_snapshot()
+        # Replacing (not truncating) gives the log a new inode, which tells
+        # other processes to reload from the new snapshot
+        tmp = self.log_file.with_name(self.log_file.name + ".tmp")
+        open(tmp, "w").close()
+        os.replace(tmp, self.log_file)
+        self._log_ino, self._log_pos = os.stat(self.log_file).st_ino, 0
+        self._events_since_compact = 0
+
+    def compact(self) -> None:
+        """Fold the event log into ``cloud_jobs.json``."""
+        with self._locked():
+            self._compact()
+
+    # ------------------------------------------------------------------
+    # Queue operations
+    # ------------------------------------------------------------------
+
+    def add_jobs(
+        self,
+        paper_ids: List[str],
+        force: bool = False,
+        estimates: Optional[Dict[str, Dict]] = None,
+        lane: str = LANE_BACKFILL,
+    ) -> int:
         """
         Add jobs to queue.
 
         Args:
             paper_ids: List of paper IDs to add
-            force: If True, re-add even if already exists
+            force: If True, reset jobs that already exist to a fresh pending job
+            estimates: Optional cost estimates by paper ID, stored on the new jobs
+            lane: Priority lane of the new jobs (``fresh`` or ``backfill``)
 
         Returns:
             Number of jobs added
         """
-        data = self._read_queue()
-        existing_ids = {job["paper_id"] for job in data["jobs"]}
-
-        added = 0
-        for paper_id in paper_ids:
-            if paper_id not in existing_ids or force:
-                data["jobs"].append(
-                    {
-                        "paper_id": paper_id,
-                        "status": JobStatus.PENDING,
-                        "created_at": datetime.now().isoformat(),
-                        "attempts": 0,
-                        "worker_id": None,
-                        "started_at": None,
-                        "completed_at": None,
-                        "error": None,
+        if lane not in LANES:
+            raise ValueError(f"Unknown lane: {lane}")
+        estimates = estimates or {}
+        with self._locked():
+            new: Dict[str, Dict] = {}
+            for paper_id in paper_ids:
+                if (paper_id not in self._jobs or force) and paper_id not in new:
+                    new[paper_id] = {
+                        **_new_job(paper_id),
+                        "lane": lane,
+                        **estimates.get(paper_id, {}),
                     }
-                )
-                added += 1
+            self._commit(new.values())
+        return len(new)
 
-        if added > 0:
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
-            self._write_queue(data)
+    def set_estimates(self, estimates: Dict[str, Dict]) -> int:
+        """
+        Store cost estimates on existing jobs.
 
-        return added
+        Args:
+            estimates: ``paper_id -> {"est_tokens": ..., "est_seconds": ...}``
+
+        Returns:
+            Number of jobs whose estimate changed
+        """
+        with self._locked():
+            changed = []
+            for paper_id, est in estimates.items():
+                job = self._jobs.get(paper_id)
+                if job is not None and any(job.get(k) != v for k, v in est.items()):
+                    changed.append({**job, **est})
+            self._commit(changed)
+        return len(changed)
 
     def claim_batch(
-        self, worker_id: str, batch_size: int = 100, max_attempts: int = 3
+        self,
+        worker_id: str,
+        batch_size: int = 100,
+        max_attempts: int = 3,
+        policy: str = "fifo",
+        work_budget: Optional[float] = None,
     ) -> List[Dict]:
         """
         Atomically claim a batch of pending jobs.
@@ -109,54 +409,157 @@ class CloudJobQueue:
             worker_id: Worker identifier (e.g., "worker-1", "gh-actions-run-123")
             batch_size: Number of jobs to claim
             max_attempts: Skip jobs that have failed this many times
+            policy: Claim order: ``fifo`` (insertion order), ``lpt`` (longest
+                estimate first, shortens the makespan of parallel runners) or
+                ``spt`` (shortest first, publishes the most papers soonest)
+            work_budget: Stop once the batch adds up to this many estimated
+                seconds (at least one job is always claimed)
+
+        ``policy`` orders jobs within a lane; lanes are interleaved by
+        :meth:`_lane_order`.
 
         Returns:
-            List of claimed job dictionaries
+            List of claimed job dictionaries, in claim order
         """
-        data = self._read_queue()
+        if policy not in SCHEDULE_POLICIES:
+            raise ValueError(f"Unknown scheduling policy: {policy}")
+        with self._locked():
+            now = datetime.now().isoformat()
+            claimed = []
+            work = 0.0
+            for job in self._lane_order(batch_size, max_attempts, policy):
+                if len(claimed) >= batch_size:
+                    break
+                if work_budget is not None and claimed and work >= work_budget:
+                    break
+                work += job_cost(job)
+                claimed.append(
+                    {
+                        **job,
+                        "status": JobStatus.IN_PROGRESS,
+                        "worker_id": worker_id,
+                        "started_at": now,
+                        "attempts": job["attempts"] + 1,
+                    }
+                )
+            self._commit(claimed)
+        return [job.copy() for job in claimed]
 
-        claimed = []
-        for job in data["jobs"]:
-            if len(claimed) >= batch_size:
-                break
+    def _lane_order(self, batch_size: int, max_attempts: int, policy: str) -> Iterator[Dict]:
+        """
+        Yield up to ``batch_size`` claimable jobs, interleaving the lanes.
 
-            if (
-                job["status"] == JobStatus.PENDING
-                and job["attempts"] < max_attempts
-            ):
-                job["status"] = JobStatus.IN_PROGRESS
-                job["worker_id"] = worker_id
-                job["started_at"] = datetime.now().isoformat()
-                job["attempts"] += 1
-                claimed.append(job.copy())
+        The first ``fresh_reserve`` share of the batch goes to fresh jobs
+        while there are any. Every further slot goes to the non-empty lane
+        with the most smooth weighted round-robin credit, so each lane gets
+        its weighted share and an empty lane's share flows to the others.
+        """
+        cfg = lane_config()
+        weights = cfg["weights"]
+        streams: Dict[str, Iterator[Dict]] = {}
+        for lane in LANES:
+            eligible = (
+                job
+                for job in map(self._jobs.__getitem__, self._lanes[lane])
+                if job["attempts"] < max_attempts
+            )
+            if policy == "lpt":
+                eligible = iter(heapq.nlargest(batch_size, eligible, key=job_cost))
+            elif policy == "spt":
+                eligible = iter(heapq.nsmallest(batch_size, eligible, key=job_cost))
+            streams[lane] = eligible
+        heads: Dict[str, Dict] = {}
+        for lane, stream in streams.items():
+            head = next(stream, None)
+            if head is not None:
+                heads[lane] = head
+
+        def _take(lane: str) -> Dict:
+            job = heads.pop(lane)
+            nxt = next(streams[lane], None)
+            if nxt is not None:
+                heads[lane] = nxt
+            return job
+
+        reserve = math.ceil(cfg["fresh_reserve"] * batch_size)
+        for _ in range(reserve):
+            if LANE_FRESH not in heads:
+                break
+            yield _take(LANE_FRESH)
+        while heads:
+            # Zero-weight lanes are only served when nothing else is waiting
+            active = [lane for lane in heads if weights[lane] > 0] or list(heads)
+            total = sum(weights[lane] or 1.0 for lane in active)
+            for lane in active:
+                self._lane_credit[lane] += weights[lane] or 1.0
+            lane = max(active, key=lambda name: self._lane_credit[name])
+            self._lane_credit[lane] -= total
+            yield _take(lane)
+
+    def requeue_flagged(self, paper_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Send QA-flagged jobs back for rework in the ``rework`` lane.
 
-        if claimed:
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
-            self._write_queue(data)
+        Args:
+            paper_ids: Jobs to requeue (default: every QA-flagged job)
 
-        return claimed
+        Returns:
+            Number of jobs requeued
+        """
+        with self._locked():
+            ids = self._jobs.keys() if paper_ids is None else paper_ids
+            requeued = [
+                {
+                    **job,
+                    "status": JobStatus.PENDING,
+                    "lane": LANE_REWORK,
+                    "worker_id": None,
+                    "started_at": None,
+                    "completed_at": None,
+                    "attempts": 0,
+                }
+                for job in (self._jobs.get(pid) for pid in ids)
+                if job is not None and job["status"] == JobStatus.QA_FLAGGED
+            ]
+            self._commit(requeued)
+        return len(requeued)
+
+    def get_lane_stats(self) -> Dict[str, Dict]:
+        """Pending jobs per lane and the creation time of the oldest."""
+        with self._locked():
+            return {
+                lane: {
+                    "pending": len(ids),
+                    "oldest": min(
+                        (self._jobs[pid]["created_at"] for pid in ids), default=None
+                    ),
+                }
+                for lane, ids in self._lanes.items()
+            }
 
-    def complete_job(self, paper_id: str, qa_passed: bool = True) -> None:
+    def complete_job(
+        self, paper_id: str, qa_passed: bool = True, model: Optional[str] = None
+    ) -> None:
         """
         Mark job as completed.
 
         Args:
             paper_id: Paper ID
             qa_passed: Whether QA checks passed
+            model: Translation model, recorded for per-model throughput
         """
-        data = self._read_queue()
-
-        for job in data["jobs"]:
-            if job["paper_id"] == paper_id:
-                if qa_passed:
-                    job["status"] = JobStatus.COMPLETED
-                else:
-                    job["status"] = JobStatus.QA_FLAGGED
-                job["completed_at"] = datetime.now().isoformat()
-                break
-
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        self._write_queue(data)
+        with self._locked():
+            job = self._jobs.get(paper_id)
+            if job is None:
+                return
+            job = {
+                **job,
+                "status": JobStatus.COMPLETED if qa_passed else JobStatus.QA_FLAGGED,
+                "completed_at": datetime.now().isoformat(),
+            }
+            if model:
+                job["model"] = model
+            self._commit([job])
 
     def fail_job(self, paper_id: str, error: str, max_attempts: int = 3) -> None:
         """
@@ -167,44 +570,66 @@ class CloudJobQueue:
             error: Error message
             max_attempts: Maximum retry attempts before permanent failure
         """
-        data = self._read_queue()
-
-        for job in data["jobs"]:
-            if job["paper_id"] == paper_id:
-                job["error"] = error
-                job["updated_at"] = datetime.now().isoformat()
-
-                if job["attempts"] >= max_attempts:
-                    job["status"] = JobStatus.FAILED
-                else:
-                    # Reset to pending for retry
-                    job["status"] = JobStatus.PENDING
-                    job["worker_id"] = None
-                    job["started_at"] = None
-                break
-
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        self._write_queue(data)
+        with self._locked():
+            job = self._jobs.get(paper_id)
+            if job is None:
+                return
+            job = {**job, "error": error, "updated_at": datetime.now().isoformat()}
+            if job["attempts"] >= max_attempts:
+                job["status"] = JobStatus.FAILED
+            else:
+                # Reset to pending for retry
+                job.update(status=JobStatus.PENDING, worker_id=None, started_at=None)
+            self._commit([job])
+
+    def get_job(self, paper_id: str) -> Optional[Dict]:
+        """Return a copy of one job, or None if unknown."""
+        with self._locked():
+            job = self._jobs.get(paper_id)
+            return dict(job) if job else None
+
+    def get_pending_ids(self) -> List[str]:
+        """Paper IDs of pending jobs, lane by lane in claim order."""
+        with self._locked():
+            return [pid for lane in LANES for pid in self._lanes[lane]]
 
     def get_stats(self) -> Dict[str, int]:
         """Get job statistics."""
-        data = self._read_queue()
-
-        stats = {
-            "total": len(data["jobs"]),
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "failed": 0,
-            "qa_flagged": 0,
-        }
+        with self._locked():
+            stats = {
+                "total": len(self._jobs),
+                "pending": 0,
+                "in_progress": 0,
+                "completed": 0,
+                "failed": 0,
+                "qa_flagged": 0,
+            }
+            for status in stats:
+                if status != "total":
+                    stats[status] = self._counts[status]
+        return stats
 
-        for job in data["jobs"]:
-            status = job["status"]
-            if status in stats:
-                stats[status] += 1
+    def recent_completions(self, window: Optional[float] = None) -> List[tuple]:
+        """Completion events ``(ts, worker_id, model, seconds)`` within ``window`` seconds."""
+        window = window_seconds() if window is None else window
+        cutoff = time.time() - window
+        with self._locked():
+            return [e for e in self._recent if e[0] >= cutoff]
 
-        return stats
+    def get_throughput(self, window: Optional[float] = None) -> Dict:
+        """
+        Rolling-window throughput (overall, per worker, per model) and ETA.
+
+        Args:
+            window: Window in seconds (default: config throughput.window_seconds)
+        """
+        window = window_seconds() if window is None else window
+        stats = self.get_stats()
+        return summarize(
+            self.recent_completions(window),
+            remaining=stats["pending"] + stats["in_progress"],
+            window=window,
+        )
 
     def reset_stuck_jobs(self, timeout_minutes: int = 60) -> int:
         """
@@ -216,89 +641,364 @@ class CloudJobQueue:
         Returns:
             Number of jobs reset
         """
-        data = self._read_queue()
         cutoff = datetime.now() - timedelta(minutes=timeout_minutes)
-        reset_count = 0
-
-        for job in data["jobs"]:
-            if job["status"] == JobStatus.IN_PROGRESS and job.get("started_at"):
-                try:
-                    started = datetime.fromisoformat(job["started_at"])
+        with self._locked():
+            reset = []
+            for job in self._jobs.values():
+                if job["status"] == JobStatus.IN_PROGRESS and job.get("started_at"):
+                    try:
+                        started = datetime.fromisoformat(job["started_at"])
+                    except (ValueError, TypeError):
+                        continue
                     if started < cutoff:
-                        job["status"] = JobStatus.PENDING
-                        job["worker_id"] = None
-                        job["started_at"] = None
-                        reset_count += 1
-                except (ValueError, TypeError):
-                    pass
-
-        if reset_count > 0:
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
-            self._write_queue(data)
-
-        return reset_count
+                        reset.append(
+                            {**job, "status": JobStatus.PENDING, "worker_id": None, "started_at": None}
+                        )
+            self._commit(reset)
+        return len(reset)
 
     def get_failed_jobs(self, limit: int = 100) -> List[Dict]:
         """Get list of failed jobs."""
-        data = self._read_queue()
-
-        failed = [
-            {
-                "paper_id": job["paper_id"],
-                "attempts": job["attempts"],
-                "error": job.get("error", "Unknown error"),
-                "updated_at": job.get("updated_at", job.get("started_at")),
-            }
-            for job in data["jobs"]
-            if job["status"] == JobStatus.FAILED
-        ]
+        with self._locked():
+            failed = [
+                {
+                    "paper_id": job["paper_id"],
+                    "attempts": job["attempts"],
+                    "error": job.get("error", "Unknown error"),
+                    "updated_at": job.get("updated_at", job.get("started_at")),
+                }
+                for job in self._jobs.values()
+                if job["status"] == JobStatus.FAILED
+            ]
 
         return failed[:limit]
 
     def get_qa_flagged_jobs(self, limit: int = 100) -> List[Dict]:
         """Get list of QA-flagged jobs."""
-        data = self._read_queue()
-
-        flagged = [
-            {
-                "paper_id": job["paper_id"],
-                "completed_at": job.get("completed_at"),
-            }
-            for job in data["jobs"]
-            if job["status"] == JobStatus.QA_FLAGGED
-        ]
+        with self._locked():
+            flagged = [
+                {
+                    "paper_id": job["paper_id"],
+                    "completed_at": job.get("completed_at"),
+                }
+                for job in self._jobs.values()
+                if job["status"] == JobStatus.QA_FLAGGED
+            ]
 
         return flagged[:limit]
 
     def reset_failed_jobs(self) -> int:
         """Reset all failed jobs back to pending."""
-        data = self._read_queue()
-        reset_count = 0
+        with self._locked():
+            reset = [
+                {
+                    **job,
+                    "status": JobStatus.PENDING,
+                    "worker_id": None,
+                    "started_at": None,
+                    "attempts": 0,  # Reset attempts
+                    "error": None,
+                }
+                for job in self._jobs.values()
+                if job["status"] == JobStatus.FAILED
+            ]
+            self._commit(reset)
+        return len(reset)
 
-        for job in data["jobs"]:
-            if job["status"] == JobStatus.FAILED:
-                job["status"] = JobStatus.PENDING
-                job["worker_id"] = None
-                job["started_at"] = None
-                job["attempts"] = 0  # Reset attempts
-                job["error"] = None
-                reset_count += 1
+    def export_completed_ids(self) -> List[str]:
+        """Export list of completed paper IDs."""
+        with self._locked():
+            return [
+                job["paper_id"]
+                for job in self._jobs.values()
+                if job["status"] == JobStatus.COMPLETED
+            ]
+
+    def snapshot(self) -> Dict:
+        """Compact and return ``{"jobs": [...], "metadata": {...}}`` copies."""
+        with self._locked():
+            self._compact()
+            return {
+                "jobs": [dict(job) for job in self._jobs.values()],
+                "metadata": dict(self._metadata),
+            }
 
-        if reset_count > 0:
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
-            self._write_queue(data)
 
-        return reset_count
+def _truncate_torn_tail(f: BinaryIO, block: int = 4096) -> None:
+    """Cut a binary log file back to just after its last newline."""
+    size = f.seek(0, os.SEEK_END)
+    if not size:
+        return
+    f.seek(size - 1)
+    if f.read(1) == b"\n":
+        return
+    end = size
+    while end > 0:
+        start = max(0, end - block)
+        f.seek(start)
+        chunk = f.read(end - start)
+        pos = chunk.rfind(b"\n")
+        if pos >= 0:
+            f.truncate(start + pos + 1)
+            return
+        end = start
+    f.truncate(0)
+
+
+def shard_of(paper_id: str, num_shards: int) -> int:
+    """Shard index of a paper (stable across processes and Python versions)."""
+    return zlib.crc32(paper_id.encode("utf-8")) % num_shards
+
+
+def owned_shard(worker_id: str, num_shards: int) -> int:
+    """
+    Shard a worker owns.
 
-    def export_completed_ids(self) -> List[str]:
-        """Export list of completed paper IDs."""
-        data = self._read_queue()
-        return [
-            job["paper_id"]
-            for job in data["jobs"]
-            if job["status"] == JobStatus.COMPLETED
+    Worker IDs ending in ``shard-K`` (e.g. ``gh-123-1-shard-3``) own shard
+    ``K``; any other ID is hashed.
+    """
+    match = re.search(r"shard-(\d+)$", worker_id)
+    if match:
+        return int(match.group(1)) % num_shards
+    return shard_of(worker_id, num_shards)
+
+
+class ShardedCloudQueue:
+    """
+    Cloud job queue split into hash-partitioned shard files.
+
+    Each paper lives in exactly one shard, so runners that own different
+    shards never contend on a lock or touch the same file, and merging the
+    shards back into ``cloud_jobs.json`` cannot conflict. A runner claims
+    from its own shard only. Runners that share the shard files (one
+    checkout) can opt in to stealing from the others, in round-robin order
+    starting after their own, once it runs dry; runners in separate
+    checkouts must not, since each would claim the same stolen jobs and
+    their commits would conflict.
+    """
+
+    def __init__(
+        self,
+        num_shards: int,
+        queue_dir: str = SHARD_DIR,
+        compact_every: int = COMPACT_EVERY,
+    ):
+        """
+        Args:
+            num_shards: Number of shard files
+            queue_dir: Directory holding the shard files
+            compact_every: Passed to each shard's :class:`CloudJobQueue`
+        """
+        if num_shards < 1:
+            raise ValueError("num_shards must be >= 1")
+        self.num_shards = num_shards
+        self.queue_dir = Path(queue_dir)
+        self.shards = [
+            CloudJobQueue(
+                str(self.queue_dir / f"shard-{i:03d}-of-{num_shards:03d}.json"),
+                compact_every=compact_every,
+            )
+            for i in range(num_shards)
         ]
 
+    def shard_for(self, paper_id: str) -> CloudJobQueue:
+        return self.shards[shard_of(paper_id, self.num_shards)]
+
+    def add_jobs(
+        self,
+        paper_ids: List[str],
+        force: bool = False,
+        estimates: Optional[Dict[str, Dict]] = None,
+        lane: str = LANE_BACKFILL,
+    ) -> int:
+        """Add jobs, routing each paper to its shard."""
+        groups: Dict[int, List[str]] = {}
+        for paper_id in paper_ids:
+            groups.setdefault(shard_of(paper_id, self.num_shards), []).append(paper_id)
+        return sum(
+            self.shards[i].add_jobs(ids, force=force, estimates=estimates, lane=lane)
+            for i, ids in groups.items()
+        )
+
+    def set_estimates(self, estimates: Dict[str, Dict]) -> int:
+        """Store cost estimates, routing each paper to its shard."""
+        groups: Dict[int, Dict[str, Dict]] = {}
+        for paper_id, est in estimates.items():
+            groups.setdefault(shard_of(paper_id, self.num_shards), {})[paper_id] = est
+        return sum(self.shards[i].set_estimates(ests) for i, ests in groups.items())
+
+    def claim_batch(
+        self,
+        worker_id: str,
+        batch_size: int = 100,
+        max_attempts: int = 3,
+        shard: Optional[int] = None,
+        policy: str = "fifo",
+        work_budget: Optional[float] = None,
+        steal: bool = False,
+    ) -> List[Dict]:
+        """
+        Claim from the worker's own shard, then optionally steal from the others.
+
+        ``policy`` and the lane mix apply within each shard; ``work_budget``
+        applies to the whole batch.
+
+        Args:
+            worker_id: Worker identifier
+            batch_size: Number of jobs to claim
+            max_attempts: Skip jobs that have failed this many times
+            shard: Own shard index (default: derived from ``worker_id``)
+            policy: Claim order, see :meth:`CloudJobQueue.claim_batch`
+            work_budget: Cap on the batch's estimated seconds
+            steal: Fill the batch from other shards once the own shard is
+                dry (only when all runners share the shard files)
+
+        Returns:
+            List of claimed job dictionaries
+        """
+        own = owned_shard(worker_id, self.num_shards) if shard is None else shard
+        claimed: List[Dict] = []
+        work = 0.0
+        for k in range(self.num_shards if steal else 1):
+            need = batch_size - len(claimed)
+            if need <= 0:
+                break
+            budget = None
+            if work_budget is not None:
+                if claimed and work >= work_budget:
+                    break
+                budget = max(work_budget - work, 0.0)
+            got = self.shards[(own + k) % self.num_shards].claim_batch(
+                worker_id,
+                batch_size=need,
+                max_attempts=max_attempts,
+                policy=policy,
+                work_budget=budget,
+            )
+            claimed.extend(got)
+            work += sum(job_cost(job) for job in got)
+        return claimed
+
+    def complete_job(
+        self, paper_id: str, qa_passed: bool = True, model: Optional[str] = None
+    ) -> None:
+        self.shard_for(paper_id).complete_job(paper_id, qa_passed=qa_passed, model=model)
+
+    def fail_job(self, paper_id: str, error: str, max_attempts: int = 3) -> None:
+        self.shard_for(paper_id).fail_job(paper_id, error, max_attempts=max_attempts)
+
+    def get_job(self, paper_id: str) -> Optional[Dict]:
+        return self.shard_for(paper_id).get_job(paper_id)
+
+    def get_pending_ids(self) -> List[str]:
+        return [pid for s in self.shards for pid in s.get_pending_ids()]
+
+    def requeue_flagged(self, paper_ids: Optional[Iterable[str]] = None) -> int:
+        if paper_ids is None:
+            return sum(s.requeue_flagged() for s in self.shards)
+        groups: Dict[int, List[str]] = {}
+        for paper_id in paper_ids:
+            groups.setdefault(shard_of(paper_id, self.num_shards), []).append(paper_id)
+        return sum(self.shards[i].requeue_flagged(ids) for i, ids in groups.items())
+
+    def get_lane_stats(self) -> Dict[str, Dict]:
+        """Pending jobs per lane summed over all shards."""
+        out = {lane: {"pending": 0, "oldest": None} for lane in LANES}
+        for shard in self.shards:
+            for lane, st in shard.get_lane_stats().items():
+                out[lane]["pending"] += st["pending"]
+                if st["oldest"] and (out[lane]["oldest"] is None or st["oldest"] < out[lane]["oldest"]):
+                    out[lane]["oldest"] = st["oldest"]
+        return out
+
+    def get_stats(self) -> Dict[str, int]:
+        """Job statistics summed over all shards."""
+        total: Counter = Counter()
+        for shard in self.shards:
+            total.update(shard.get_stats())
+        return dict(total)
+
+    def get_throughput(self, window: Optional[float] = None) -> Dict:
+        """Throughput and ETA over all shards."""
+        window = window_seconds() if window is None else window
+        stats = self.get_stats()
+        return summarize(
+            [e for s in self.shards for e in s.recent_completions(window)],
+            remaining=stats["pending"] + stats["in_progress"],
+            window=window,
+        )
+
+    def reset_stuck_jobs(self, timeout_minutes: int = 60) -> int:
+        return sum(s.reset_stuck_jobs(timeout_minutes) for s in self.shards)
+
+    def get_failed_jobs(self, limit: int = 100) -> List[Dict]:
+        return [j for s in self.shards for j in s.get_failed_jobs(limit)][:limit]
+
+    def get_qa_flagged_jobs(self, limit: int = 100) -> List[Dict]:
+        return [j for s in self.shards for j in s.get_qa_flagged_jobs(limit)][:limit]
+
+    def reset_failed_jobs(self) -> int:
+        return sum(s.reset_failed_jobs() for s in self.shards)
+
+    def export_completed_ids(self) -> List[str]:
+        return [pid for s in self.shards for pid in s.export_completed_ids()]
+
+    def compact(self) -> None:
+        for shard in self.shards:
+            shard.compact()
+
+    def merge(self, queue_file: str = "data/cloud_jobs.json") -> int:
+        """
+        Write every shard's jobs into one snapshot file.
+
+        Returns:
+            Number of jobs written
+        """
+        jobs: List[Dict] = []
+        created = []
+        for shard in self.shards:
+            snap = shard.snapshot()
+            jobs.extend(snap["jobs"])
+            if snap["metadata"].get("created_at"):
+                created.append(snap["metadata"]["created_at"])
+        jobs.sort(key=lambda j: (j.get("created_at") or "", j["paper_id"]))
+        metadata = {
+            "created_at": min(created) if created else datetime.now().isoformat(),
+            "last_updated": datetime.now().isoformat(),
+            "merged_from_shards": self.num_shards,
+        }
+        path = Path(queue_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_snapshot_file(path, jobs, metadata)
+        # Drop any log left next to the target so readers see exactly the merge
+        log_file = path.with_name(path.stem + ".log.jsonl")
+        if log_file.exists():
+            log_file.unlink()
+        return len(jobs)
+
+    @classmethod
+    def split(
+        cls, source: CloudJobQueue, num_shards: int, queue_dir: str = SHARD_DIR
+    ) -> "ShardedCloudQueue":
+        """Create shard files holding the jobs of a single-file queue."""
+        sharded = cls(num_shards, queue_dir)
+        groups: Dict[int, List[Dict]] = {}
+        for job in source.snapshot()["jobs"]:
+            groups.setdefault(shard_of(job["paper_id"], num_shards), []).append(job)
+        for i, jobs in groups.items():
+            shard = sharded.shards[i]
+            with shard._locked():
+                shard._commit(jobs)
+                shard._compact()
+        return sharded
+
+
+def open_cloud_queue(num_shards: int = 1, queue_dir: str = SHARD_DIR):
+    """The single-file queue, or a sharded view when ``num_shards > 1``."""
+    if num_shards > 1:
+        return ShardedCloudQueue(num_shards, queue_dir)
+    return cloud_queue
+
 
 # Global instance
 cloud_queue = CloudJobQueue()
@@ -309,11 +1009,33 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Cloud job queue management")
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Operate on N shard files under data/cloud_jobs/ (default: single file)",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Stats command
     subparsers.add_parser("stats", help="Show queue statistics")
 
+    # Add command
+    add_parser = subparsers.add_parser("add", help="Add paper IDs to the queue")
+    add_parser.add_argument("paper_ids", nargs="*", help="Paper IDs")
+    add_parser.add_argument(
+        "--file", help="File with one paper ID per line (or a records JSON list)"
+    )
+    add_parser.add_argument(
+        "--lane",
+        choices=[LANE_FRESH, LANE_BACKFILL],
+        default=LANE_BACKFILL,
+        help="Priority lane (default: backfill)",
+    )
+    add_parser.add_argument(
+        "--force", action="store_true", help="Reset papers that are already queued"
+    )
+
     # Reset command
     reset_parser = subparsers.add_parser("reset-stuck", help="Reset stuck jobs")
     reset_parser.add_argument(
@@ -329,37 +1051,117 @@ def main():
     # QA flagged command
     subparsers.add_parser("qa-flagged", help="Show QA-flagged jobs")
 
+    # Rework command
+    rework_parser = subparsers.add_parser(
+        "rework", help="Requeue QA-flagged jobs in the rework lane"
+    )
+    rework_parser.add_argument(
+        "paper_ids", nargs="*", help="Paper IDs (default: all QA-flagged jobs)"
+    )
+
+    # Compact command
+    subparsers.add_parser(
+        "compact", help="Fold the event log into data/cloud_jobs.json"
+    )
+
+    # Estimate command
+    subparsers.add_parser(
+        "estimate",
+        help="Refresh cost estimates of pending jobs from records, PDFs and extraction reports",
+    )
+
+    # Shard commands
+    subparsers.add_parser(
+        "split", help="Partition data/cloud_jobs.json into --shards shard files"
+    )
+    subparsers.add_parser(
+        "merge", help="Merge --shards shard files back into data/cloud_jobs.json"
+    )
+
     args = parser.parse_args()
+    queue = open_cloud_queue(args.shards)
 
     if args.command == "stats":
-        stats = cloud_queue.get_stats()
+        stats = queue.get_stats()
         print("\n" + "=" * 60)
         print("CLOUD JOB QUEUE STATS")
         print("=" * 60)
         for key, value in stats.items():
             print(f"{key:15} {value:,}")
+        rate = queue.get_throughput()
+        print(f"{'jobs/hour':15} {rate['jobs_per_hour']:,.1f} (last {rate['window'] / 60:.0f} min)")
+        print(f"{'eta':15} {format_eta(rate['eta_seconds'])}")
+        for model, m in rate["by_model"].items():
+            print(f"  {model}: {m['jobs_per_hour']:,.1f}/h")
+        print("pending by lane:")
+        for lane, st in queue.get_lane_stats().items():
+            oldest = f" (oldest {st['oldest'][:16]})" if st["oldest"] else ""
+            print(f"  {lane:13} {st['pending']:,}{oldest}")
         print("=" * 60 + "\n")
 
+    elif args.command == "add":
+        paper_ids = list(args.paper_ids)
+        if args.file:
+            with open(args.file, encoding="utf-8") as f:
+                text = f.read()
+            if text.lstrip().startswith("["):
+                paper_ids += [r["id"] for r in json.loads(text) if r.get("id")]
+            else:
+                paper_ids += [line.strip() for line in text.splitlines() if line.strip()]
+        if not paper_ids:
+            parser.error("add needs paper IDs or --file")
+        count = queue.add_jobs(paper_ids, force=args.force, lane=args.lane)
+        print(f"Added {count} jobs to the {args.lane} lane")
+
     elif args.command == "reset-stuck":
-        count = cloud_queue.reset_stuck_jobs(timeout_minutes=args.timeout)
+        count = queue.reset_stuck_jobs(timeout_minutes=args.timeout)
         print(f"Reset {count} stuck jobs")
 
     elif args.command == "failed":
-        failed = cloud_queue.get_failed_jobs()
+        failed = queue.get_failed_jobs()
         print(f"\nFailed jobs ({len(failed)}):")
         for job in failed[:20]:
             print(f"  {job['paper_id']}: {job['error'][:60]}...")
 
     elif args.command == "retry":
-        count = cloud_queue.reset_failed_jobs()
+        count = queue.reset_failed_jobs()
         print(f"Reset {count} failed jobs to pending")
 
     elif args.command == "qa-flagged":
-        flagged = cloud_queue.get_qa_flagged_jobs()
+        flagged = queue.get_qa_flagged_jobs()
         print(f"\nQA-flagged jobs ({len(flagged)}):")
         for job in flagged[:20]:
             print(f"  {job['paper_id']}")
 
+    elif args.command == "rework":
+        count = queue.requeue_flagged(args.paper_ids or None)
+        print(f"Requeued {count} QA-flagged jobs for rework")
+
+    elif args.command == "compact":
+        queue.compact()
+        print("Compacted queue")
+
+    elif args.command == "estimate":
+        from .job_estimates import estimate_papers
+
+        estimates = estimate_papers(queue.get_pending_ids())
+        changed = queue.set_estimates(estimates)
+        hours = sum(e["est_seconds"] for e in estimates.values()) / 3600
+        by_basis = Counter(e["est_basis"] for e in estimates.values())
+        print(f"Estimated {len(estimates)} pending jobs ({changed} changed): {hours:,.1f} h of work")
+        for basis, count in by_basis.most_common():
+            print(f"  {basis:12} {count:,}")
+
+    elif args.command in ("split", "merge"):
+        if args.shards < 2:
+            parser.error(f"{args.command} needs --shards N (N >= 2)")
+        if args.command == "split":
+            ShardedCloudQueue.split(cloud_queue, args.shards)
+            print(f"Split {cloud_queue.queue_file} into {args.shards} shards under {SHARD_DIR}")
+        else:
+            count = queue.merge(str(cloud_queue.queue_file))
+            print(f"Merged {count} jobs from {args.shards} shards into {cloud_queue.queue_file}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,273 @@
+"""
+Shared BrightData fetch engine for the ChinaXiv scrapers.
+
+All scrapers post to the BrightData Web Unlocker API. This engine owns the
+pooled HTTP session and runs requests on a thread pool:
+- configurable concurrency (pool size = connection pool size)
+- a rate budget per BrightData zone, shared by every engine in the process
+- exponential backoff with jitter on 429/5xx/timeouts
+- per-request metrics (status, attempts, latency)
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+from .logging_utils import log
+
+
+BRIGHTDATA_API_URL = "https://api.brightdata.com/request"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MIN_PAGE_BYTES = 1000
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one BrightData request (after retries)."""
+
+    url: str
+    html: Optional[str]
+    status: str  # ok | missing | error
+    http_status: Optional[int] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+
+
+class ZoneBudget:
+    """Spaces request starts for one BrightData zone across threads."""
+
+    _registry: Dict[str, "ZoneBudget"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, rate_per_sec: float):
+        self.min_interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    @classmethod
+    def for_zone(cls, zone: str, rate_per_sec: float) -> "ZoneBudget":
+        """Return the shared budget for a zone, keeping the strictest rate."""
+        with cls._registry_lock:
+            budget = cls._registry.get(zone)
+            if budget is None:
+                budget = cls(rate_per_sec)
+                cls._registry[zone] = budget
+            elif rate_per_sec > 0:
+                budget.min_interval = max(budget.min_interval, 1.0 / rate_per_sec)
+        return budget
+
+    def wait(self) -> None:
+        """Reserve the next start slot and sleep until it."""
+        if not self.min_interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class BrightDataEngine:
+    """Pooled, concurrent BrightData client shared by the scrapers."""
+
+    def __init__(
+        self,
+        api_key: str,
+        zone: str,
+        *,
+        concurrency: int = 8,
+        rate_per_sec: float = 2.0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        timeout: float = 60,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            api_key: BrightData API key
+            zone: BrightData zone name
+            concurrency: Requests in flight at once
+            rate_per_sec: Request budget for the zone (0 = unlimited)
+            max_retries: Retries after the first attempt for retryable failures
+            backoff_base: First backoff delay in seconds
+            backoff_max: Backoff ceiling in seconds
+            timeout: Per-request timeout in seconds
+            session: Optional session to use instead of a pooled one
+        """
+        self.api_key = api_key
+        self.zone = zone
+        self.concurrency = max(1, int(concurrency))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.budget = ZoneBudget.for_zone(zone, rate_per_sec)
+        self.session = session or self._make_session()
+
+        self._metrics_lock = threading.Lock()
+        self.counters: Counter = Counter()
+        self.recent: Deque[FetchResult] = deque(maxlen=1000)
+
+    @classmethod
+    def from_config(
+        cls,
+        api_key: str,
+        zone: str,
+        config: Optional[Dict[str, Any]] = None,
+        **overrides: Any,
+    ) -> "BrightDataEngine":
+        """Build an engine from the ``brightdata`` section of config.yaml."""
+        cfg = (config if config is not None else get_config()).get("brightdata") or {}
+        zone_rates = cfg.get("zone_rates") or {}
+        kwargs: Dict[str, Any] = {
+            "concurrency": cfg.get("concurrency", 8),
+            "rate_per_sec": float(zone_rates.get(zone, cfg.get("rate_per_sec", 2.0))),
+            "max_retries": cfg.get("max_retries", 3),
+            "backoff_base": float(cfg.get("backoff_base", 1.0)),
+            "backoff_max": float(cfg.get("backoff_max", 30.0)),
+            "timeout": cfg.get("timeout", 60),
+        }
+        kwargs.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(api_key, zone, **kwargs)
+
+    def _make_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+        return session
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        cap = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, cap)
+
+    def _record(self, result: FetchResult) -> None:
+        with self._metrics_lock:
+            self.counters["requests"] += 1
+            self.counters[result.status] += 1
+            self.counters["attempts"] += result.attempts
+            self.counters["retries"] += max(0, result.attempts - 1)
+            self.recent.append(result)
+
+    def fetch(self, url: str) -> FetchResult:
+        """
+        Fetch a page through BrightData, retrying transient failures.
+
+        Returns:
+            FetchResult with ``status`` ok (html set), missing (ChinaXiv error
+            page or too short) or error (non-retryable or retries exhausted)
+        """
+        payload = {"zone": self.zone, "url": url, "format": "raw"}
+        started = time.monotonic()
+        http_status: Optional[int] = None
+        status = "error"
+        html: Optional[str] = None
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.budget.wait()
+            retryable = False
+            try:
+                resp = self.session.post(
+                    BRIGHTDATA_API_URL, json=payload, timeout=self.timeout
+                )
+                http_status = resp.status_code
+                if resp.status_code == 200:
+                    text = resp.text
+                    if "<ErrorResponseData>" in text or len(text) < MIN_PAGE_BYTES:
+                        status = "missing"
+                    else:
+                        status, html = "ok", text
+                    break
+                retryable = resp.status_code in RETRY_STATUSES
+                if not retryable:
+                    log(f"BrightData error {resp.status_code} for {url}: {resp.text[:200]}")
+            except requests.RequestException as e:
+                retryable = True
+                log(f"Fetch exception for {url}: {e} (attempt {attempt})")
+
+            if not retryable or attempt > self.max_retries:
+                break
+            time.sleep(self._backoff(attempt - 1))
+
+        result = FetchResult(
+            url=url,
+            html=html,
+            status=status,
+            http_status=http_status,
+            attempts=attempt,
+            elapsed=time.monotonic() - started,
+        )
+        self._record(result)
+        return result
+
+    def fetch_many(self, urls: Iterable[str]) -> Iterator[Tuple[str, FetchResult]]:
+        """
+        Fetch URLs concurrently, yielding ``(url, result)`` in input order.
+
+        At most ``concurrency`` requests run ahead of the consumer.
+        """
+        pending: Deque[Tuple[str, Any]] = deque()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as ex:
+            try:
+                for url in urls:
+                    pending.append((url, ex.submit(self.fetch, url)))
+                    if len(pending) >= self.concurrency:
+                        done_url, fut = pending.popleft()
+                        yield done_url, fut.result()
+                while pending:
+                    done_url, fut = pending.popleft()
+                    yield done_url, fut.result()
+            finally:
+                for _, fut in pending:
+                    fut.cancel()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Aggregate counters plus latency over recent requests."""
+        with self._metrics_lock:
+            summary: Dict[str, Any] = dict(self.counters)
+            latencies: List[float] = sorted(r.elapsed for r in self.recent)
+        if latencies:
+            summary["latency_avg"] = sum(latencies) / len(latencies)
+            summary["latency_p95"] = latencies[int(0.95 * (len(latencies) - 1))]
+        return summary
+
+
+def rate_limit_to_rate(rate_limit: Optional[float]) -> Optional[float]:
+    """Convert the scrapers' "seconds between requests" into requests/sec."""
+    if rate_limit is None:
+        return None
+    return 1.0 / rate_limit if rate_limit > 0 else 0.0
+
+
+def format_metrics(metrics: Dict[str, Any]) -> str:
+    """One-line summary of :meth:`BrightDataEngine.metrics` for logs."""
+    parts = [
+        f"{k}={metrics.get(k, 0)}"
+        for k in ("requests", "ok", "missing", "error", "retries")
+    ]
+    if "latency_avg" in metrics:
+        parts.append(f"avg={metrics['latency_avg']:.2f}s")
+        parts.append(f"p95={metrics['latency_p95']:.2f}s")
+    return " ".join(parts)
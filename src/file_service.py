@@ -7,7 +7,7 @@ from __future__ import annotations
 import json
 import os
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 def ensure_dir(path: str) -> None:
@@ -71,7 +71,9 @@ def write_text(path: str, content: str) -> None:
         f.write(content)
 
 
-def save_raw_xml(content: str, day: str, part: int) -> str:
+def save_raw_xml(
+    content: str, day: str, part: int, set_spec: Optional[str] = None
+) -> str:
     """
     Save raw XML content to file.
 
@@ -79,11 +81,15 @@ def save_raw_xml(content: str, day: str, part: int) -> str:
         content: XML content
         day: Day string (YYYY-MM-DD)
         part: Part number
+        set_spec: OAI set, so concurrently harvested sets do not collide
 
     Returns:
         Path to saved file
     """
-    path = os.path.join("data", "raw_xml", day, f"part_{part}.xml")
+    parts = ["data", "raw_xml", day]
+    if set_spec:
+        parts.append(set_spec.replace(":", "_").replace("/", "_"))
+    path = os.path.join(*parts, f"part_{part}.xml")
     write_text(path, content)
     return path
 
@@ -0,0 +1,108 @@
+"""
+Append-only JSONL checkpoints for the ChinaXiv scrapers.
+
+Each scraped paper is appended as one line ``{"n": <id number>, "paper": {...}}``
+so checkpoint cost is constant per paper instead of rewriting everything
+scraped so far. Writes are flushed every line and fsynced in batches;
+resume replays the file in one streaming pass and tolerates a torn final
+line. Once ``save_results`` has written the month's records file the log is
+redundant and is removed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Iterator, Optional
+
+from .file_service import read_json
+from .logging_utils import log
+
+
+FSYNC_EVERY = 32
+
+
+class CheckpointLog:
+    """Appender for one month's checkpoint log."""
+
+    def __init__(self, path: str, *, reset: bool = False, fsync_every: int = FSYNC_EVERY):
+        """
+        Open a checkpoint log for appending.
+
+        Args:
+            path: JSONL file path
+            reset: Truncate any existing log (fresh, non-resumed run)
+            fsync_every: fsync after this many appended lines
+        """
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fh = open(path, "w" if reset else "a", encoding="utf-8")
+        self._pending = 0
+
+    def append(self, num: int, paper: Dict[str, Any]) -> None:
+        """Record a scraped paper."""
+        self._fh.write(json.dumps({"n": num, "paper": paper}, ensure_ascii=False) + "\n")
+        self._fh.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Force appended lines to disk."""
+        if self._pending:
+            os.fsync(self._fh.fileno())
+            self._pending = 0
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self.sync()
+            self._fh.close()
+
+    def __enter__(self) -> "CheckpointLog":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def replay(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield checkpoint entries in append order, skipping a torn final line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                log(f"Ignoring torn checkpoint line in {path}")
+
+
+def load_checkpoint(path: str, legacy_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild the resume state from a checkpoint log.
+
+    Args:
+        path: JSONL checkpoint log
+        legacy_path: Older full-rewrite JSON checkpoint, read if no log exists
+
+    Returns:
+        ``{"papers": [...], "last_id_num": n}`` or None if nothing is stored
+    """
+    if not os.path.exists(path):
+        if legacy_path and os.path.exists(legacy_path):
+            return read_json(legacy_path)
+        return None
+    papers: Dict[str, Dict[str, Any]] = {}
+    last = 0
+    for entry in replay(path):
+        paper = entry.get("paper")
+        if paper:
+            papers[paper["id"]] = paper
+        last = max(last, int(entry.get("n", 0)))
+    return {"papers": list(papers.values()), "last_id_num": last}
+
+
+def discard_checkpoint(path: str, legacy_path: Optional[str] = None) -> None:
+    """Remove a month's checkpoint once its records file has been written."""
+    for p in (path, legacy_path):
+        if p and os.path.exists(p):
+            os.remove(p)
@@ -9,36 +9,55 @@ Outputs normalized JSON for integration with the translation pipeline.
 
 import argparse
 import os
-import re
-import time
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
-from .utils import log, read_json, write_json
+from .chinaxiv_parse import parse_abstract_page
+from .fetch_engine import (
+    BrightDataEngine,
+    FetchResult,
+    format_metrics,
+    rate_limit_to_rate,
+)
+from .harvest_checkpoint import CheckpointLog, discard_checkpoint, load_checkpoint
+from .raw_archive import archive_page
+from .utils import log, write_json
 
 
 class ChinaXivScraper:
     """Scraper for ChinaXiv papers using BrightData Web Unlocker."""
 
-    def __init__(self, api_key: str, zone: str, rate_limit: float = 0.5):
+    def __init__(
+        self,
+        api_key: str,
+        zone: str,
+        rate_limit: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        engine: Optional[BrightDataEngine] = None,
+    ):
         """
         Initialize scraper.
 
         Args:
             api_key: BrightData API key
             zone: BrightData zone name
-            rate_limit: Seconds between requests (default: 0.5 = 2 req/sec)
+            rate_limit: Seconds between requests for the zone (default: from
+                config.yaml ``brightdata``)
+            concurrency: Requests in flight at once (default: from config)
+            engine: Shared fetch engine (built from config if omitted)
         """
         self.api_key = api_key
         self.zone = zone
         self.rate_limit = rate_limit
         self.base_url = "https://chinaxiv.org/abs"
-        self.api_url = "https://api.brightdata.com/request"
+        self.engine = engine or BrightDataEngine.from_config(
+            api_key,
+            zone,
+            rate_per_sec=rate_limit_to_rate(rate_limit),
+            concurrency=concurrency,
+        )
 
         self.stats = {
             "total_attempts": 0,
@@ -57,44 +76,16 @@ class ChinaXivScraper:
         Returns:
             HTML content if successful, None if 404 or error
         """
-        url = f"{self.base_url}/{paper_id}"
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {"zone": self.zone, "url": url, "format": "raw"}
-
-        try:
-            response = requests.post(
-                self.api_url, headers=headers, json=payload, timeout=60
-            )
+        return self._handle_fetch(self.engine.fetch(f"{self.base_url}/{paper_id}"))
 
-            self.stats["total_attempts"] += 1
-
-            if response.status_code == 200:
-                html = response.text
-
-                # Check for error responses from ChinaXiv
-                if "<ErrorResponseData>" in html or len(html) < 1000:
-                    self.stats["consecutive_404s"] += 1
-                    return None
-
-                self.stats["consecutive_404s"] = 0
-                return html
-
-            else:
-                log(
-                    f"BrightData error {response.status_code} for {paper_id}: {response.text[:200]}"
-                )
-                self.stats["consecutive_404s"] += 1
-                return None
-
-        except Exception as e:
-            log(f"Exception fetching {paper_id}: {e}")
+    def _handle_fetch(self, result: FetchResult) -> Optional[str]:
+        """Update stats from an engine result and return its HTML."""
+        self.stats["total_attempts"] += result.attempts
+        if result.html is None:
             self.stats["consecutive_404s"] += 1
             return None
+        self.stats["consecutive_404s"] = 0
+        return result.html
 
     def parse_paper(self, html: str, paper_id: str) -> Optional[Dict]:
         """
@@ -108,104 +99,13 @@ class ChinaXivScraper:
             Paper metadata dict, or None if parsing fails
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Title
-            title_elem = soup.find("h1")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            if not title or len(title) < 10:
-                log(f"Invalid title for {paper_id}: '{title}'")
-                return None
-
-            # Authors
-            author_links = soup.find_all("a", href=lambda x: x and "field=author" in x)
-            creators = [
-                link.get_text(strip=True)
-                for link in author_links
-                if link.get_text(strip=True)
-            ]
-
-            # Abstract (find text after "摘要:")
-            abstract = ""
-            abstract_marker = soup.find("b", string=re.compile(r"摘要[:：]"))
-            if abstract_marker:
-                # Get parent element and extract text
-                parent = abstract_marker.parent
-                if parent:
-                    full_text = parent.get_text(strip=False)
-                    # Extract text after marker
-                    match = re.search(r"摘要[:：]\s*(.+)", full_text, re.DOTALL)
-                    if match:
-                        abstract = match.group(1).strip()
-
-            # Submission date
-            date_str = ""
-            date_marker = soup.find("b", string=re.compile(r"提交时间[:：]"))
-            if date_marker:
-                parent = date_marker.parent
-                if parent:
-                    text = parent.get_text(strip=True)
-                    match = re.search(r"提交时间[:：]\s*(.+)", text)
-                    if match:
-                        date_str = match.group(1).strip()
-
-            # Try to parse date
-            date_iso = ""
-            if date_str:
-                try:
-                    # Parse format: "2025-03-29 22:43:15"
-                    dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    date_iso = dt.isoformat() + "Z"
-                except:
-                    # Use paper ID to infer date (YYYYMM)
-                    year = paper_id[:4]
-                    month = paper_id[4:6]
-                    date_iso = f"{year}-{month}-01T00:00:00Z"
-
-            # Category/Subjects
-            subjects = []
-            category_marker = soup.find("b", string=re.compile(r"分类[:：]"))
-            if category_marker:
-                parent = category_marker.parent
-                if parent:
-                    category_links = parent.find_all("a")
-                    subjects = [
-                        link.get_text(strip=True)
-                        for link in category_links
-                        if link.get_text(strip=True)
-                    ]
-
-            # PDF URL
-            pdf_url = ""
-            pdf_link = soup.find("a", href=lambda x: x and "filetype=pdf" in x)
-            if pdf_link:
-                href = pdf_link.get("href", "")
-                if href.startswith("/"):
-                    pdf_url = f"https://chinaxiv.org{href}"
-                else:
-                    pdf_url = href
-
-            # Build IA-compatible record
-            record = {
-                "id": f"chinaxiv-{paper_id}",
-                "oai_identifier": paper_id,
-                "title": title,
-                "abstract": abstract,
-                "creators": creators,
-                "subjects": subjects,
-                "date": date_iso or f"{paper_id[:4]}-{paper_id[4:6]}-01T00:00:00Z",
-                "source_url": f"https://chinaxiv.org/abs/{paper_id}",
-                "pdf_url": pdf_url,
-                "license": {"raw": "", "derivatives_allowed": None},
-                "setSpec": None,
-            }
-
-            return record
-
+            record = parse_abstract_page(html, paper_id)
         except Exception as e:
             log(f"Parse error for {paper_id}: {e}")
             return None
+        if record is None:
+            log(f"Invalid title for {paper_id}")
+        return record
 
     def scrape_paper(self, paper_id: str) -> Optional[Dict]:
         """
@@ -217,13 +117,14 @@ class ChinaXivScraper:
         Returns:
             Paper metadata dict, or None if failed
         """
-        # Rate limiting
-        time.sleep(self.rate_limit)
-
         html = self.fetch_page(paper_id)
         if not html:
             return None
+        return self._parse_fetched(html, paper_id)
 
+    def _parse_fetched(self, html: str, paper_id: str) -> Optional[Dict]:
+        """Archive fetched HTML, parse it and update success/failure stats."""
+        archive_page(paper_id, html)
         paper = self.parse_paper(html, paper_id)
         if paper:
             self.stats["successful_scrapes"] += 1
@@ -259,52 +160,51 @@ class ChinaXivScraper:
             log(f"Resuming {year_month} from ID #{start_num:05d}")
 
         log(f"Scraping {year_month} starting at ID #{start_num:05d}")
+        ckpt = CheckpointLog(self._checkpoint_paths(year_month)[0], reset=not checkpoint)
+
+        # Max 99,999 papers per month. The engine fetches ahead concurrently
+        # but yields in ID order, so the consecutive-404 stop still applies.
+        urls = (
+            f"{self.base_url}/{year_month}.{num:05d}"
+            for num in range(start_num, 100000)
+        )
+        fetches = self.engine.fetch_many(urls)
+        try:
+            for url, result in fetches:
+                paper_id = url.rsplit("/", 1)[-1]
+                num = int(paper_id.split(".")[1])
 
-        for num in range(start_num, 100000):  # Max 99,999 papers per month
-            paper_id = f"{year_month}.{num:05d}"
-
-            paper = self.scrape_paper(paper_id)
+                html = self._handle_fetch(result)
+                paper = self._parse_fetched(html, paper_id) if html else None
 
-            if paper:
-                papers.append(paper)
-                log(f"✓ {paper_id}: {paper['title'][:60]}...")
+                if paper:
+                    papers.append(paper)
+                    log(f"✓ {paper_id}: {paper['title'][:60]}...")
 
-                # Save checkpoint every 10 papers
-                if len(papers) % 10 == 0:
-                    self._save_checkpoint(year_month, papers, num)
+                    ckpt.append(num, paper)
 
-            else:
-                # Check if we should stop
-                if self.stats["consecutive_404s"] >= max_consecutive_404s:
-                    log(
-                        f"Stopping {year_month}: {max_consecutive_404s} consecutive 404s"
-                    )
-                    break
+                else:
+                    # Check if we should stop
+                    if self.stats["consecutive_404s"] >= max_consecutive_404s:
+                        log(
+                            f"Stopping {year_month}: {max_consecutive_404s} consecutive 404s"
+                        )
+                        break
+        finally:
+            fetches.close()
+            ckpt.close()
 
         log(f"Finished {year_month}: {len(papers)} papers scraped")
         return papers
 
-    def _save_checkpoint(self, year_month: str, papers: List[Dict], last_id_num: int):
-        """Save checkpoint for resume capability."""
-        checkpoint_dir = Path("data/checkpoints")
-        checkpoint_dir.mkdir(parents=True, exist_ok=True)
-
-        checkpoint = {
-            "year_month": year_month,
-            "last_id_num": last_id_num,
-            "papers": papers,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-
-        checkpoint_path = str(checkpoint_dir / f"chinaxiv_{year_month}.json")
-        write_json(checkpoint_path, checkpoint)
+    def _checkpoint_paths(self, year_month: str) -> Tuple[str, str]:
+        """JSONL checkpoint log and the older full-rewrite JSON checkpoint."""
+        base = Path("data/checkpoints") / f"chinaxiv_{year_month}"
+        return f"{base}.jsonl", f"{base}.json"
 
     def _load_checkpoint(self, year_month: str) -> Optional[Dict]:
-        """Load checkpoint if exists."""
-        checkpoint_path = Path("data/checkpoints") / f"chinaxiv_{year_month}.json"
-        if checkpoint_path.exists():
-            return read_json(checkpoint_path)
-        return None
+        """Load checkpoint if exists (streaming replay of the JSONL log)."""
+        return load_checkpoint(*self._checkpoint_paths(year_month))
 
     def save_results(self, year_month: str, papers: List[Dict]):
         """Save results to IA-compatible JSON."""
@@ -313,6 +213,8 @@ class ChinaXivScraper:
 
         output_path = str(output_dir / f"chinaxiv_{year_month}.json")
         write_json(output_path, papers)
+        # The records file now holds everything the checkpoint log did
+        discard_checkpoint(*self._checkpoint_paths(year_month))
         log(f"Saved {len(papers)} papers to {output_path}")
 
 
@@ -331,8 +233,14 @@ def run_cli():
     parser.add_argument(
         "--rate-limit",
         type=float,
-        default=0.5,
-        help="Seconds between requests (default: 0.5)",
+        default=None,
+        help="Seconds between requests for the zone (default: config brightdata.rate_per_sec)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Requests in flight at once (default: config brightdata.concurrency)",
     )
     parser.add_argument(
         "--reverse",
@@ -375,7 +283,9 @@ def run_cli():
         months.reverse()
 
     # Initialize scraper
-    scraper = ChinaXivScraper(api_key, zone, rate_limit=args.rate_limit)
+    scraper = ChinaXivScraper(
+        api_key, zone, rate_limit=args.rate_limit, concurrency=args.concurrency
+    )
 
     # Scrape each month
     for year_month in months:
@@ -400,6 +310,7 @@ def run_cli():
         log(f"  Total attempts: {scraper.stats['total_attempts']}")
         log(f"  Successful: {scraper.stats['successful_scrapes']}")
         log(f"  Failed: {scraper.stats['failed_scrapes']}")
+        log(f"  Engine: {format_metrics(scraper.engine.metrics())}")
 
         # Reset stats for next month
         scraper.stats = {
@@ -8,109 +8,112 @@ then probes only valid ranges instead of entire 00001-99999 space.
 """
 
 import argparse
+import itertools
+import math
 import os
-import re
-import time
 from collections import defaultdict
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from .chinaxiv_parse import parse_abstract_page
+from .fetch_engine import BrightDataEngine, format_metrics, rate_limit_to_rate
+from .probe_bitmap import ERRORED, FOUND, MISSING, ProbeBitmap, due_from_config
+from .harvest_checkpoint import CheckpointLog, discard_checkpoint, load_checkpoint
+from .raw_archive import archive_page
 from .utils import log, read_json, write_json
 
 
+MAX_IDS_PATH = "data/checkpoints/max_ids.json"
+MAX_SEARCH_ROUNDS = 8
+# Accept an end-of-month boundary once the chance that it is only a run of
+# withdrawn IDs drops below this
+GAP_FALSE_END_PROB = 0.01
+
+
+def load_max_ids(path: str = MAX_IDS_PATH) -> Dict[str, int]:
+    """Load remembered max paper numbers per month."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        return {k: int(v) for k, v in read_json(path).items()}
+    except Exception:
+        return {}
+
+
+def save_max_id(year_month: str, max_id: int, path: str = MAX_IDS_PATH) -> None:
+    """Remember a month's max paper number (never lowers a stored value)."""
+    max_ids = load_max_ids(path)
+    if max_id <= max_ids.get(year_month, 0):
+        return
+    max_ids[year_month] = max_id
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_json(path, dict(sorted(max_ids.items())))
+
+
+def _paper_num(record: Dict) -> int:
+    """Paper number of a record (``202504.00123`` -> 123)."""
+    return int(str(record.get("oai_identifier") or record["id"]).rsplit(".", 1)[-1])
+
+
+def _gap_window(probed: Dict[int, bool], lo: int, k: int) -> int:
+    """
+    Number of consecutive missing IDs needed above ``lo`` to call it the end.
+
+    Uses the hit density of probes at or below ``lo``: with density d, a run
+    of w missing IDs inside the month has probability (1 - d) ** w.
+    """
+    below = [ok for n, ok in probed.items() if n <= lo]
+    density = (sum(below) + 9) / (len(below) + 10)  # prior: 90% of IDs exist
+    density = min(density, 0.999)
+    window = math.ceil(math.log(GAP_FALSE_END_PROB) / math.log(1 - density))
+    return max(3, min(window, k))
+
+
 class OptimizedChinaXivScraper:
     """Cost-optimized scraper with intelligent ID discovery."""
 
-    def __init__(self, api_key: str, zone: str, rate_limit: float = 0.5):
+    def __init__(
+        self,
+        api_key: str,
+        zone: str,
+        rate_limit: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        engine: Optional[BrightDataEngine] = None,
+    ):
         self.api_key = api_key
         self.zone = zone
         self.rate_limit = rate_limit
         self.base_url = "https://chinaxiv.org/abs"
-        self.api_url = "https://api.brightdata.com/request"
+        self.engine = engine or BrightDataEngine.from_config(
+            api_key,
+            zone,
+            rate_per_sec=rate_limit_to_rate(rate_limit),
+            concurrency=concurrency,
+        )
 
         self.stats = {
             "total_attempts": 0,
             "successful_scrapes": 0,
             "failed_scrapes": 0,
-            "binary_search_requests": 0,
+            "max_id_probes": 0,
         }
 
-    def fetch_page(self, url: str, max_retries: int = 3) -> Optional[str]:
+    def fetch_page(self, url: str) -> Optional[str]:
         """
-        Fetch page HTML using BrightData with retry logic.
+        Fetch page HTML using BrightData (retries handled by the engine).
 
         Args:
             url: Full URL to fetch
-            max_retries: Maximum number of retry attempts
 
         Returns:
             HTML content if successful, None otherwise
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {"zone": self.zone, "url": url, "format": "raw"}
-
-        for attempt in range(max_retries + 1):
-            try:
-                time.sleep(self.rate_limit)
-
-                response = requests.post(
-                    self.api_url, headers=headers, json=payload, timeout=60
-                )
-
-                self.stats["total_attempts"] += 1
-
-                if response.status_code == 200:
-                    html = response.text
-
-                    # Check for error responses
-                    if "<ErrorResponseData>" in html or len(html) < 1000:
-                        if attempt < max_retries:
-                            log(f"Error response, retrying {url} (attempt {attempt + 1})")
-                            time.sleep(2 ** attempt)  # Exponential backoff
-                            continue
-                        return None
-
-                    return html
-
-                elif response.status_code in [429, 503, 504]:
-                    # Rate limiting or server errors - retry with backoff
-                    if attempt < max_retries:
-                        backoff_time = 2 ** attempt
-                        log(f"Rate limited, retrying {url} in {backoff_time}s (attempt {attempt + 1})")
-                        time.sleep(backoff_time)
-                        continue
-                    return None
-
-                else:
-                    log(f"HTTP {response.status_code} for {url}")
-                    return None
-
-            except requests.exceptions.Timeout:
-                if attempt < max_retries:
-                    log(f"Timeout, retrying {url} (attempt {attempt + 1})")
-                    time.sleep(2 ** attempt)
-                    continue
-                log(f"Timeout after {max_retries} retries for {url}")
-                return None
-
-            except Exception as e:
-                if attempt < max_retries:
-                    log(f"Fetch exception, retrying {url}: {e} (attempt {attempt + 1})")
-                    time.sleep(2 ** attempt)
-                    continue
-                log(f"Fetch exception after {max_retries} retries for {url}: {e}")
-                return None
-
-        return None
+        result = self.engine.fetch(url)
+        self.stats["total_attempts"] += result.attempts
+        return result.html
 
     def paper_exists(self, paper_id: str) -> bool:
         """
@@ -165,151 +168,122 @@ class OptimizedChinaXivScraper:
 
         return max_ids
 
-    def find_max_id_binary_search(
-        self, year_month: str, estimated_max: int = 500
-    ) -> int:
+    def probe_ids(self, year_month: str, nums: List[int]) -> Dict[int, bool]:
         """
-        Use binary search to find the highest paper ID for a month.
+        Probe several paper numbers concurrently.
 
         Args:
-            year_month: Month to search (e.g., "202504")
-            estimated_max: Starting upper bound (default: 500 based on typical month size)
+            year_month: Month to probe (e.g., "202504")
+            nums: Paper numbers to check
 
         Returns:
-            Highest paper number found (e.g., 412 for 202504.00412)
+            Dict mapping number to True (exists) / False (missing). Numbers
+            whose fetch errored are left out so they are not mistaken for gaps.
         """
-        log(f"Binary searching for max ID in {year_month}...")
-
-        low, high = 1, estimated_max
-        max_found = 0
-
-        self.stats["binary_search_requests"] = 0
-
-        while low <= high:
-            mid = (low + high) // 2
-            paper_id = f"{year_month}.{mid:05d}"
+        urls = [f"{self.base_url}/{year_month}.{n:05d}" for n in nums]
+        out: Dict[int, bool] = {}
+        for url, result in self.engine.fetch_many(urls):
+            self.stats["total_attempts"] += result.attempts
+            self.stats["max_id_probes"] += 1
+            if result.status != "error":
+                out[int(url.rsplit(".", 1)[-1])] = result.html is not None
+        return out
+
+    def find_max_id(
+        self,
+        year_month: str,
+        estimated_max: int = 500,
+        fanout: Optional[int] = None,
+        max_rounds: int = MAX_SEARCH_ROUNDS,
+    ) -> int:
+        """
+        Find the highest paper ID for a month with a galloping k-ary search.
 
-            if self.paper_exists(paper_id):
-                max_found = mid
-                low = mid + 1  # Try higher
-                log(f"  ✓ {paper_id} exists, searching higher (range: {low}-{high})")
-            else:
-                high = mid - 1  # Try lower
-                log(f"  ✗ {paper_id} missing, searching lower (range: {low}-{high})")
+        Each round probes ``fanout`` candidates in parallel. While no missing
+        ID has been seen above the best hit, candidates gallop upwards;
+        afterwards they split the remaining interval evenly. Once the
+        interval is small, every ID in it is probed together with a gap
+        window sized from the observed hit density, so a few withdrawn IDs
+        are not mistaken for the end of the month. Results are remembered
+        in ``MAX_IDS_PATH`` and the next run starts from the known maximum.
 
-            self.stats["binary_search_requests"] += 1
+        Args:
+            year_month: Month to search (e.g., "202504")
+            estimated_max: Expected month size, used for the first stride
+            fanout: Probes per round (default: engine concurrency)
+            max_rounds: Safety limit on rounds
 
-            # Safety limit
-            if self.stats["binary_search_requests"] > 20:
-                log("  Stopping binary search after 20 requests")
+        Returns:
+            Highest paper number found (e.g., 412 for 202504.00412)
+        """
+        k = max(2, fanout or self.engine.concurrency)
+        known = load_max_ids().get(year_month, 0)
+        log(f"Searching for max ID in {year_month} (known: {known}, fanout: {k})...")
+
+        lo = known  # highest number known to exist (0 = none yet)
+        hi: Optional[int] = None  # lowest missing number above lo
+        probed: Dict[int, bool] = {}
+        # A known max only needs to gallop over new IDs; otherwise spread the
+        # first round over the estimated month size
+        step = 2 if known else max(1, estimated_max // k)
+        self.stats["max_id_probes"] = 0
+        rounds = 0
+
+        while rounds < max_rounds:
+            gap = _gap_window(probed, lo, k)
+            if all(probed.get(n) is False for n in range(lo + 1, lo + gap + 1)):
                 break
 
-        # If we maxed out, try doubling and searching again
-        if max_found == estimated_max:
-            log(f"  Hit estimated max, expanding search to {estimated_max * 2}...")
-            return self.find_max_id_binary_search(year_month, estimated_max * 2)
-
+            if hi is None:
+                candidates = [lo + step * i for i in range(1, k + 1)]
+            elif hi - lo > k:
+                span = hi - lo
+                candidates = [lo + span * i // (k + 1) for i in range(1, k + 1)]
+            else:
+                # Small interval: probe the next k unprobed IDs above lo, which
+                # covers the interval plus at least the gap window
+                candidates = list(
+                    itertools.islice(
+                        (n for n in itertools.count(lo + 1) if n not in probed), k
+                    )
+                )
+            candidates = sorted({c for c in candidates if c > lo and c not in probed})
+
+            rounds += 1
+            probed.update(self.probe_ids(year_month, candidates))
+            hits = [n for n in candidates if probed.get(n)]
+            prev_lo = lo
+            if hits:
+                lo = max(lo, max(hits))
+            above = [n for n, ok in probed.items() if n > lo and ok is False]
+            if above:
+                hi = min(above)
+            else:
+                hi = None
+                # Keep galloping: widen the stride only when the whole round hit
+                step = step * k if lo >= max(candidates) else max(1, gap)
+            log(
+                f"  Round {rounds}: probed {len(candidates)}, best {lo:05d}"
+                + (f", first missing above {hi:05d}" if hi else "")
+                + (" (new hits)" if lo > prev_lo else "")
+            )
+
+        if lo:
+            save_max_id(year_month, lo)
         log(
-            f"  Found max ID: {year_month}.{max_found:05d} (took {self.stats['binary_search_requests']} requests)"
+            f"  Found max ID: {year_month}.{lo:05d} "
+            f"({rounds} rounds, {self.stats['max_id_probes']} requests)"
         )
-        return max_found
+        return lo
 
     def parse_paper(self, html: str, paper_id: str) -> Optional[Dict]:
         """Parse paper metadata from HTML."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Title
-            title_elem = soup.find("h1")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            if not title or len(title) < 10:
-                return None
-
-            # Authors
-            author_links = soup.find_all("a", href=lambda x: x and "field=author" in x)
-            creators = [
-                link.get_text(strip=True)
-                for link in author_links
-                if link.get_text(strip=True)
-            ]
-
-            # Abstract
-            abstract = ""
-            abstract_marker = soup.find("b", string=re.compile(r"摘要[:：]"))
-            if abstract_marker:
-                parent = abstract_marker.parent
-                if parent:
-                    full_text = parent.get_text(strip=False)
-                    match = re.search(r"摘要[:：]\s*(.+)", full_text, re.DOTALL)
-                    if match:
-                        abstract = match.group(1).strip()
-
-            # Submission date
-            date_str = ""
-            date_marker = soup.find("b", string=re.compile(r"提交时间[:：]"))
-            if date_marker:
-                parent = date_marker.parent
-                if parent:
-                    text = parent.get_text(strip=True)
-                    match = re.search(r"提交时间[:：]\s*(.+)", text)
-                    if match:
-                        date_str = match.group(1).strip()
-
-            # Parse date
-            date_iso = ""
-            if date_str:
-                try:
-                    dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    date_iso = dt.isoformat() + "Z"
-                except:
-                    year = paper_id[:4]
-                    month = paper_id[4:6]
-                    date_iso = f"{year}-{month}-01T00:00:00Z"
-
-            # Category/Subjects
-            subjects = []
-            category_marker = soup.find("b", string=re.compile(r"分类[:：]"))
-            if category_marker:
-                parent = category_marker.parent
-                if parent:
-                    category_links = parent.find_all("a")
-                    subjects = [
-                        link.get_text(strip=True)
-                        for link in category_links
-                        if link.get_text(strip=True)
-                    ]
-
-            # PDF URL
-            pdf_url = ""
-            pdf_link = soup.find("a", href=lambda x: x and "filetype=pdf" in x)
-            if pdf_link:
-                href = pdf_link.get("href", "")
-                if href.startswith("/"):
-                    pdf_url = f"https://chinaxiv.org{href}"
-                else:
-                    pdf_url = href
-
-            # Build IA-compatible record
-            record = {
-                "id": f"chinaxiv-{paper_id}",
-                "oai_identifier": paper_id,
-                "title": title,
-                "abstract": abstract,
-                "creators": creators,
-                "subjects": subjects,
-                "date": date_iso or f"{paper_id[:4]}-{paper_id[4:6]}-01T00:00:00Z",
-                "source_url": f"https://chinaxiv.org/abs/{paper_id}",
-                "pdf_url": pdf_url,
-                "license": {"raw": "", "derivatives_allowed": None},
-                "setSpec": None,
-            }
-
-            return record
-
+            record = parse_abstract_page(html, paper_id)
         except Exception as e:
             log(f"Parse error for {paper_id}: {e}")
             return None
+        return record
 
     def scrape_paper(self, paper_id: str) -> Optional[Dict]:
         """Fetch and parse a single paper."""
@@ -318,7 +292,11 @@ class OptimizedChinaXivScraper:
 
         if not html:
             return None
+        return self._parse_fetched(html, paper_id)
 
+    def _parse_fetched(self, html: str, paper_id: str) -> Optional[Dict]:
+        """Archive fetched HTML, parse it and update success/failure stats."""
+        archive_page(paper_id, html)
         paper = self.parse_paper(html, paper_id)
         if paper:
             self.stats["successful_scrapes"] += 1
@@ -328,15 +306,24 @@ class OptimizedChinaXivScraper:
             return None
 
     def scrape_month_optimized(
-        self, year_month: str, max_id: int, checkpoint: Optional[Dict] = None
+        self,
+        year_month: str,
+        max_id: int,
+        checkpoint: Optional[Dict] = None,
+        dry_run: bool = False,
     ) -> List[Dict]:
         """
         Scrape papers for a month using known max ID.
 
+        Missing and errored IDs are written to the probe bitmap as they are
+        seen; found IDs only once :meth:`save_results` has written their
+        records, so an interrupted or dry run never hides a paper.
+
         Args:
             year_month: Month to scrape (e.g., "202504")
             max_id: Maximum paper number to probe
             checkpoint: Optional checkpoint to resume from
+            dry_run: Do not persist the probe bitmap
 
         Returns:
             List of paper metadata dicts
@@ -350,53 +337,100 @@ class OptimizedChinaXivScraper:
             start_num = checkpoint.get("last_id_num", 1) + 1
             log(f"Resuming {year_month} from ID #{start_num:05d}")
 
-        log(f"Scraping {year_month} from #{start_num:05d} to #{max_id:05d}")
-
-        for num in range(start_num, max_id + 1):
-            paper_id = f"{year_month}.{num:05d}"
+        # Skip IDs whose outcome is already known from earlier runs
+        bitmap = ProbeBitmap.load(year_month)
+        nums = due_from_config(bitmap, max_id, start=start_num)
+        # Found IDs whose records never made it to the month's file are due again
+        recorded = self._recorded_nums(year_month) | {_paper_num(p) for p in papers}
+        lost = [
+            num
+            for num in range(start_num, max_id + 1)
+            if bitmap.state(num) == FOUND and num not in recorded
+        ]
+        if lost:
+            log(f"{len(lost)} IDs marked found have no records; probing them again")
+            nums = sorted(set(nums).union(lost))
+        skipped = max(0, max_id - start_num + 1) - len(nums)
+        log(
+            f"Scraping {year_month} from #{start_num:05d} to #{max_id:05d} "
+            f"({len(nums)} to probe, {skipped} known from earlier runs)"
+        )
 
-            paper = self.scrape_paper(paper_id)
+        ckpt = CheckpointLog(self._checkpoint_paths(year_month)[0], reset=not checkpoint)
+        urls = (f"{self.base_url}/{year_month}.{num:05d}" for num in nums)
+        try:
+            for url, result in self.engine.fetch_many(urls):
+                paper_id = url.rsplit("/", 1)[-1]
+                num = int(paper_id.split(".")[1])
 
-            if paper:
-                papers.append(paper)
-                log(f"✓ {paper_id}: {paper['title'][:60]}...")
+                self.stats["total_attempts"] += result.attempts
+                paper = (
+                    self._parse_fetched(result.html, paper_id) if result.html else None
+                )
 
-                # Save checkpoint every 10 papers
-                if len(papers) % 10 == 0:
-                    self._save_checkpoint(year_month, papers, num)
+                if paper:
+                    papers.append(paper)
+                    log(f"✓ {paper_id}: {paper['title'][:60]}...")
 
+                    ckpt.append(num, paper)
+                    # Persist probe history alongside the checkpoint
+                    if len(papers) % 10 == 0 and not dry_run:
+                        bitmap.save()
+                elif result.status == "missing":
+                    bitmap.mark(num, MISSING)
+                else:
+                    # Fetch or parse error: retried once the retry delay passes
+                    bitmap.mark(num, ERRORED)
+        finally:
+            # Keep what was probed even if the run is interrupted
+            ckpt.close()
+            if not dry_run:
+                bitmap.save()
+        if papers:
+            save_max_id(year_month, max(_paper_num(p) for p in papers))
         log(f"Finished {year_month}: {len(papers)} papers scraped")
         return papers
 
-    def _save_checkpoint(self, year_month: str, papers: List[Dict], last_id_num: int):
-        """Save checkpoint for resume capability."""
-        checkpoint_dir = Path("data/checkpoints")
-        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    def _checkpoint_paths(self, year_month: str) -> Tuple[str, str]:
+        """JSONL checkpoint log and the older full-rewrite JSON checkpoint."""
+        base = Path("data/checkpoints") / f"chinaxiv_opt_{year_month}"
+        return f"{base}.jsonl", f"{base}.json"
 
-        checkpoint = {
-            "year_month": year_month,
-            "last_id_num": last_id_num,
-            "papers": papers,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+    def _records_path(self, year_month: str) -> str:
+        return str(Path("data/records") / f"chinaxiv_{year_month}.json")
 
-        checkpoint_path = str(checkpoint_dir / f"chinaxiv_opt_{year_month}.json")
-        write_json(checkpoint_path, checkpoint)
+    def _recorded_nums(self, year_month: str) -> Set[int]:
+        """Paper numbers present in the month's records file."""
+        path = self._records_path(year_month)
+        if not os.path.exists(path):
+            return set()
+        return {_paper_num(r) for r in read_json(path)}
 
     def _load_checkpoint(self, year_month: str) -> Optional[Dict]:
-        """Load checkpoint if exists."""
-        checkpoint_path = Path("data/checkpoints") / f"chinaxiv_opt_{year_month}.json"
-        if checkpoint_path.exists():
-            return read_json(str(checkpoint_path))
-        return None
+        """Load checkpoint if exists (streaming replay of the JSONL log)."""
+        return load_checkpoint(*self._checkpoint_paths(year_month))
 
     def save_results(self, year_month: str, papers: List[Dict]):
-        """Save results to IA-compatible JSON."""
-        output_dir = Path("data/records")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        """
+        Save results to IA-compatible JSON.
 
-        output_path = str(output_dir / f"chinaxiv_{year_month}.json")
+        Records already in the month's file are kept, since IDs recorded as
+        found in the probe bitmap are not fetched again. The found IDs are
+        written to the bitmap only after the records are on disk.
+        """
+        output_path = self._records_path(year_month)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if os.path.exists(output_path):
+            merged = {r["id"]: r for r in read_json(output_path)}
+            merged.update((r["id"], r) for r in papers)
+            papers = sorted(merged.values(), key=lambda r: r["id"])
         write_json(output_path, papers)
+        bitmap = ProbeBitmap.load(year_month)
+        for paper in papers:
+            bitmap.mark(_paper_num(paper), FOUND)
+        bitmap.save()
+        # The records file now holds everything the checkpoint log did
+        discard_checkpoint(*self._checkpoint_paths(year_month))
         log(f"Saved {len(papers)} papers to {output_path}")
 
 
@@ -409,7 +443,10 @@ def run_cli():
     parser.add_argument("--resume", action="store_true", help="Resume from checkpoint")
     parser.add_argument("--dry-run", action="store_true", help="Test mode")
     parser.add_argument(
-        "--rate-limit", type=float, default=0.5, help="Seconds between requests"
+        "--rate-limit", type=float, default=None, help="Seconds between requests"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Requests in flight at once"
     )
     args = parser.parse_args()
 
@@ -442,7 +479,9 @@ def run_cli():
         return
 
     # Initialize scraper
-    scraper = OptimizedChinaXivScraper(api_key, zone, rate_limit=args.rate_limit)
+    scraper = OptimizedChinaXivScraper(
+        api_key, zone, rate_limit=args.rate_limit, concurrency=args.concurrency
+    )
 
     # Phase 1: Get max IDs from homepage
     homepage_maxes = scraper.extract_homepage_max_ids()
@@ -451,11 +490,13 @@ def run_cli():
     all_max_ids = {}
     for year_month in months:
         if year_month in homepage_maxes:
-            all_max_ids[year_month] = homepage_maxes[year_month]
+            all_max_ids[year_month] = max(
+                homepage_maxes[year_month], load_max_ids().get(year_month, 0)
+            )
             log(f"{year_month}: Using homepage max = {all_max_ids[year_month]:05d}")
         else:
-            log(f"{year_month}: Homepage max not found, using binary search...")
-            all_max_ids[year_month] = scraper.find_max_id_binary_search(year_month)
+            log(f"{year_month}: Homepage max not found, searching...")
+            all_max_ids[year_month] = scraper.find_max_id(year_month)
 
     # Phase 3: Scrape each month
     for year_month in months:
@@ -472,7 +513,7 @@ def run_cli():
 
         # Scrape month with known max
         papers = scraper.scrape_month_optimized(
-            year_month, max_id, checkpoint=checkpoint
+            year_month, max_id, checkpoint=checkpoint, dry_run=args.dry_run
         )
 
         # Save results (unless dry-run)
@@ -487,13 +528,14 @@ def run_cli():
         log(
             f"  Hit rate: {scraper.stats['successful_scrapes'] / max(1, scraper.stats['total_attempts']) * 100:.1f}%"
         )
+        log(f"  Engine: {format_metrics(scraper.engine.metrics())}")
 
         # Reset stats for next month
         scraper.stats = {
             "total_attempts": 0,
             "successful_scrapes": 0,
             "failed_scrapes": 0,
-            "binary_search_requests": 0,
+            "max_id_probes": 0,
         }
 
     log("\nOptimized harvest complete!")
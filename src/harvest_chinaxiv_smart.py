@@ -8,16 +8,14 @@ to limit probing. Suitable for fast, low-cost incremental harvests.
 
 import argparse
 import os
-import re
-import time
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from .chinaxiv_parse import parse_abstract_page
+from .fetch_engine import BrightDataEngine, format_metrics, rate_limit_to_rate
+from .raw_archive import archive_page
 from .utils import log, write_json
 
 
@@ -36,142 +34,41 @@ DEFAULT_MAX_IDS = {
 class SmartChinaXivScraper:
     """Pragmatic scraper using pre-analyzed max IDs."""
 
-    def __init__(self, api_key: str, zone: str, rate_limit: float = 0.5):
+    def __init__(
+        self,
+        api_key: str,
+        zone: str,
+        rate_limit: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        engine: Optional[BrightDataEngine] = None,
+    ):
         self.api_key = api_key
         self.zone = zone
         self.rate_limit = rate_limit
         self.base_url = "https://chinaxiv.org/abs"
-        self.api_url = "https://api.brightdata.com/request"
+        self.engine = engine or BrightDataEngine.from_config(
+            api_key,
+            zone,
+            rate_per_sec=rate_limit_to_rate(rate_limit),
+            concurrency=concurrency,
+        )
 
         self.stats = {"total_attempts": 0, "successful_scrapes": 0, "failed_scrapes": 0}
 
     def fetch_page(self, url: str) -> Optional[str]:
         """Fetch page HTML using BrightData."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {"zone": self.zone, "url": url, "format": "raw"}
-
-        try:
-            time.sleep(self.rate_limit)
-
-            response = requests.post(
-                self.api_url, headers=headers, json=payload, timeout=60
-            )
-
-            self.stats["total_attempts"] += 1
-
-            if response.status_code == 200:
-                html = response.text
-                if "<ErrorResponseData>" in html or len(html) < 1000:
-                    return None
-                return html
-
-            return None
-
-        except Exception as e:
-            log(f"Fetch exception: {e}")
-            return None
+        result = self.engine.fetch(url)
+        self.stats["total_attempts"] += result.attempts
+        return result.html
 
     def parse_paper(self, html: str, paper_id: str) -> Optional[Dict]:
         """Parse paper metadata from HTML."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Title
-            title_elem = soup.find("h1")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            if not title or len(title) < 10:
-                return None
-
-            # Authors
-            author_links = soup.find_all("a", href=lambda x: x and "field=author" in x)
-            creators = [
-                link.get_text(strip=True)
-                for link in author_links
-                if link.get_text(strip=True)
-            ]
-
-            # Abstract
-            abstract = ""
-            abstract_marker = soup.find("b", string=re.compile(r"摘要[:：]"))
-            if abstract_marker:
-                parent = abstract_marker.parent
-                if parent:
-                    full_text = parent.get_text(strip=False)
-                    match = re.search(r"摘要[:：]\s*(.+)", full_text, re.DOTALL)
-                    if match:
-                        abstract = match.group(1).strip()
-
-            # Submission date
-            date_str = ""
-            date_marker = soup.find("b", string=re.compile(r"提交时间[:：]"))
-            if date_marker:
-                parent = date_marker.parent
-                if parent:
-                    text = parent.get_text(strip=True)
-                    match = re.search(r"提交时间[:：]\s*(.+)", text)
-                    if match:
-                        date_str = match.group(1).strip()
-
-            # Parse date
-            date_iso = ""
-            if date_str:
-                try:
-                    dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    date_iso = dt.isoformat() + "Z"
-                except:
-                    pass
-
-            if not date_iso:
-                year = paper_id[:4]
-                month = paper_id[4:6]
-                date_iso = f"{year}-{month}-01T00:00:00Z"
-
-            # Subjects
-            subjects = []
-            category_marker = soup.find("b", string=re.compile(r"分类[:：]"))
-            if category_marker:
-                parent = category_marker.parent
-                if parent:
-                    category_links = parent.find_all("a")
-                    subjects = [
-                        link.get_text(strip=True)
-                        for link in category_links
-                        if link.get_text(strip=True)
-                    ]
-
-            # PDF URL
-            pdf_url = ""
-            pdf_link = soup.find("a", href=lambda x: x and "filetype=pdf" in x)
-            if pdf_link:
-                href = pdf_link.get("href", "")
-                pdf_url = (
-                    f"https://chinaxiv.org{href}" if href.startswith("/") else href
-                )
-
-            # Build record
-            record = {
-                "id": f"chinaxiv-{paper_id}",
-                "oai_identifier": paper_id,
-                "title": title,
-                "abstract": abstract,
-                "creators": creators,
-                "subjects": subjects,
-                "date": date_iso,
-                "source_url": f"https://chinaxiv.org/abs/{paper_id}",
-                "pdf_url": pdf_url,
-                "license": {"raw": "", "derivatives_allowed": None},
-                "setSpec": None,
-            }
-
-            return record
-
+            record = parse_abstract_page(html, paper_id)
         except Exception as e:
             log(f"Parse error for {paper_id}: {e}")
             return None
+        return record
 
     def scrape_month(self, year_month: str, max_id: int) -> List[Dict]:
         """Scrape papers for a month."""
@@ -179,13 +76,15 @@ class SmartChinaXivScraper:
 
         log(f"Scraping {year_month} from #00001 to #{max_id:05d}")
 
-        for num in range(1, max_id + 1):
-            paper_id = f"{year_month}.{num:05d}"
-            url = f"{self.base_url}/{paper_id}"
+        urls = (f"{self.base_url}/{year_month}.{num:05d}" for num in range(1, max_id + 1))
+        for url, result in self.engine.fetch_many(urls):
+            paper_id = url.rsplit("/", 1)[-1]
+            self.stats["total_attempts"] += result.attempts
 
-            html = self.fetch_page(url)
+            html = result.html
             if not html:
                 continue
+            archive_page(paper_id, html)
 
             paper = self.parse_paper(html, paper_id)
             if paper:
@@ -214,7 +113,8 @@ def run_cli():
     parser.add_argument("--start", help="Start month (YYYYMM)")
     parser.add_argument("--end", help="End month (YYYYMM)")
     parser.add_argument("--month", help="Single month")
-    parser.add_argument("--rate-limit", type=float, default=0.5)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
     args = parser.parse_args()
 
     load_dotenv()
@@ -244,7 +144,9 @@ def run_cli():
         print("Error: Specify --month OR (--start AND --end)")
         return
 
-    scraper = SmartChinaXivScraper(api_key, zone, args.rate_limit)
+    scraper = SmartChinaXivScraper(
+        api_key, zone, args.rate_limit, concurrency=args.concurrency
+    )
 
     # Scrape each month
     for year_month in months:
@@ -264,6 +166,7 @@ def run_cli():
         log(
             f"  Hit rate: {scraper.stats['successful_scrapes'] / max(1, scraper.stats['total_attempts']) * 100:.1f}%"
         )
+        log(f"  Engine: {format_metrics(scraper.engine.metrics())}")
 
         # Reset
         scraper.stats = {
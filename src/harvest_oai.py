@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import io
+import json
 import os
-from typing import Any, Dict, List, Optional
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
 from lxml import etree
 
@@ -12,6 +17,7 @@ from .utils import (
     http_get,
     load_yaml,
     log,
+    read_json,
     save_raw_xml,
     stable_id_from_oai,
     write_json,
@@ -23,6 +29,20 @@ NS = {
     "oai": "http://www.openarchives.org/OAI/2.0/",
     "dc": "http://purl.org/dc/elements/1.1/",
 }
+_RECORD_TAG = f"{{{NS['oai']}}}record"
+_TOKEN_TAG = f"{{{NS['oai']}}}resumptionToken"
+
+
+class HarvestError(RuntimeError):
+    """One or more sets failed; ``counts`` holds the sets that finished."""
+
+    def __init__(self, failed: Dict[str, str], counts: Dict[str, int]):
+        self.failed = failed
+        self.counts = counts
+        super().__init__(
+            "Harvest failed for set(s): "
+            + ", ".join(f"{s} ({err})" for s, err in failed.items())
+        )
 
 
 def oai_request(base_url: str, **params: str) -> str:
@@ -106,47 +126,250 @@ def normalize_record(rec_el: etree._Element) -> Optional[Dict[str, Any]]:
     }
 
 
-def harvest(
+def _iter_page(data: bytes) -> Generator[Dict[str, Any], None, Optional[str]]:
+    """
+    Stream normalized records out of one ListRecords page.
+
+    Elements are cleared as soon as they are normalized, so memory stays
+    bounded by a single record. Returns the page's resumption token.
+    """
+    token: Optional[str] = None
+    events = etree.iterparse(
+        io.BytesIO(data), events=("end",), tag=(_RECORD_TAG, _TOKEN_TAG)
+    )
+    for _, el in events:
+        if el.tag == _TOKEN_TAG:
+            token = el.text.strip() if el.text and el.text.strip() else None
+            continue
+        item = normalize_record(el)
+        if item:
+            yield item
+        el.clear()
+        parent = el.getparent()
+        if parent is not None:
+            while el.getprevious() is not None:
+                del parent[0]
+    return token
+
+
+def _load_set_checkpoint(path: Optional[str]) -> Dict[str, Any]:
+    if path and os.path.exists(path):
+        return read_json(path)
+    return {}
+
+
+def harvest_iter(
     base_url: str,
     metadata_prefix: str,
     day_from: str,
     day_until: str,
     set_spec: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    params: Dict[str, str] = {
-        "verb": "ListRecords",
-        "metadataPrefix": metadata_prefix,
-        "from": day_from,
-        "until": day_until,
-    }
-    if set_spec:
-        params["set"] = set_spec
+    checkpoint_path: Optional[str] = None,
+    page_delay: float = 1.0,
+    resume: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield normalized records for a date window, following resumption tokens.
+
+    Args:
+        base_url: OAI-PMH endpoint
+        metadata_prefix: metadataPrefix to request
+        day_from: YYYY-MM-DD start date
+        day_until: YYYY-MM-DD end date
+        set_spec: Optional set to restrict to
+        checkpoint_path: JSON file recording the next resumption token after
+            each page; an interrupted chain restarts from there
+        page_delay: Seconds to wait between pages of this chain
+        resume: Continue from the checkpoint (skipping a finished window);
+            otherwise the window is harvested from its first page
+
+    Yields:
+        Normalized record dicts
+    """
+    state = _load_set_checkpoint(checkpoint_path) if resume else {}
+    if state.get("done"):
+        return
+
+    if state.get("token"):
+        params: Dict[str, str] = {"verb": "ListRecords", "resumptionToken": state["token"]}
+        part = int(state.get("part", 1))
+    else:
+        params = {
+            "verb": "ListRecords",
+            "metadataPrefix": metadata_prefix,
+            "from": day_from,
+            "until": day_until,
+        }
+        if set_spec:
+            params["set"] = set_spec
+        part = 1
+    count = int(state.get("count", 0))
 
-    part = 1
-    day = day_from
-    out: List[Dict[str, Any]] = []
     while True:
         xml = oai_request(base_url, **params)
-        save_raw_xml(xml, day, part)
-        root = etree.fromstring(xml.encode("utf-8"))
-        records = root.findall(".//oai:ListRecords/oai:record", namespaces=NS)
-        for rec in records:
-            item = normalize_record(rec)
-            if item:
-                out.append(item)
-        # resumptionToken handling
-        token_el = root.find(".//oai:ListRecords/oai:resumptionToken", namespaces=NS)
-        token = (
-            token_el.text.strip() if token_el is not None and token_el.text else None
-        )
-        if token:
-            params = {"verb": "ListRecords", "resumptionToken": token}
-            part += 1
-            # Polite pacing to avoid hammering the endpoint
-            time.sleep(1.0)
-        else:
+        save_raw_xml(xml, day_from, part, set_spec=set_spec)
+        page = _iter_page(xml.encode("utf-8"))
+        del xml
+        while True:
+            try:
+                item = next(page)
+            except StopIteration as stop:
+                token = stop.value
+                break
+            count += 1
+            yield item
+
+        if checkpoint_path:
+            write_json(
+                checkpoint_path,
+                {"token": token, "part": part + 1, "count": count, "done": not token},
+            )
+        if not token:
             break
-    return out
+        params = {"verb": "ListRecords", "resumptionToken": token}
+        part += 1
+        # Polite pacing to avoid hammering the endpoint
+        time.sleep(page_delay)
+
+
+def harvest(
+    base_url: str,
+    metadata_prefix: str,
+    day_from: str,
+    day_until: str,
+    set_spec: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Collect :func:`harvest_iter` into a list (small windows and tests)."""
+    return list(harvest_iter(base_url, metadata_prefix, day_from, day_until, set_spec))
+
+
+class JsonlSink:
+    """Thread-safe JSONL writer shared by concurrent set harvests."""
+
+    def __init__(self, path: str, append: bool = False):
+        """
+        Args:
+            path: JSONL file
+            append: Keep records from an earlier run (resume) instead of
+                starting the file over
+        """
+        ensure_dir(os.path.dirname(path))
+        self.path = path
+        self._lock = threading.Lock()
+        self._fh = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._fh.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+
+def harvest_sets(
+    base_url: str,
+    metadata_prefix: str,
+    day_from: str,
+    day_until: str,
+    sets: List[Optional[str]],
+    sink: JsonlSink,
+    workers: int = 4,
+    page_delay: float = 1.0,
+    checkpoint_dir: str = os.path.join("data", "checkpoints"),
+    resume: bool = False,
+) -> Dict[str, int]:
+    """
+    Harvest independent sets concurrently into one JSONL sink.
+
+    Each set follows its own resumption-token chain with its own checkpoint,
+    so one slow or failing set neither blocks nor restarts the others.
+
+    Args:
+        resume: Continue each set from its checkpoint (finished sets are
+            skipped); otherwise every set starts from its first page
+
+    Returns:
+        Records written per set
+
+    Raises:
+        HarvestError: If any set failed (after the others have finished)
+    """
+
+    def _run(set_spec: Optional[str]) -> int:
+        slug = (set_spec or "all").replace(":", "_").replace("/", "_")
+        ckpt = os.path.join(checkpoint_dir, f"oai_{day_from}_{day_until}_{slug}.json")
+        n = 0
+        for item in harvest_iter(
+            base_url,
+            metadata_prefix,
+            day_from,
+            day_until,
+            set_spec,
+            ckpt,
+            page_delay,
+            resume=resume,
+        ):
+            sink.write(item)
+            n += 1
+        return n
+
+    counts: Dict[str, int] = {}
+    failed: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(sets)))) as ex:
+        futures = {ex.submit(_run, s): s for s in sets}
+        for fut in as_completed(futures):
+            s = futures[fut]
+            try:
+                counts[s or "-"] = fut.result()
+                log(f"Fetched {counts[s or '-']} records from set={s or '-'}")
+            except Exception as e:
+                failed[s or "-"] = str(e)
+                log(f"Harvest failed for set={s or '-'}: {e} (resume picks up from its checkpoint)")
+    if failed:
+        raise HarvestError(failed, counts)
+    return counts
+
+
+def jsonl_to_json_array(jsonl_path: str, out_path: str) -> int:
+    """
+    Convert a JSONL record stream into the JSON array format the pipeline
+    reads, one record at a time. Records repeated by a resumed chain are
+    written once, as their last (most recently fetched) copy.
+
+    Returns:
+        Number of records written
+    """
+
+    def _records(src: Iterable[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for index, line in enumerate(src):
+            try:
+                yield index, json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+    # First pass keeps only the IDs' last line numbers, not the records
+    last: Dict[Any, int] = {}
+    with open(jsonl_path, "r", encoding="utf-8") as src:
+        for index, rec in _records(src):
+            last[rec.get("id")] = index
+
+    tmp = out_path + ".tmp"
+    n = 0
+    with open(jsonl_path, "r", encoding="utf-8") as src, open(
+        tmp, "w", encoding="utf-8"
+    ) as dst:
+        dst.write("[")
+        for index, rec in _records(src):
+            if last[rec.get("id")] != index:
+                continue
+            dst.write(",\n" if n else "\n")
+            dst.write(json.dumps(rec, ensure_ascii=False))
+            n += 1
+        dst.write("\n]\n")
+    os.replace(tmp, out_path)
+    return n
 
 
 def run_cli() -> None:
@@ -162,11 +385,18 @@ def run_cli() -> None:
         help="Override metadataPrefix (default from config)",
     )
     parser.add_argument("--set", dest="set_spec", help="Harvest specific setSpec")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue sets from their checkpoints and keep the records already "
+        "streamed for this window (default: harvest the window again from scratch)",
+    )
     args = parser.parse_args()
 
     cfg = load_yaml(os.path.join("src", "config.yaml"))
-    base_url = args.base_url or cfg["oai"]["base_url"]
-    metadata_prefix = args.metadata_prefix or cfg["oai"].get(
+    oai_cfg = cfg.get("oai") or {}
+    base_url = args.base_url or oai_cfg["base_url"]
+    metadata_prefix = args.metadata_prefix or oai_cfg.get(
         "metadata_prefix", "oai_eprint"
     )
 
@@ -175,7 +405,7 @@ def run_cli() -> None:
     else:
         from .utils import utc_date_range_str
 
-        day_from, day_until = utc_date_range_str(cfg["oai"].get("date_window_days", 1))
+        day_from, day_until = utc_date_range_str(oai_cfg.get("date_window_days", 1))
 
     log("Identify endpoint liveness…")
     ident_xml = oai_request(base_url, verb="Identify")
@@ -184,20 +414,38 @@ def run_cli() -> None:
         f"OAI: {info['repositoryName']} earliest={info['earliestDatestamp']} granularity={info['granularity']}"
     )
 
-    sets = [args.set_spec] if args.set_spec else (cfg["oai"].get("sets", []) or [None])
-    all_items: List[Dict[str, Any]] = []
-    for s in sets:
-        log(f"Harvesting {day_from}..{day_until} set={s or '-'}")
-        items = harvest(base_url, metadata_prefix, day_from, day_until, s)
-        log(f"Fetched {len(items)} records from set={s or '-'}")
-        all_items.extend(items)
+    sets = [args.set_spec] if args.set_spec else (oai_cfg.get("sets", []) or [None])
+    log(f"Harvesting {day_from}..{day_until} sets={[s or '-' for s in sets]}")
 
-    # Save normalized JSON for the window
+    # Stream records to JSONL, then emit the JSON array the pipeline reads
     ensure_dir(os.path.join("data", "records"))
-    out_path = os.path.join("data", "records", f"{day_from}_to_{day_until}.json")
-    write_json(out_path, all_items)
-    log(f"Wrote normalized records → {out_path}")
+    stream_path = os.path.join("data", "records", f"{day_from}_to_{day_until}.jsonl")
+    sink = JsonlSink(stream_path, append=args.resume)
+    error: Optional[HarvestError] = None
+    try:
+        harvest_sets(
+            base_url,
+            metadata_prefix,
+            day_from,
+            day_until,
+            sets,
+            sink,
+            workers=int(oai_cfg.get("set_workers", 4)),
+            page_delay=float(oai_cfg.get("page_delay", 1.0)),
+            resume=args.resume,
+        )
+    except HarvestError as e:
+        error = e
+    finally:
+        sink.close()
 
+    # Keep what the finished sets fetched, then report the failure
+    out_path = os.path.join("data", "records", f"{day_from}_to_{day_until}.json")
+    n = jsonl_to_json_array(stream_path, out_path)
+    log(f"Wrote {n} normalized records → {out_path}")
+    if error is not None:
+        log(f"{error}; rerun with --resume to continue the failed sets")
+        sys.exit(1)
 
 if __name__ == "__main__":
     run_cli()
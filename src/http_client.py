@@ -4,6 +4,7 @@ Optimized HTTP client with connection pooling for ChinaXiv English translation.
 
 from __future__ import annotations
 
+import os
 from typing import Optional, Tuple, Dict, Any
 
 import requests
@@ -17,11 +18,17 @@ from tenacity import (
 )
 
 from .config import get_proxies
+from .logging_utils import log
 
 
 DEFAULT_TIMEOUT = (10, 60)  # connect, read
 USER_AGENT = "chinaxiv-english/1.0 (+https://github.com/)"
 
+# Streaming download limits
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_DOWNLOAD_BYTES = 200 * 1024 * 1024
+PDF_MAGIC = b"%PDF-"
+
 
 class HttpError(Exception):
     """HTTP-related errors."""
@@ -119,6 +126,148 @@ def http_get(
     return resp
 
 
+def _content_range_start(value: Optional[str]) -> Optional[int]:
+    """Return the first byte offset of a ``Content-Range: bytes a-b/n`` header."""
+    if not value:
+        return None
+    try:
+        _unit, rng = value.strip().split(" ", 1)
+        return int(rng.split("-", 1)[0])
+    except (ValueError, IndexError):
+        return None
+
+
+@retry(
+    wait=wait_exponential(multiplier=1, min=1, max=20),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type(HttpError),
+    reraise=True,
+)
+def stream_download(
+    url: str,
+    dest_path: str,
+    *,
+    expect_pdf: bool = False,
+    min_bytes: int = 0,
+    max_bytes: int = MAX_DOWNLOAD_BYTES,
+    timeout: Tuple[int, int] = DEFAULT_TIMEOUT,
+) -> bool:
+    """
+    Stream a URL to disk with flat memory use.
+
+    Chunks are written to ``<dest_path>.part`` and renamed into place once the
+    body is complete. When a partial file from an interrupted attempt exists,
+    the download resumes from its end with an HTTP Range request.
+
+    Args:
+        url: URL to download
+        dest_path: Final file path
+        expect_pdf: Require the body to start with ``%PDF-``
+        min_bytes: Reject bodies smaller than this
+        max_bytes: Abort bodies larger than this
+        timeout: Request timeout (connect, read)
+
+    Returns:
+        True if the file was written, False if the content was rejected
+
+    Raises:
+        HttpError: On transport errors or retryable statuses; the partial
+            file is kept so the next attempt resumes
+    """
+    session = get_session()
+    part_path = f"{dest_path}.part"
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+    # Byte offsets only line up with the stored file when the body is not re-encoded
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+
+    proxies, source = get_proxies()
+    kwargs: Dict[str, Any] = {
+        "headers": headers,
+        "timeout": (15, 90) if source != "none" else timeout,
+        "stream": True,
+        "allow_redirects": True,
+    }
+    if source == "config" and proxies:
+        kwargs["proxies"] = proxies
+
+    try:
+        resp = session.get(url, **kwargs)
+    except requests.RequestException as e:
+        raise HttpError(str(e))
+
+    def _reject(reason: str) -> bool:
+        log(f"Rejected download {url}: {reason}")
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        return False
+
+    with resp:
+        if resp.status_code == 416 and offset:
+            # Range no longer satisfiable (file changed upstream); start over
+            os.remove(part_path)
+            raise HttpError(f"GET {url} -> 416 for bytes={offset}-")
+        if resp.status_code == 429 or resp.status_code >= 500:
+            raise HttpError(f"GET {url} -> {resp.status_code}")
+        if not resp.ok:
+            return _reject(f"HTTP {resp.status_code}")
+
+        mode = "wb"
+        if offset and resp.status_code == 206:
+            if _content_range_start(resp.headers.get("Content-Range")) != offset:
+                os.remove(part_path)
+                raise HttpError(f"GET {url} -> unexpected Content-Range")
+            mode = "ab"
+        else:
+            # Server ignored the Range header and sent the full body
+            offset = 0
+
+        length = resp.headers.get("Content-Length") or ""
+        if length.isdigit() and offset + int(length) > max_bytes:
+            return _reject(f"{offset + int(length)} bytes exceeds cap of {max_bytes}")
+
+        head = b""
+        if offset and expect_pdf:
+            with open(part_path, "rb") as f:
+                head = f.read(len(PDF_MAGIC))
+
+        dest_dir = os.path.dirname(dest_path)
+        if dest_dir:
+            os.makedirs(dest_dir, exist_ok=True)
+
+        written = offset
+        problem: Optional[str] = None
+        try:
+            with open(part_path, mode) as f:
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    if expect_pdf and len(head) < len(PDF_MAGIC):
+                        head += chunk[: len(PDF_MAGIC) - len(head)]
+                        if len(head) == len(PDF_MAGIC) and head != PDF_MAGIC:
+                            problem = "content is not a PDF"
+                            break
+                    written += len(chunk)
+                    if written > max_bytes:
+                        problem = f"body exceeds cap of {max_bytes} bytes"
+                        break
+                    f.write(chunk)
+        except requests.RequestException as e:
+            raise HttpError(f"GET {url} interrupted after {written} bytes: {e}")
+
+    if problem is None and expect_pdf and head != PDF_MAGIC:
+        problem = "content is not a PDF"
+    if problem is None and written < min_bytes:
+        problem = f"only {written} bytes"
+    if problem:
+        return _reject(problem)
+
+    os.replace(part_path, dest_path)
+    return True
+
+
 def openrouter_headers() -> dict:
     """
     Get headers for OpenRouter API requests with automatic env mismatch resolution.
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Per-paper cost estimates for scheduling translation jobs.
+
+A job's cost is estimated from the best information available, in order:
+
+    extracted text      ``post_ocr_chars`` in ``reports/ocr_report.json``
+    paragraph count     ``num_paragraphs`` in the same report
+    PDF page count      ``data/pdfs/<id>.pdf`` once downloaded
+    abstract only       record abstract plus a typical body (``default_pages``)
+
+and expressed as input tokens (``est_tokens``) and expected wall-clock
+seconds (``est_seconds``). ``est_basis`` records which source was used. The
+cloud queue stores these fields on each job and orders claims by
+``est_seconds`` (see ``CloudJobQueue.claim_batch``).
+
+Rates are tunable under ``scheduling`` in ``config.yaml``.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, Iterable, Optional
+
+from .config import get_config
+from .file_service import read_json
+from .logging_utils import log
+
+
+PDF_DIR = os.path.join("data", "pdfs")
+OCR_REPORT_PATH = os.path.join("reports", "ocr_report.json")
+
+DEFAULTS: Dict[str, float] = {
+    "chars_per_token": 4.0,
+    "tokens_per_page": 900,
+    "tokens_per_paragraph": 150,
+    "default_pages": 12,
+    "seconds_overhead": 10.0,
+    "seconds_per_1k_tokens": 4.0,
+}
+
+# Page objects, not the /Pages tree nodes
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+
+def scheduling_config() -> Dict[str, Any]:
+    """``scheduling`` config section merged over :data:`DEFAULTS`."""
+    cfg = dict(DEFAULTS)
+    cfg.update(get_config().get("scheduling") or {})
+    return cfg
+
+
+def pdf_page_count(path: str) -> Optional[int]:
+    """
+    Count pages in a PDF without parsing it.
+
+    Counts ``/Type /Page`` objects in the raw bytes, which is exact for
+    uncompressed object tables and a good lower bound otherwise. Returns None
+    if the file is missing or no page objects are visible.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    return len(_PAGE_RE.findall(data)) or None
+
+
+def estimate_job(
+    abstract: str = "",
+    pages: Optional[int] = None,
+    paragraphs: Optional[int] = None,
+    body_chars: Optional[int] = None,
+    cfg: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Estimate tokens and latency for one paper.
+
+    Args:
+        abstract: Source abstract (always translated)
+        pages: PDF page count, if downloaded
+        paragraphs: Extracted paragraph count, if extracted
+        body_chars: Extracted body characters, if extracted
+        cfg: Rates (default: :func:`scheduling_config`)
+
+    Returns:
+        Dict with ``est_tokens``, ``est_seconds`` and ``est_basis``
+    """
+    cfg = cfg or scheduling_config()
+    if body_chars:
+        body, basis = body_chars / cfg["chars_per_token"], "text"
+    elif paragraphs:
+        body, basis = paragraphs * cfg["tokens_per_paragraph"], "paragraphs"
+    elif pages:
+        body, basis = pages * cfg["tokens_per_page"], "pages"
+    else:
+        body, basis = cfg["default_pages"] * cfg["tokens_per_page"], "abstract"
+    tokens = int(len(abstract) / cfg["chars_per_token"] + body)
+    seconds = cfg["seconds_overhead"] + tokens / 1000.0 * cfg["seconds_per_1k_tokens"]
+    return {"est_tokens": tokens, "est_seconds": round(seconds, 1), "est_basis": basis}
+
+
+def load_extraction_report(path: str = OCR_REPORT_PATH) -> Dict[str, Any]:
+    """
+    Per-paper extraction results (empty if the report does not exist).
+
+    Extraction appends to ``ocr_report.jsonl`` next to the report; that log
+    is folded in first so recently extracted papers are included.
+    """
+    from .pdf_pipeline import OCR_REPORT_FILE, compact_ocr_report
+
+    if os.path.basename(path) == OCR_REPORT_FILE:
+        try:
+            return compact_ocr_report(os.path.dirname(path) or ".")
+        except Exception as e:
+            log(f"Could not compact extraction report {path}: {e}")
+    if not os.path.exists(path):
+        return {}
+    try:
+        data = read_json(path)
+    except Exception as e:
+        log(f"Could not read extraction report {path}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def estimate_paper(
+    paper_id: str,
+    record: Optional[Dict[str, Any]] = None,
+    extraction: Optional[Dict[str, Any]] = None,
+    pdf_dir: str = PDF_DIR,
+    cfg: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Estimate one paper from its record, PDF and extraction report entry.
+
+    Args:
+        paper_id: Paper ID
+        record: Harvest record (looked up in the records store if omitted)
+        extraction: This paper's ``ocr_report.json`` entry, if any
+        pdf_dir: Where downloaded PDFs live
+        cfg: Rates (default: :func:`scheduling_config`)
+    """
+    if record is None:
+        from .records_store import lookup_record
+
+        record = lookup_record(paper_id) or {}
+    extraction = extraction or {}
+    body_chars = extraction.get("post_ocr_chars")
+    paragraphs = extraction.get("num_paragraphs")
+    pages = None
+    if not (body_chars or paragraphs):
+        pages = pdf_page_count(os.path.join(pdf_dir, f"{paper_id}.pdf"))
+    return estimate_job(
+        abstract=record.get("abstract") or "",
+        pages=pages,
+        paragraphs=paragraphs,
+        body_chars=body_chars,
+        cfg=cfg,
+    )
+
+
+def estimate_papers(
+    paper_ids: Iterable[str],
+    records: Optional[Dict[str, Dict[str, Any]]] = None,
+    pdf_dir: str = PDF_DIR,
+    report_path: str = OCR_REPORT_PATH,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Estimate many papers, reading the config and extraction report once.
+
+    Args:
+        paper_ids: Paper IDs
+        records: Records by ID (missing ones are looked up in the records store)
+        pdf_dir: Where downloaded PDFs live
+        report_path: Extraction report path
+
+    Returns:
+        Mapping paper_id -> estimate
+    """
+    cfg = scheduling_config()
+    report = load_extraction_report(report_path)
+    records = records or {}
+    return {
+        pid: estimate_paper(pid, records.get(pid), report.get(pid), pdf_dir, cfg)
+        for pid in paper_ids
+    }
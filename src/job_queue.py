@@ -1,243 +1,552 @@
 """
-Simplified file-based job queue for batch translation.
-"""
-
-import json
-import fcntl
-from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-
-
-class JobQueue:
-    """Simplified file-based job queue."""
+SQLite-backed job queue for batch translation.
 
-    def __init__(self):
-        self.jobs_dir = Path("data/jobs")
-        self.jobs_dir.mkdir(exist_ok=True)
+Jobs live in one table in ``data/job_queue.db`` (WAL mode, so readers such as
+the monitor never block workers):
 
-    def add_jobs(self, paper_ids: List[str]) -> int:
-        """Add jobs to queue."""
-        added = 0
-        for paper_id in paper_ids:
-            job_file = self.jobs_dir / f"{paper_id}.json"
-            if not job_file.exists():
-                job = {
-                    "id": paper_id,
-                    "status": "pending",
-                    "created_at": datetime.now().isoformat(),
-                    "attempts": 0,
-                }
-                with open(job_file, "w") as f:
-                    json.dump(job, f)
-                added += 1
-        return added
+    jobs(id PRIMARY KEY, status, created_at, started_at, completed_at,
+         worker_id, attempts, last_error)
 
-    def claim_job(self, worker_id: str) -> Optional[Dict]:
-        """Claim a pending job atomically."""
-        for job_file in self.jobs_dir.glob("*.json"):
-            try:
-                # Use file locking to prevent race conditions
-                with open(job_file, "r+") as f:
-                    # Try to acquire exclusive lock
-                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+Claims are a single indexed ``UPDATE ... RETURNING`` over the oldest pending
+row, so claim latency does not grow with the queue. Per-status counts are
+materialized in ``job_counts`` by triggers on every insert, status change
+and delete, so :meth:`JobQueue.get_stats` reads a handful of rows however
+many jobs there are.
 
-                    # Read job data
-                    f.seek(0)
-                    job = json.load(f)
+Each completion is also logged to ``completions`` (time, worker, model,
+duration) for the rolling-window throughput and ETA in
+:meth:`JobQueue.get_throughput` (see ``src/throughput.py``).
 
-                    # Check if still pending (another worker might have claimed it)
-                    if job["status"] == "pending":
-                        # Update job status atomically
-                        job["status"] = "in_progress"
-                        job["worker_id"] = worker_id
-                        job["started_at"] = datetime.now().isoformat()
+A claim is a lease: it holds the job until ``lease_expires_at`` (epoch
+seconds). Workers renew their leases with :meth:`JobQueue.update_heartbeat`
+while a paper is being translated; a job whose lease ran out (crashed or
+hung worker) goes back to pending on the next claim and the lost run counts
+as an attempt. Per-worker heartbeats and throughput counters are kept in a
+``workers`` table next to the jobs they lease.
 
-                        # Write updated job data
-                        f.seek(0)
-                        f.truncate()
-                        json.dump(job, f)
-                        f.flush()
+Queues created by the older one-file-per-job layout (``data/jobs/*.json``)
+can be imported with:
 
-                        return job
-
-            except (OSError, IOError):
-                # File is locked by another process, try next file
-                continue
-            except (json.JSONDecodeError, KeyError):
-                # Corrupted job file, skip
-                continue
+    python -m src.job_queue migrate [--jobs-dir data/jobs]
+"""
 
-        return None
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
 
-    def complete_job(self, job_id: str):
-        """Mark job as completed."""
-        job_file = self.jobs_dir / f"{job_id}.json"
-        if job_file.exists():
-            with open(job_file, "r") as f:
-                job = json.load(f)
+from .logging_utils import log
+from .throughput import iso_to_epoch, summarize, window_seconds
+
+
+DB_PATH = os.path.join("data", "job_queue.db")
+LEGACY_JOBS_DIR = os.path.join("data", "jobs")
+MAX_ATTEMPTS = 3
+LEASE_SECONDS = 300
+STATUSES = ("pending", "in_progress", "completed", "failed")
+# Completion events older than this are pruned
+COMPLETIONS_RETENTION = 7 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    completed_at TEXT,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+CREATE INDEX IF NOT EXISTS idx_jobs_completed ON jobs(status, completed_at);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    last_heartbeat REAL NOT NULL,
+    jobs_completed INTEGER NOT NULL DEFAULT 0,
+    jobs_failed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS completions (
+    ts REAL NOT NULL,
+    job_id TEXT NOT NULL,
+    worker_id TEXT,
+    model TEXT,
+    seconds REAL
+);
+CREATE INDEX IF NOT EXISTS idx_completions_ts ON completions(ts);
+"""
 
-            job["status"] = "completed"
-            job["completed_at"] = datetime.now().isoformat()
+# Per-status counters kept in step with ``jobs`` by triggers. Created (and
+# seeded from the jobs table) separately so existing databases pick them up.
+# (Statements, not a script: executescript would commit the open transaction.)
+_COUNTERS = (
+    """
+    CREATE TABLE IF NOT EXISTS job_counts (
+        status TEXT PRIMARY KEY,
+        n INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_jobs_count_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO job_counts (status, n) VALUES (NEW.status, 1)
+        ON CONFLICT(status) DO UPDATE SET n = n + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_jobs_count_delete AFTER DELETE ON jobs BEGIN
+        UPDATE job_counts SET n = n - 1 WHERE status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_jobs_count_update AFTER UPDATE OF status ON jobs
+    WHEN OLD.status IS NOT NEW.status BEGIN
+        UPDATE job_counts SET n = n - 1 WHERE status = OLD.status;
+        INSERT INTO job_counts (status, n) VALUES (NEW.status, 1)
+        ON CONFLICT(status) DO UPDATE SET n = n + 1;
+    END
+    """,
+)
+
+_RECOUNT = (
+    "DELETE FROM job_counts",
+    "INSERT INTO job_counts (status, n) SELECT status, COUNT(*) FROM jobs GROUP BY status",
+)
+
+# Created after the column migration so databases from before leases work
+_LEASE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(status, lease_expires_at)"
+)
+
+_COLUMNS = (
+    "id",
+    "status",
+    "created_at",
+    "started_at",
+    "completed_at",
+    "worker_id",
+    "attempts",
+    "last_error",
+    "lease_expires_at",
+)
+
+
+def _job(row: sqlite3.Row) -> Dict:
+    """Row -> job dict, omitting unset optional fields like the file layout did."""
+    return {k: row[k] for k in row.keys() if row[k] is not None or k == "attempts"}
 
-            with open(job_file, "w") as f:
-                json.dump(job, f)
 
-    def fail_job(self, job_id: str, error: str):
-        """Mark job as failed."""
-        job_file = self.jobs_dir / f"{job_id}.json"
-        if job_file.exists():
-            with open(job_file, "r") as f:
-                job = json.load(f)
+class JobQueue:
+    """SQLite job queue (WAL mode, safe across threads and processes)."""
+
+    def __init__(self, db_path: Optional[str] = None, lease_seconds: float = LEASE_SECONDS):
+        """
+        Args:
+            db_path: SQLite database file (default: data/job_queue.db)
+            lease_seconds: How long a claim or heartbeat holds a job
+        """
+        self.db_path = db_path or DB_PATH
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection, opened (and the schema created) on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            cols = {r["name"] for r in conn.execute("PRAGMA table_info(jobs)")}
+            if "lease_expires_at" not in cols:
+                conn.execute("ALTER TABLE jobs ADD COLUMN lease_expires_at REAL")
+            conn.execute(_LEASE_INDEX)
+            self._local.conn = conn
+            if conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'trg_jobs_count_update'"
+            ).fetchone() is None:
+                # First open since counters were added: create and seed them
+                # in one transaction so no status change slips in between
+                self._write(lambda c: [c.execute(q) for q in _COUNTERS + _RECOUNT])
+        return conn
+
+    def recount(self) -> Dict:
+        """Rebuild the status counters from the jobs table; returns the stats."""
+        self._write(lambda c: [c.execute(q) for q in _RECOUNT])
+        return self.get_stats()
+
+    def _write(self, fn):
+        """Run ``fn(conn)`` in one IMMEDIATE transaction and return its result."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
-            job["attempts"] += 1
-            job["last_error"] = error
+    def add_jobs(self, paper_ids: List[str]) -> int:
+        """Add jobs to queue (existing IDs are left untouched)."""
+        now = datetime.now().isoformat()
+        return self._write(
+            lambda conn: conn.executemany(
+                "INSERT OR IGNORE INTO jobs (id, status, created_at, attempts) "
+                "VALUES (?, 'pending', ?, 0)",
+                ((pid, now) for pid in paper_ids),
+            ).rowcount
+        )
 
-            if job["attempts"] >= 3:
-                job["status"] = "failed"
-            else:
-                job["status"] = "pending"
+    def claim_job(self, worker_id: str) -> Optional[Dict]:
+        """
+        Lease the oldest pending job atomically.
+
+        Expired leases are returned to the queue first, so work held by a
+        crashed worker is picked up again without a manual reset.
+        """
+
+        def _claim(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
+            now = time.time()
+            self._expire_leases(conn, now)
+            self._touch_worker(conn, worker_id, now)
+            return conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'in_progress', worker_id = ?, started_at = ?,
+                    lease_expires_at = ?
+                WHERE rowid = (
+                    SELECT rowid FROM jobs WHERE status = 'pending' ORDER BY rowid LIMIT 1
+                )
+                RETURNING *
+                """,
+                (worker_id, datetime.fromtimestamp(now).isoformat(), now + self.lease_seconds),
+            ).fetchone()
+
+        row = self._write(_claim)
+        return _job(row) if row else None
+
+    def _expire_leases(self, conn: sqlite3.Connection, now: float) -> int:
+        """Requeue in-progress jobs whose lease has run out (counts an attempt)."""
+        return conn.execute(
+            """
+            UPDATE jobs
+            SET attempts = attempts + 1,
+                last_error = 'lease expired (worker ' || COALESCE(worker_id, '?') || ')',
+                status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END,
+                lease_expires_at = NULL
+            WHERE status = 'in_progress' AND lease_expires_at < ?
+            """,
+            (MAX_ATTEMPTS, now),
+        ).rowcount
+
+    def _touch_worker(self, conn: sqlite3.Connection, worker_id: str, now: float) -> None:
+        conn.execute(
+            """
+            INSERT INTO workers (worker_id, first_seen, last_heartbeat) VALUES (?, ?, ?)
+            ON CONFLICT(worker_id) DO UPDATE SET last_heartbeat = excluded.last_heartbeat
+            """,
+            (worker_id, now, now),
+        )
+
+    def update_heartbeat(self, worker_id: str) -> int:
+        """
+        Record that a worker is alive and renew the leases it holds.
+
+        Returns:
+            Number of job leases renewed
+        """
+
+        def _beat(conn: sqlite3.Connection) -> int:
+            now = time.time()
+            self._touch_worker(conn, worker_id, now)
+            return conn.execute(
+                """
+                UPDATE jobs SET lease_expires_at = ?
+                WHERE status = 'in_progress' AND worker_id = ?
+                """,
+                (now + self.lease_seconds, worker_id),
+            ).rowcount
+
+        return self._write(_beat)
+
+    def increment_worker_jobs(self, worker_id: str, failed: bool = False) -> None:
+        """Count a finished (or failed) job towards a worker's throughput."""
+        column = "jobs_failed" if failed else "jobs_completed"
+
+        def _inc(conn: sqlite3.Connection) -> None:
+            now = time.time()
+            self._touch_worker(conn, worker_id, now)
+            conn.execute(
+                f"UPDATE workers SET {column} = {column} + 1 WHERE worker_id = ?",
+                (worker_id,),
+            )
+
+        self._write(_inc)
+
+    def get_worker_stats(self, active_within: float = 2 * LEASE_SECONDS) -> List[Dict]:
+        """
+        Per-worker counters, most recently seen first.
+
+        Args:
+            active_within: Seconds since the last heartbeat for a worker to
+                count as active
+
+        Returns:
+            Dicts with worker_id, active, jobs_completed, jobs_failed,
+            jobs_per_hour and last_heartbeat (epoch seconds)
+        """
+        now = time.time()
+        out = []
+        for r in self._conn().execute(
+            "SELECT * FROM workers ORDER BY last_heartbeat DESC"
+        ):
+            hours = max(r["last_heartbeat"] - r["first_seen"], 1.0) / 3600
+            out.append(
+                {
+                    "worker_id": r["worker_id"],
+                    "active": now - r["last_heartbeat"] <= active_within,
+                    "jobs_completed": r["jobs_completed"],
+                    "jobs_failed": r["jobs_failed"],
+                    "jobs_per_hour": r["jobs_completed"] / hours,
+                    "last_heartbeat": r["last_heartbeat"],
+                }
+            )
+        return out
 
-            with open(job_file, "w") as f:
-                json.dump(job, f)
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Return one job, or None if it does not exist."""
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _job(row) if row else None
+
+    def complete_job(
+        self, job_id: str, worker_id: Optional[str] = None, model: Optional[str] = None
+    ):
+        """
+        Mark job as completed.
+
+        Args:
+            job_id: Job (paper) ID
+            worker_id: If given, only complete the job while this worker
+                still holds it
+            model: Translation model, recorded for per-model throughput
+        """
+
+        def _complete(conn: sqlite3.Connection) -> None:
+            now = time.time()
+            row = conn.execute(
+                """
+                UPDATE jobs SET status = 'completed', completed_at = ?, lease_expires_at = NULL
+                WHERE id = ? AND status != 'completed' AND (? IS NULL OR worker_id = ?)
+                RETURNING worker_id, started_at
+                """,
+                (datetime.fromtimestamp(now).isoformat(), job_id, worker_id, worker_id),
+            ).fetchone()
+            # Only jobs a worker actually ran count towards throughput
+            started = iso_to_epoch(row["started_at"]) if row else None
+            if started is None:
+                return
+            conn.execute(
+                "INSERT INTO completions (ts, job_id, worker_id, model, seconds) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (now, job_id, row["worker_id"], model, now - started),
+            )
+            conn.execute(
+                "DELETE FROM completions WHERE ts < ?", (now - COMPLETIONS_RETENTION,)
+            )
+
+        self._write(_complete)
+
+    def fail_job(self, job_id: str, error: str, worker_id: Optional[str] = None):
+        """
+        Mark job as failed (back to pending until it has used its attempts).
+
+        Args:
+            job_id: Job (paper) ID
+            error: Error message to record
+            worker_id: If given, ignore the failure unless this worker still
+                holds the job (its lease may have been reclaimed)
+        """
+        self._conn().execute(
+            """
+            UPDATE jobs
+            SET attempts = attempts + 1,
+                last_error = ?,
+                status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END,
+                lease_expires_at = NULL
+            WHERE id = ? AND (? IS NULL OR (worker_id = ? AND status = 'in_progress'))
+            """,
+            (error, MAX_ATTEMPTS, job_id, worker_id, worker_id),
+        )
 
     def get_stats(self) -> Dict:
-        """Get job statistics."""
-        stats = {
-            "total": 0,
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "failed": 0,
-        }
-
-        for job_file in self.jobs_dir.glob("*.json"):
-            with open(job_file, "r") as f:
-                job = json.load(f)
-
-            stats["total"] += 1
-            stats[job["status"]] += 1
-
+        """Get job statistics (from the materialized counters)."""
+        stats = {"total": 0, **{s: 0 for s in STATUSES}}
+        for status, count in self._conn().execute("SELECT status, n FROM job_counts"):
+            stats[status] = count
+            stats["total"] += count
         return stats
 
+    def get_throughput(self, window: Optional[float] = None) -> Dict:
+        """
+        Rolling-window throughput (overall, per worker, per model) and ETA.
+
+        Args:
+            window: Window in seconds (default: config throughput.window_seconds)
+
+        Returns:
+            See :func:`src.throughput.summarize`; ``remaining`` is pending
+            plus in-progress jobs
+        """
+        window = window_seconds() if window is None else window
+        now = time.time()
+        events = self._conn().execute(
+            "SELECT ts, worker_id, model, seconds FROM completions WHERE ts >= ?",
+            (now - window,),
+        ).fetchall()
+        stats = self.get_stats()
+        return summarize(
+            [tuple(e) for e in events],
+            remaining=stats["pending"] + stats["in_progress"],
+            window=window,
+            now=now,
+        )
+
     def cleanup_completed(self, days: int = 7):
         """Clean up completed jobs older than specified days."""
-        cutoff = datetime.now() - timedelta(days=days)
-
-        for job_file in self.jobs_dir.glob("*.json"):
-            with open(job_file, "r") as f:
-                job = json.load(f)
-
-            if job["status"] == "completed":
-                try:
-                    completed_at = datetime.fromisoformat(job.get("completed_at", ""))
-                    if completed_at < cutoff:
-                        job_file.unlink()
-                except ValueError:
-                    continue
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        self._conn().execute(
+            "DELETE FROM jobs WHERE status = 'completed' AND completed_at < ?", (cutoff,)
+        )
 
     # --- Added helpers for CLI parity ---
     def get_recent_completions(self, limit: int = 5) -> List[Dict]:
         """Return recent completed jobs with metadata sorted by completion time desc."""
-        items: List[Dict] = []
-        for job_file in self.jobs_dir.glob("*.json"):
-            try:
-                with open(job_file, "r") as f:
-                    job = json.load(f)
-            except Exception:
-                continue
-            if job.get("status") == "completed":
-                items.append(
-                    {
-                        "paper_id": job.get("id"),
-                        "worker_id": job.get("worker_id"),
-                        "completed_at": job.get("completed_at"),
-                    }
-                )
-
-        # Sort by completed_at desc
-        def _key(j: Dict):
-            try:
-                return datetime.fromisoformat((j.get("completed_at") or ""))
-            except Exception:
-                return datetime.min
-
-        items.sort(key=_key, reverse=True)
-        return items[:limit]
+        rows = self._conn().execute(
+            """
+            SELECT id, worker_id, completed_at FROM jobs
+            WHERE status = 'completed'
+            ORDER BY completed_at DESC LIMIT ?
+            """,
+            (limit,),
+        )
+        return [
+            {
+                "paper_id": r["id"],
+                "worker_id": r["worker_id"],
+                "completed_at": r["completed_at"],
+            }
+            for r in rows
+        ]
 
     def reset_stuck_jobs(self, timeout_minutes: int = 10) -> int:
-        """Reset in-progress jobs that have been running longer than timeout to pending."""
-        cutoff = datetime.now() - timedelta(minutes=timeout_minutes)
-        reset = 0
-        for job_file in self.jobs_dir.glob("*.json"):
-            try:
-                with open(job_file, "r") as f:
-                    job = json.load(f)
-            except Exception:
-                continue
-            if job.get("status") != "in_progress":
-                continue
-            started_at = job.get("started_at")
-            try:
-                started_dt = datetime.fromisoformat(started_at) if started_at else None
-            except Exception:
-                started_dt = None
-            if (started_dt is None) or (started_dt < cutoff):
-                job["status"] = "pending"
-                # keep attempts and last_error
-                with open(job_file, "w") as f:
-                    json.dump(job, f)
-                reset += 1
-        return reset
+        """
+        Return abandoned in-progress jobs to pending.
+
+        Jobs with a lease are reset only once the lease has expired, however
+        long they have been running. ``timeout_minutes`` applies to jobs
+        claimed before leases existed (no lease recorded).
+        """
+        cutoff = (datetime.now() - timedelta(minutes=timeout_minutes)).isoformat()
+
+        def _reset(conn: sqlite3.Connection) -> int:
+            expired = self._expire_leases(conn, time.time())
+            # keep attempts and last_error
+            legacy = conn.execute(
+                """
+                UPDATE jobs SET status = 'pending'
+                WHERE status = 'in_progress' AND lease_expires_at IS NULL
+                  AND (started_at IS NULL OR started_at < ?)
+                """,
+                (cutoff,),
+            ).rowcount
+            return expired + legacy
+
+        return self._write(_reset)
 
     def get_failed_jobs(self) -> List[Dict]:
         """Return list of failed jobs with attempts and error."""
-        out: List[Dict] = []
-        for job_file in self.jobs_dir.glob("*.json"):
-            try:
-                with open(job_file, "r") as f:
-                    job = json.load(f)
-            except Exception:
-                continue
-            if job.get("status") == "failed":
-                out.append(
-                    {
-                        "paper_id": job.get("id"),
-                        "attempts": job.get("attempts", 0),
-                        "error": job.get("last_error") or job.get("error"),
-                    }
-                )
-        return out
+        rows = self._conn().execute(
+            "SELECT id, attempts, last_error FROM jobs WHERE status = 'failed' ORDER BY rowid"
+        )
+        return [
+            {"paper_id": r["id"], "attempts": r["attempts"], "error": r["last_error"]}
+            for r in rows
+        ]
 
     def reset_failed_jobs(self) -> int:
         """Reset failed jobs back to pending. Returns number reset."""
-        reset = 0
-        for job_file in self.jobs_dir.glob("*.json"):
+        cur = self._conn().execute(
+            "UPDATE jobs SET status = 'pending' WHERE status = 'failed'"
+        )
+        return cur.rowcount
+
+    def get_pending_job_ids(self) -> List[str]:
+        """Get all pending job IDs without loading full job data."""
+        rows = self._conn().execute(
+            "SELECT id FROM jobs WHERE status = 'pending' ORDER BY rowid"
+        )
+        return [r[0] for r in rows]
+
+    def migrate_from_files(self, jobs_dir: str = LEGACY_JOBS_DIR) -> int:
+        """
+        Import jobs from the one-file-per-job layout.
+
+        Jobs already in the database are kept as they are. Files are imported
+        oldest ``created_at`` first so claim order is preserved.
+
+        Returns:
+            Number of jobs imported
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for job_file in Path(jobs_dir).glob("*.json"):
             try:
                 with open(job_file, "r") as f:
                     job = json.load(f)
-            except Exception:
+            except (OSError, json.JSONDecodeError):
+                log(f"Skipping unreadable job file {job_file}")
                 continue
-            if job.get("status") == "failed":
-                job["status"] = "pending"
-                with open(job_file, "w") as f:
-                    json.dump(job, f)
-                reset += 1
-        return reset
-
-    # Removed legacy duplicate helpers below in favor of the unified versions above
-
-    def get_pending_job_ids(self) -> List[str]:
-        """Get all pending job IDs without loading full job data."""
-        pending_ids = []
-        for job_file in self.jobs_dir.glob("*.json"):
-            with open(job_file, "r") as f:
-                job = json.load(f)
-
-            if job["status"] == "pending":
-                pending_ids.append(job["id"])
+            if not job.get("id"):
+                continue
+            status = job.get("status")
+            rows.append(
+                (
+                    job["id"],
+                    status if status in STATUSES else "pending",
+                    job.get("created_at") or now,
+                    job.get("started_at"),
+                    job.get("completed_at"),
+                    job.get("worker_id"),
+                    int(job.get("attempts") or 0),
+                    job.get("last_error") or job.get("error"),
+                    None,
+                )
+            )
+        rows.sort(key=lambda r: (r[2], r[0]))
 
-        return pending_ids
+        return self._write(
+            lambda conn: conn.executemany(
+                f"INSERT OR IGNORE INTO jobs ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                rows,
+            ).rowcount
+        )
 
 
 # Global job queue instance
@@ -255,16 +564,55 @@ def claim_job(worker_id: str) -> Optional[Dict]:
     return job_queue.claim_job(worker_id)
 
 
-def complete_job(job_id: str):
+def complete_job(job_id: str, worker_id: Optional[str] = None, model: Optional[str] = None):
     """Convenience function to complete a job."""
-    job_queue.complete_job(job_id)
+    job_queue.complete_job(job_id, worker_id=worker_id, model=model)
 
 
-def fail_job(job_id: str, error: str):
+def fail_job(job_id: str, error: str, worker_id: Optional[str] = None):
     """Convenience function to fail a job."""
-    job_queue.fail_job(job_id, error)
+    job_queue.fail_job(job_id, error, worker_id=worker_id)
+
+
+def update_heartbeat(worker_id: str) -> int:
+    """Convenience function to renew a worker's leases."""
+    return job_queue.update_heartbeat(worker_id)
+
+
+def increment_worker_jobs(worker_id: str, failed: bool = False) -> None:
+    """Convenience function to count a worker's finished job."""
+    job_queue.increment_worker_jobs(worker_id, failed=failed)
 
 
 def get_stats() -> Dict:
     """Convenience function to get job statistics."""
     return job_queue.get_stats()
+
+
+def run_cli() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Translation job queue")
+    parser.add_argument("--db", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_migrate = sub.add_parser("migrate", help="Import data/jobs/*.json into the database")
+    p_migrate.add_argument("--jobs-dir", default=LEGACY_JOBS_DIR)
+    sub.add_parser("stats", help="Show job counts")
+    sub.add_parser("recount", help="Rebuild the status counters from the jobs table")
+    p_rate = sub.add_parser("throughput", help="Show rolling throughput and ETA")
+    p_rate.add_argument("--window", type=float, default=None, help="Window in seconds")
+    args = parser.parse_args()
+
+    queue = JobQueue(args.db)
+    if args.command == "migrate":
+        n = queue.migrate_from_files(args.jobs_dir)
+        log(f"Imported {n} jobs from {args.jobs_dir} into {args.db}")
+    elif args.command == "recount":
+        queue.recount()
+    elif args.command == "throughput":
+        print(json.dumps(queue.get_throughput(args.window), indent=2))
+        return
+    print(json.dumps(queue.get_stats()))
+
+
+if __name__ == "__main__":
+    run_cli()
@@ -5,6 +5,7 @@ import glob
 import os
 import shutil
 import subprocess
+from typing import List, Optional
 
 from .utils import log
 
@@ -21,11 +22,11 @@ def md_to_pdf(md_path: str, pdf_path: str) -> bool:
         return False
 
 
-def run_cli() -> None:
+def run_cli(argv: Optional[List[str]] = None) -> None:
     parser = argparse.ArgumentParser(
         description="Generate PDFs from rendered Markdown using pandoc if available."
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not has_binary("pandoc"):
         log("pandoc not found; skipping PDF generation")
@@ -4,7 +4,6 @@ Monitoring dashboard for ChinaXiv Translations.
 """
 
 import os
-import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -14,6 +13,7 @@ import requests
 from flask import Flask, render_template_string, request, jsonify, Response
 from werkzeug.security import check_password_hash
 
+from .job_queue import JobQueue
 from .monitoring import monitoring_service
 
 # Configuration
@@ -36,6 +36,7 @@ class JobStats:
     failed: int
     progress_percent: float
     estimated_completion: Optional[str] = None
+    jobs_per_hour: float = 0.0
 
 
 @dataclass
@@ -284,56 +285,42 @@ class MonitoringDashboard:
         return render_template_string(self.get_login_template())
 
     def get_job_stats(self) -> JobStats:
-        """Get job statistics from database."""
+        """Get job statistics from the queue's counters and recent throughput."""
         try:
             db_path = Path("data/job_queue.db")
             if not db_path.exists():
                 print(f"Warning: Database not found at {db_path}")
                 return JobStats(0, 0, 0, 0, 0.0)
 
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-
-                # Get total jobs
-                cursor.execute("SELECT COUNT(*) FROM jobs")
-                total = cursor.fetchone()[0]
-
-                # Get completed jobs
-                cursor.execute("SELECT COUNT(*) FROM jobs WHERE status = 'completed'")
-                completed = cursor.fetchone()[0]
-
-                # Get pending jobs
-                cursor.execute("SELECT COUNT(*) FROM jobs WHERE status = 'pending'")
-                pending = cursor.fetchone()[0]
-
-                # Get failed jobs
-                cursor.execute("SELECT COUNT(*) FROM jobs WHERE status = 'failed'")
-                failed = cursor.fetchone()[0]
-
-                # Calculate progress
-                progress_percent = (completed / total * 100) if total > 0 else 0.0
-
-                # Estimate completion time
-                estimated_completion = None
-                if pending > 0 and completed > 0:
-                    # Simple estimation based on current rate
-                    avg_time_per_job = 30  # seconds (rough estimate)
-                    remaining_seconds = pending * avg_time_per_job
-                    estimated_completion = datetime.now() + timedelta(
-                        seconds=remaining_seconds
-                    )
-                    estimated_completion = estimated_completion.strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-
-                return JobStats(
-                    total=total,
-                    completed=completed,
-                    pending=pending,
-                    failed=failed,
-                    progress_percent=progress_percent,
-                    estimated_completion=estimated_completion,
-                )
+            queue = JobQueue(str(db_path))
+            try:
+                stats = queue.get_stats()
+                rate = queue.get_throughput()
+            finally:
+                queue.close()
+
+            total = stats["total"]
+            completed = stats["completed"]
+
+            # Calculate progress
+            progress_percent = (completed / total * 100) if total > 0 else 0.0
+
+            # Estimate completion time from the rolling completion rate
+            estimated_completion = None
+            if stats["pending"] > 0 and rate["eta_seconds"] is not None:
+                estimated_completion = (
+                    datetime.now() + timedelta(seconds=rate["eta_seconds"])
+                ).strftime("%Y-%m-%d %H:%M:%S")
+
+            return JobStats(
+                total=total,
+                completed=completed,
+                pending=stats["pending"],
+                failed=stats["failed"],
+                progress_percent=progress_percent,
+                estimated_completion=estimated_completion,
+                jobs_per_hour=round(rate["jobs_per_hour"], 1),
+            )
 
         except Exception as e:
             print(f"Error getting job stats: {e}")
@@ -494,6 +481,10 @@ class MonitoringDashboard:
                     <div class="progress-bar">
                         <div class="progress-fill" id="progressBar" style="width: 0%"></div>
                     </div>
+                    <div class="stat">
+                        <span>Throughput:</span>
+                        <span class="stat-value" id="jobsPerHour">-</span>
+                    </div>
                     <div class="stat">
                         <span>Est. Completion:</span>
                         <span class="stat-value" id="estimatedCompletion">-</span>
@@ -551,6 +542,7 @@ class MonitoringDashboard:
                     document.getElementById('progressPercent').textContent = data.progress_percent.toFixed(1) + '%';
                     document.getElementById('progressBar').style.width = data.progress_percent + '%';
                     document.getElementById('estimatedCompletion').textContent = data.estimated_completion || 'Unknown';
+                    document.getElementById('jobsPerHour').textContent = data.jobs_per_hour + ' jobs/h';
                 })
                 .catch(error => console.error('Error fetching stats:', error));
             
@@ -11,13 +11,12 @@ import os
 import json
 import shutil
 import subprocess
-import time
 from collections import Counter
 from typing import Any, Dict, List, Optional
 
-from tenacity import retry, stop_after_attempt, wait_exponential
-from .http_client import get_session
-from .config import get_proxies, get_config
+from .http_client import stream_download
+from .prefetch import Prefetcher
+from .config import get_config
 from .body_extract import extract_from_pdf
 from .utils import log, read_json, write_json
 
@@ -27,11 +26,13 @@ except ImportError:  # pragma: no cover
     fcntl = None  # type: ignore
 
 
-@retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3))
 def download_pdf(url: str, output_path: str) -> bool:
     """
     Download a PDF from a URL with validation.
 
+    Streams to disk through the pooled session, so memory use does not grow
+    with the size of the PDF. Interrupted transfers resume via Range requests.
+
     Args:
         url: PDF URL
         output_path: Local path to save PDF
@@ -39,47 +40,15 @@ def download_pdf(url: str, output_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    max_mb = float((get_config().get("downloads") or {}).get("max_pdf_mb", 200))
     try:
-        session = get_session()
-        proxies, source = get_proxies()
-        kwargs = {
-            "timeout": 60,
-            "stream": True,
-            "allow_redirects": True,
-        }
-        if source == "config" and proxies:
-            kwargs["proxies"] = proxies
-
-        resp = session.get(url, **kwargs)
-        resp.raise_for_status()
-
-        # Validate PDF content
-        content_type = resp.headers.get('content-type', '').lower()
-        if 'pdf' not in content_type and not resp.content.startswith(b'%PDF-'):
-            log(f"Invalid PDF content type for {url}: {content_type}")
-            return False
-
-        # Check file size (minimum 1KB)
-        content_length = len(resp.content)
-        if content_length < 1024:
-            log(f"PDF too small for {url}: {content_length} bytes")
-            return False
-
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-        with open(output_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if not chunk:
-                    continue
-                f.write(chunk)
-
-        # Verify downloaded file
-        if os.path.getsize(output_path) < 1024:
-            log(f"Downloaded PDF too small: {output_path}")
-            os.remove(output_path)
-            return False
-
-        return True
+        return stream_download(
+            url,
+            output_path,
+            expect_pdf=True,
+            min_bytes=1024,
+            max_bytes=int(max_mb * 1024 * 1024),
+        )
     except Exception as e:
         log(f"Failed to download {url}: {e}")
         return False
@@ -90,36 +59,88 @@ def fix_pdf_url(pdf_url: str, paper_id: str) -> str:
     return pdf_url
 
 
+OCR_REPORT_FILE = "ocr_report.json"
+OCR_REPORT_LOG = "ocr_report.jsonl"
+# Fold the append log into the aggregate once it grows past this size
+OCR_LOG_COMPACT_BYTES = 4 * 1024 * 1024
+
+
+def _lock(fh) -> None:
+    if fcntl:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+
+
+def _unlock(fh) -> None:
+    if fcntl:
+        try:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+        except OSError:
+            pass
+
+
 def _write_ocr_record(report_dir: str, paper_id: str, record: Dict[str, Any]) -> None:
-    """Persist OCR detection/execution details with coarse file locking."""
-    report_path = os.path.join(report_dir, "ocr_report.json")
+    """
+    Append one paper's OCR detection/execution details to the report log.
+
+    Costs one short locked append per paper (no read-modify-write); the
+    aggregate ``ocr_report.json`` is rebuilt by :func:`compact_ocr_report`.
+    """
     os.makedirs(report_dir, exist_ok=True)
-    fh = open(report_path, "a+", encoding="utf-8")
-    try:
-        if fcntl:
-            fcntl.flock(fh, fcntl.LOCK_EX)
-        fh.seek(0)
-        raw = fh.read()
-        data: Dict[str, Any] = {}
-        if raw:
-            try:
-                data = json.loads(raw)
-            except json.JSONDecodeError:
-                log(f"OCR report malformed; resetting {report_path}")
-                data = {}
-        data[paper_id] = record
-        fh.seek(0)
-        fh.truncate()
-        json.dump(data, fh, indent=2, ensure_ascii=False)
-        fh.flush()
-        os.fsync(fh.fileno())
-    finally:
-        if fcntl:
-            try:
-                fcntl.flock(fh, fcntl.LOCK_UN)
-            except OSError:
-                pass
-        fh.close()
+    log_path = os.path.join(report_dir, OCR_REPORT_LOG)
+    line = json.dumps({"id": paper_id, "record": record}, ensure_ascii=False) + "\n"
+    with open(log_path, "a", encoding="utf-8") as fh:
+        _lock(fh)
+        try:
+            fh.write(line)
+            fh.flush()
+            size = os.fstat(fh.fileno()).st_size
+        finally:
+            _unlock(fh)
+    if size >= OCR_LOG_COMPACT_BYTES:
+        compact_ocr_report(report_dir)
+
+
+def compact_ocr_report(report_dir: str = "reports") -> Dict[str, Any]:
+    """
+    Fold ``ocr_report.jsonl`` into ``ocr_report.json`` and truncate the log.
+
+    Later entries for the same paper win. Returns the aggregate mapping
+    paper_id -> record, which is what ``validators.ocr_gate`` consumes.
+    """
+    report_path = os.path.join(report_dir, OCR_REPORT_FILE)
+    log_path = os.path.join(report_dir, OCR_REPORT_LOG)
+
+    def _load_aggregate() -> Dict[str, Any]:
+        if not os.path.exists(report_path):
+            return {}
+        try:
+            return read_json(report_path)
+        except (OSError, json.JSONDecodeError):
+            log(f"OCR report malformed; rebuilding {report_path} from log")
+            return {}
+
+    if not os.path.exists(log_path):
+        return _load_aggregate()
+
+    with open(log_path, "r+", encoding="utf-8") as fh:
+        # Hold the log lock across read-fold-write so concurrent compactions
+        # and appends cannot drop entries
+        _lock(fh)
+        try:
+            data = _load_aggregate()
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                    data[entry["id"]] = entry["record"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # torn tail from a crashed writer
+            write_json(report_path, data)
+            fh.seek(0)
+            fh.truncate()
+            os.fsync(fh.fileno())
+        finally:
+            _unlock(fh)
+    return data
 
 
 def _compute_text_metrics(paragraphs: List[str]) -> Dict[str, float]:
@@ -305,6 +326,7 @@ def process_paper(
         pass
 
     ocr_record["post_ocr_chars"] = total_chars
+    ocr_record["num_paragraphs"] = len(paragraphs)
     _write_ocr_record(report_dir, paper_id, ocr_record)
 
     return result
@@ -332,26 +354,36 @@ def batch_download_and_extract(
     records = read_json(records_file)
     id_to_rec = {r["id"]: r for r in records}
 
-    results = {}
-
+    todo = []
     for paper_id in paper_ids:
         if paper_id not in id_to_rec:
             log(f"Paper {paper_id} not found in records")
             continue
-
-        rec = id_to_rec[paper_id]
-        pdf_url = rec.get("pdf_url")
-
+        pdf_url = id_to_rec[paper_id].get("pdf_url")
         if not pdf_url:
             log(f"No PDF URL for {paper_id}")
             continue
+        todo.append((paper_id, pdf_url))
 
-        result = process_paper(paper_id, pdf_url, pdf_dir)
-        if result:
-            results[paper_id] = result
+    # Downloads go through the prefetcher (per-host limits + shared rate
+    # budget); extraction/OCR for one paper overlaps other papers' downloads.
+    prefetcher = Prefetcher.from_config()
 
-        # Optional pacing for remote servers
-        time.sleep(0.2)
+    def _fetch_and_process(item):
+        paper_id, pdf_url = item
+        pdf_path = os.path.join(pdf_dir, f"{paper_id}.pdf")
+        if not os.path.exists(pdf_path):
+            log(f"Downloading {paper_id}...")
+            if not prefetcher.fetch(fix_pdf_url(pdf_url, paper_id), download_pdf, pdf_path):
+                return None
+        return process_paper(paper_id, pdf_url, pdf_dir)
+
+    results = {}
+    for (paper_id, _url), result, err in prefetcher.run(_fetch_and_process, todo):
+        if err is not None:
+            log(f"Failed to process {paper_id}: {err}")
+        elif result:
+            results[paper_id] = result
 
     # Save results
     if output_file:
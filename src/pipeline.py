@@ -1,19 +1,261 @@
+"""
+End-to-end pipeline: select, fetch, translate, QA, then render the site.
+
+Papers stream through an in-process stage graph (see ``stage_graph.py``):
+
+    select -> abstract -> download -> extract -> translate -> format -> qa -> persist
+
+Each stage has its own thread count (``pipeline.concurrency`` in
+``config.yaml``) and bounded queues between stages apply backpressure, so a
+paper is written to ``data/translated`` while later papers are still
+downloading. The ``abstract`` stage publishes each paper's title and
+abstract before its PDF is fetched; ``persist`` upgrades the page in place
+with the full text (see ``publish.py``). Render, search index and PDF
+generation run in-process once the graph drains.
+"""
+
 from __future__ import annotations
 
 import argparse
 import glob
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 
+from .config import get_config
+from .publish import PHASE_FULL, mark_phase, publish_config, publish_page
+from .stage_graph import Stage, StageGraph
 from .utils import log
 from .discord_alerts import DiscordAlerts
 
+STAGES = (
+    "select",
+    "abstract",
+    "download",
+    "extract",
+    "translate",
+    "format",
+    "qa",
+    "persist",
+)
+STAGE_CONCURRENCY = {
+    "select": 1,
+    "abstract": 4,
+    "download": 8,
+    "extract": 2,
+    "translate": 20,
+    "format": 4,
+    "qa": 2,
+    "persist": 1,
+}
+QUEUE_SIZE = 8
+
 
 def find_latest_records_json() -> Optional[str]:
     files = sorted(glob.glob(os.path.join("data", "records", "*.json")))
     return files[-1] if files else None
 
 
+def stage_config() -> Dict[str, Any]:
+    """``pipeline`` config section: per-stage ``concurrency`` and ``queue_size``."""
+    cfg = get_config().get("pipeline") or {}
+    concurrency = {**STAGE_CONCURRENCY, **(cfg.get("concurrency") or {})}
+    return {
+        "concurrency": {name: max(1, int(concurrency[name])) for name in STAGES},
+        "queue_size": max(1, int(cfg.get("queue_size", QUEUE_SIZE))),
+    }
+
+
+class PaperStages:
+    """
+    Stage functions for one pipeline run.
+
+    Each stage takes and returns a work item ``{"id", "record", ...}``;
+    later stages add ``metadata`` (the abstract-phase translation),
+    ``paragraphs``, ``translation``, ``path`` and ``qa_passed``.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        dry_run: bool = False,
+        with_qa: bool = False,
+        limit: Optional[int] = None,
+        seen: Any = None,
+        discover_sources: bool = False,
+        prefetcher: Any = None,
+        abstract_first: bool = True,
+        render_pages: bool = False,
+    ):
+        """
+        Args:
+            service: TranslationService
+            dry_run: Skip actual translation
+            with_qa: Also sort results into data/translated and data/flagged
+            limit: Stop selecting after this many papers
+            seen: SeenStore; papers that reach ``persist`` are skipped next time,
+                failed ones are picked up again (None = no dedupe)
+            discover_sources: Look for LaTeX archives on landing pages while downloading
+            prefetcher: Prefetcher for downloads (default: from config)
+            abstract_first: Translate and save title/abstract before the body
+            render_pages: Render each item page as soon as a phase is saved
+        """
+        from .prefetch import Prefetcher
+        from .services.formatting_service import FormattingService
+
+        self.service = service
+        self.dry_run = dry_run
+        self.with_qa = with_qa
+        self.limit = limit
+        self.seen = seen
+        self.discover_sources = discover_sources
+        self.prefetcher = prefetcher or Prefetcher.from_config()
+        self.abstract_first = abstract_first
+        self.render_pages = render_pages
+        self.formatter = FormattingService(service.config)
+        self.selected: List[Dict[str, Any]] = []
+        self._picked: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def select(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Pick a record (or look up a queued paper ID); None skips it."""
+        pid = item.get("id")
+        if not pid:
+            return None
+        with self._lock:
+            if self.limit and len(self.selected) >= self.limit:
+                return None
+            if self.seen is not None:
+                # Marked seen only once persisted: a paper failing in a later
+                # stage (its abstract page already up) is retried next run
+                if pid in self.seen or pid in self._picked:
+                    return None
+                self._picked.add(pid)
+            self.selected.append(item)
+        record = item if "title" in item or "abstract" in item else None
+        return {"id": pid, "record": record or self.service.load_record(pid)}
+
+    def abstract(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        """Publish title, abstract and metadata ahead of the full text."""
+        if self.abstract_first:
+            metadata = self.service.translate_abstract(
+                work["record"], self.formatter, dry_run=self.dry_run
+            )
+            work["metadata"] = metadata
+            if metadata is not None and self.render_pages:
+                publish_page(metadata)
+        return work
+
+    def download(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch the PDF (and LaTeX source when discovering) unless already fetched."""
+        rec = work["record"]
+        if rec.get("files"):
+            return work
+        if self.discover_sources:
+            from .select_and_fetch import fetch_record_files
+
+            rec["files"] = fetch_record_files(rec, self.prefetcher)
+        elif rec.get("pdf_url"):
+            from .pdf_pipeline import download_pdf, fix_pdf_url
+
+            pdf_path = os.path.join("data", "pdfs", f"{work['id']}.pdf")
+            if os.path.exists(pdf_path) or self.prefetcher.fetch(
+                fix_pdf_url(rec["pdf_url"], work["id"]), download_pdf, pdf_path
+            ):
+                rec["files"] = {"pdf_path": pdf_path}
+        return work
+
+    def extract(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract body paragraphs from the PDF (OCR if needed)."""
+        rec = work["record"]
+        files = rec.get("files") or {}
+        if rec.get("pdf_url") and not files.get("latex_source_path"):
+            result = self.service.attach_full_text(rec)
+            if result:
+                work["paragraphs"] = result["paragraphs"]
+        return work
+
+    def translate(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        log(f"Translating {work['id']}…")
+        work["translation"] = self.service.translate_record(
+            work["record"],
+            dry_run=self.dry_run,
+            force_full_text=True,
+            body_paragraphs=work.pop("paragraphs", None),
+            metadata=work.get("metadata"),
+        )
+        return work
+
+    def format(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        work["translation"] = self.formatter.format_translation(
+            work["translation"], dry_run=self.dry_run
+        )
+        return work
+
+    def qa(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        work["translation"] = self.service.check_quality(
+            work["translation"], self.formatter, dry_run=self.dry_run
+        )
+        return work
+
+    def persist(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        """Write the full translation, upgrade its page, then sort it by QA verdict."""
+        translation = mark_phase(
+            work.pop("translation"), PHASE_FULL, previous=work.pop("metadata", None)
+        )
+        work["path"] = self.service.save_translation(translation)
+        if self.render_pages:
+            publish_page(translation)
+        work["qa_passed"] = None
+        if self.with_qa and not self.dry_run:
+            from .qa_filter import filter_translation_file
+
+            qa_passed, qa_result = filter_translation_file(
+                translation, save_passed=True, save_flagged=True
+            )
+            work["qa_passed"] = qa_passed
+            if qa_passed:
+                log(f"  QA: PASS {work['id']} (score: {qa_result.score:.2f})")
+            else:
+                log(
+                    f"  QA: FLAGGED {work['id']} ({qa_result.status.value}, score: {qa_result.score:.2f})"
+                )
+        if self.seen is not None:
+            with self._lock:
+                self.seen.add(work["id"])
+        # Only the outcome travels to the consumer
+        work.pop("record", None)
+        return work
+
+    def graph(self, concurrency: Optional[Dict[str, int]] = None) -> StageGraph:
+        """Stage graph over these functions with config concurrency (overridable)."""
+        cfg = stage_config()
+        counts = {**cfg["concurrency"], **(concurrency or {})}
+        return StageGraph(
+            [Stage(name, getattr(self, name), counts[name]) for name in STAGES],
+            queue_size=cfg["queue_size"],
+        )
+
+
+def iter_records(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Records from JSON list files, one file at a time."""
+    from .file_service import read_json
+
+    for path in paths:
+        items = read_json(path)
+        if isinstance(items, list):
+            yield from items
+
+
+def publish_site() -> None:
+    """Render the site, search index and PDFs in this process."""
+    from . import make_pdf, render, search_index
+
+    render.run_cli([])
+    search_index.run_cli()
+    make_pdf.run_cli([])
+
+
 def run_cli() -> None:
     parser = argparse.ArgumentParser(
         description="Run end-to-end pipeline: select, translate, render."
@@ -23,7 +265,10 @@ def run_cli() -> None:
     )
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument(
-        "--workers", type=int, default=20, help="Parallel translation workers"
+        "--workers",
+        type=int,
+        default=None,
+        help="Parallel translation workers (default: config pipeline.concurrency.translate)",
     )
     parser.add_argument(
         "--records", type=str, help="Comma-separated records JSON paths (optional)"
@@ -38,6 +283,11 @@ def run_cli() -> None:
         action="store_true",
         help="Enable QA filtering (saves passed to data/translated/, flagged to data/flagged/)",
     )
+    parser.add_argument(
+        "--no-abstract-first",
+        action="store_true",
+        help="Publish papers only once the full text is done (default: config publish.abstract_first)",
+    )
     parser.add_argument(
         "--cloud-mode",
         action="store_true",
@@ -55,11 +305,83 @@ def run_cli() -> None:
         default="local-worker",
         help="Worker ID for cloud mode (default: local-worker)",
     )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Cloud mode: number of queue shard files under data/cloud_jobs/ (default: 1, single file)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=int,
+        default=None,
+        help="Cloud mode: shard this worker owns (default: from --worker-id)",
+    )
+    parser.add_argument(
+        "--steal",
+        action="store_true",
+        help="Cloud mode: claim from other shards once the own shard is empty "
+        "(only when all workers share one checkout of the shard files)",
+    )
+    parser.add_argument(
+        "--schedule",
+        choices=["fifo", "lpt", "spt"],
+        default=None,
+        help="Cloud mode: claim order by estimated cost - fifo, lpt (longest first) "
+        "or spt (shortest first) (default: config scheduling.policy)",
+    )
+    parser.add_argument(
+        "--batch-seconds",
+        type=float,
+        default=None,
+        help="Cloud mode: cap the batch at this many estimated seconds of work "
+        "(default: config scheduling.batch_seconds; batch size still applies)",
+    )
     args = parser.parse_args()
 
-    # Selection step (unless skipped and selected.json already exists)
+    from .services.translation_service import TranslationService
+    from .file_service import read_json, write_json
+
     selected_path = os.path.join("data", "selected.json")
-    if not args.skip_selection or not os.path.exists(selected_path):
+    limit = args.limit if args.limit and args.limit > 0 else None
+    seen = None
+    discover_sources = False
+    cloud_queue = None
+    if args.cloud_mode:
+        # Cloud mode: claim batch from cloud job queue (own shard first when sharded)
+        from .cloud_job_queue import job_cost, open_cloud_queue
+        from .job_estimates import scheduling_config
+
+        sched = scheduling_config()
+        policy = args.schedule or sched.get("policy") or "fifo"
+        budget = args.batch_seconds or sched.get("batch_seconds") or None
+        claim_args = {"policy": policy, "work_budget": budget}
+        if args.shards > 1:
+            claim_args["shard"] = args.shard
+            claim_args["steal"] = args.steal
+
+        cloud_queue = open_cloud_queue(args.shards)
+        log(f"Cloud mode: claiming batch of {args.batch_size} jobs ({policy})...")
+        jobs = cloud_queue.claim_batch(
+            args.worker_id, batch_size=args.batch_size, **claim_args
+        )
+
+        if not jobs:
+            log("No pending jobs in queue")
+            return
+
+        est_hours = sum(job_cost(job) for job in jobs) / 3600
+        log(f"Claimed {len(jobs)} jobs (~{est_hours:.1f} h estimated work)")
+        source: Iterable[Dict[str, Any]] = [{"id": job["paper_id"]} for job in jobs]
+        limit = None
+    elif args.skip_selection and os.path.exists(selected_path):
+        log("Skipping selection (data/selected.json present)")
+        selected = read_json(selected_path)
+        if not isinstance(selected, list) or not selected:
+            log("No selected papers to translate; exiting")
+            return
+        source = selected
+    else:
         rec_paths: list[str] = []
         if args.records:
             rec_paths = [p.strip() for p in args.records.split(",") if p.strip()]
@@ -72,168 +394,104 @@ def run_cli() -> None:
             log("No records available for selection; exiting")
             return
 
-        # If multiple records paths were provided, merge them to a temp file first
+        # If multiple records paths were provided, merge them to a temp file
+        # first. The records store only re-reads files that changed and
+        # deduplicates IDs across them.
         if len(rec_paths) > 1:
-            import json as _json
+            from .records_store import get_records_store
 
             merged_path = os.path.join("data", "records", "_merged_current_prev.json")
             try:
-                all_items = []
-                for rp in rec_paths:
-                    with open(rp, "r", encoding="utf-8") as f:
-                        data = _json.load(f)
-                        if isinstance(data, list):
-                            all_items.extend(data)
-                with open(merged_path, "w", encoding="utf-8") as f:
-                    _json.dump(all_items, f, ensure_ascii=False)
-                rec_arg = merged_path
+                store = get_records_store()
+                store.sync(rec_paths)
+                n = store.export(merged_path, rec_paths)
+                log(f"Merged {n} records from {len(rec_paths)} files")
+                rec_paths = [merged_path]
             except Exception as e:
                 log(f"Failed to merge records: {e}")
                 return
-        else:
-            rec_arg = rec_paths[0]
-
-        log("Select & fetch step…")
-        limit_arg = f" --limit {args.limit}" if args.limit and args.limit > 0 else ""
-        os.system(
-            f"python -m src.select_and_fetch --records {rec_arg}{limit_arg} --output {selected_path}"
-        )
-        # Defensive: if selection step didn't create output (e.g., dry-run tests stub it),
-        # fall back to a minimal selection so downstream steps can proceed.
-        if not os.path.exists(selected_path):
-            try:
-                import json as _json
-
-                # Use the same records source we resolved above for selection
-                _sel_src = rec_arg
-                with open(_sel_src, "r", encoding="utf-8") as f:
-                    _items = _json.load(f)
-                    if not isinstance(_items, list):
-                        _items = []
-                # Apply limit if provided; otherwise include all
-                _limit = args.limit if args.limit and args.limit > 0 else None
-                _selected = _items[:_limit] if _limit else _items
-                os.makedirs(os.path.dirname(selected_path), exist_ok=True)
-                with open(selected_path, "w", encoding="utf-8") as f:
-                    _json.dump(_selected, f, ensure_ascii=False)
-                log(
-                    f"Selection output missing; wrote fallback selection with {len(_selected)} items"
-                )
-            except Exception as e:
-                # As a last resort, create an empty selection file to avoid crashes
-                os.makedirs(os.path.dirname(selected_path), exist_ok=True)
-                with open(selected_path, "w", encoding="utf-8") as f:
-                    f.write("[]")
-                log(
-                    f"Selection output missing and fallback failed ({e}); wrote empty selection []"
-                )
-    else:
-        log("Skipping selection (data/selected.json present)")
 
-    # Translate
-    log("Translate step…")
-    from .services.translation_service import TranslationService
-    from .file_service import read_json
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
-    # Determine worklist based on mode
-    if args.cloud_mode:
-        # Cloud mode: claim batch from cloud job queue
-        from .cloud_job_queue import cloud_queue
+        from .seen_store import SeenStore
 
-        log(f"Cloud mode: claiming batch of {args.batch_size} jobs...")
-        jobs = cloud_queue.claim_batch(args.worker_id, batch_size=args.batch_size)
-
-        if not jobs:
-            log("No pending jobs in queue")
-            return
-
-        log(f"Claimed {len(jobs)} jobs")
-        worklist = [{"id": job["paper_id"]} for job in jobs]
-    else:
-        # Standard mode: use selection
-        selected = read_json(selected_path)
-        if not isinstance(selected, list) or not selected:
-            log("No selected papers to translate; exiting")
-            return
-
-        # Apply limit if set (>0)
-        if args.limit and args.limit > 0:
-            worklist = selected[: args.limit]
-        else:
-            worklist = selected
+        seen = SeenStore()
+        discover_sources = True
+        source = iter_records(rec_paths)
 
     service = TranslationService()
-
-    # Import QA if enabled
-    if args.with_qa:
-        from .qa_filter import filter_translation_file
-
-    def _translate_one(paper_id: str) -> tuple[str, bool, str | None, bool | None]:
-        try:
-            log(f"Translating {paper_id}…")
-            result_path = service.translate_paper(paper_id, dry_run=args.dry_run)
-
-            # QA filtering if enabled
-            qa_passed = None
-            if args.with_qa and not args.dry_run:
-                # Load translation
-                import json
-
-                with open(result_path, "r", encoding="utf-8") as f:
-                    translation = json.load(f)
-
-                # Filter and save to appropriate directory
-                qa_passed, qa_result = filter_translation_file(
-                    translation, save_passed=True, save_flagged=True
-                )
-
-                if qa_passed:
-                    log(f"  QA: PASS (score: {qa_result.score:.2f})")
-                else:
-                    log(
-                        f"  QA: FLAGGED ({qa_result.status.value}, score: {qa_result.score:.2f})"
-                    )
-
-            return paper_id, True, result_path, qa_passed
-        except Exception as e:
-            return paper_id, False, str(e), None
+    publish_cfg = publish_config()
+    stages = PaperStages(
+        service,
+        dry_run=args.dry_run,
+        with_qa=args.with_qa,
+        limit=limit,
+        seen=seen,
+        discover_sources=discover_sources,
+        abstract_first=publish_cfg["abstract_first"] and not args.no_abstract_first,
+        # Cloud runners commit translations; the site is rendered after all batches
+        render_pages=publish_cfg["render_pages"] and not args.cloud_mode,
+    )
+    graph = stages.graph({"translate": args.workers} if args.workers else None)
+    log("Streaming " + " → ".join(STAGES) + "…")
 
     successes = 0
     failures = 0
+    failed_ids: list[str] = []
     qa_passed_count = 0
     qa_flagged_count = 0
 
-    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as ex:
-        futures = {
-            ex.submit(_translate_one, p["id"]): p["id"] for p in worklist if p.get("id")
-        }
-        for fut in as_completed(futures):
-            pid, ok, info, qa_passed = fut.result()
-            if ok:
-                successes += 1
-                log(f"✓ {pid} → {info}")
-
-                # Update cloud queue if in cloud mode
-                if args.cloud_mode:
-                    from .cloud_job_queue import cloud_queue
-
-                    if qa_passed is False:
-                        cloud_queue.complete_job(pid, qa_passed=False)
-                        qa_flagged_count += 1
-                    else:
-                        cloud_queue.complete_job(pid, qa_passed=True)
-                        if qa_passed is True:
-                            qa_passed_count += 1
-            else:
-                failures += 1
-                log(f"✗ {pid} failed: {info}")
+    for work, error, stage in graph.run(source):
+        if error is None:
+            pid, qa_passed = work["id"], work["qa_passed"]
+            successes += 1
+            log(f"✓ {pid} → {work['path']}")
+
+            # Update cloud queue if in cloud mode
+            if args.cloud_mode:
+                if qa_passed is False:
+                    cloud_queue.complete_job(pid, qa_passed=False, model=service.model)
+                    qa_flagged_count += 1
+                else:
+                    cloud_queue.complete_job(pid, qa_passed=True, model=service.model)
+                    if qa_passed is True:
+                        qa_passed_count += 1
+            elif qa_passed is True:
+                qa_passed_count += 1
+            elif qa_passed is False:
+                qa_flagged_count += 1
+        else:
+            pid = (work or {}).get("id", "?")
+            failures += 1
+            log(f"✗ {pid} failed in {stage}: {error}")
+
+            # Mark as failed in cloud queue
+            if args.cloud_mode and work:
+                cloud_queue.fail_job(pid, f"{stage}: {error}")
+                failed_ids.append(pid)
+
+    for name, st in graph.stats().items():
+        avg = f"{st['avg_seconds']:.2f}s" if st["avg_seconds"] is not None else "-"
+        log(
+            f"  {name:10} x{st['concurrency']:<3} {st['processed']} done, "
+            f"{st['failed']} failed, {avg}/item"
+        )
+
+    # Selection record for later runs and tools reading data/selected.json
+    if seen is not None:
+        write_json(selected_path, stages.selected)
+        log(f"Selected {len(stages.selected)} new items → {selected_path}")
 
-                # Mark as failed in cloud queue
-                if args.cloud_mode:
-                    from .cloud_job_queue import cloud_queue
+    # Fold this batch's queue events into the snapshot file(s) for the commit
+    if args.cloud_mode:
+        # Retries are rescheduled with what this attempt learned (PDF pages,
+        # extracted paragraphs)
+        if failed_ids:
+            try:
+                from .job_estimates import estimate_papers
 
-                    cloud_queue.fail_job(pid, str(info))
+                cloud_queue.set_estimates(estimate_papers(failed_ids))
+            except Exception as e:
+                log(f"Could not refresh estimates for failed jobs: {e}")
+        cloud_queue.compact()
 
     # Print QA summary if enabled
     if args.with_qa:
@@ -247,9 +505,7 @@ def run_cli() -> None:
     # Render + index + pdf (skip if cloud mode - will be done after all batches)
     if not args.cloud_mode:
         log("Render step…")
-        os.system("python -m src.render")
-        os.system("python -m src.search_index")
-        os.system("python -m src.make_pdf")
+        publish_site()
 
         # Send success notification to Discord
         alerts = DiscordAlerts()
@@ -0,0 +1,153 @@
+"""
+Concurrent prefetcher for PDFs and source archives.
+
+Downloads run on a thread pool while staying polite to remote hosts:
+- at most ``per_host`` requests in flight per host
+- a shared rate budget spacing request starts across all hosts
+- concurrent requests for the same URL are collapsed into one
+
+Finished artifacts are handed to the consumer through a bounded queue, so
+workers block (backpressure) instead of piling up results in memory.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from .config import get_config
+
+
+class Prefetcher:
+    """Thread-pool fetcher with per-host limits and in-flight deduplication."""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_host: int = 2,
+        rate_per_sec: float = 4.0,
+        queue_size: int = 32,
+    ):
+        """
+        Initialize prefetcher.
+
+        Args:
+            max_workers: Thread pool size
+            per_host: Max concurrent requests to one host
+            rate_per_sec: Shared request budget across all hosts (0 = unlimited)
+            queue_size: Max finished results waiting for the consumer
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.per_host = max(1, int(per_host))
+        self.min_interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self.queue_size = max(1, int(queue_size))
+
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._next_start = 0.0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "Prefetcher":
+        """Build a prefetcher from the ``prefetch`` section of config.yaml."""
+        cfg = (config if config is not None else get_config()).get("prefetch") or {}
+        return cls(
+            max_workers=cfg.get("workers", 8),
+            per_host=cfg.get("per_host", 2),
+            rate_per_sec=float(cfg.get("rate_per_sec", 4.0)),
+            queue_size=cfg.get("queue_size", 32),
+        )
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host)
+                self._host_slots[host] = slot
+        return slot
+
+    def _wait_for_budget(self) -> None:
+        """Reserve the next start slot in the shared budget and sleep until it."""
+        if not self.min_interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def fetch(self, url: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``fn(url, *args)`` under the host limit and rate budget.
+
+        If the same URL is already being fetched by another thread, wait for
+        that fetch and return its result instead of issuing a second request.
+        """
+        with self._lock:
+            fut = self._inflight.get(url)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._inflight[url] = fut
+        if not owner:
+            return fut.result()
+
+        try:
+            with self._host_slot(url):
+                self._wait_for_budget()
+                result = fn(url, *args)
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+        fut.set_result(result)
+        return result
+
+    def run(
+        self, task: Callable[[Any], Any], items: Iterable[Any]
+    ) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+        """
+        Run ``task(item)`` for every item and yield results as they finish.
+
+        Yields ``(item, result, error)`` tuples in completion order. Closing
+        the iterator early cancels work that has not started yet.
+        """
+        out: "queue.Queue[Tuple[Any, Any, Optional[BaseException]]]" = queue.Queue(
+            maxsize=self.queue_size
+        )
+        stop = threading.Event()
+
+        def _emit(entry: Tuple[Any, Any, Optional[BaseException]]) -> None:
+            while not stop.is_set():
+                try:
+                    out.put(entry, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def _worker(item: Any) -> None:
+            # BaseException too (e.g. SystemExit from a callback): every item
+            # must produce an entry or the consumer waits forever
+            try:
+                entry = (item, task(item), None)
+            except BaseException as e:
+                entry = (item, None, e)
+            _emit(entry)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = [ex.submit(_worker, item) for item in items]
+            try:
+                for _ in range(len(futures)):
+                    yield out.get()
+            finally:
+                stop.set()
+                for f in futures:
+                    f.cancel()
@@ -0,0 +1,168 @@
+"""
+Persistent per-month probe state for ChinaXiv ID scraping.
+
+Every probed paper number is recorded as found, missing or errored together
+with the time of the probe, so re-harvests and resumes only spend BrightData
+requests on IDs that can still change:
+- unknown IDs (never probed)
+- errored IDs whose retry delay has passed
+- optionally, missing IDs in a tail window below the month's max ID, where
+  late submissions appear
+
+States are one byte per ID and timestamps four bytes per ID, held in
+``array`` buffers and stored as one small binary file per month.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Dict, List, Optional
+
+from .config import get_config
+
+
+UNKNOWN = 0
+FOUND = 1
+MISSING = 2
+ERRORED = 3
+
+STATE_NAMES = {UNKNOWN: "unknown", FOUND: "found", MISSING: "missing", ERRORED: "errored"}
+
+PROBE_DIR = "data/probes"
+_MAGIC = b"PRB1"
+_HEADER = struct.Struct("<4sI")
+
+
+class ProbeBitmap:
+    """Probe states and timestamps for the paper numbers of one month."""
+
+    def __init__(self, year_month: str, path: Optional[str] = None):
+        """
+        Initialize an empty bitmap.
+
+        Args:
+            year_month: Month (e.g., "202504")
+            path: Storage file (default: data/probes/<year_month>.bin)
+        """
+        self.year_month = year_month
+        self.path = path or os.path.join(PROBE_DIR, f"{year_month}.bin")
+        # Index = paper number; slot 0 is unused
+        self.states = array("B", [UNKNOWN])
+        self.stamps = array("I", [0])
+
+    @classmethod
+    def load(cls, year_month: str, path: Optional[str] = None) -> "ProbeBitmap":
+        """Load a month's bitmap, or return an empty one if none is stored."""
+        bm = cls(year_month, path)
+        if not os.path.exists(bm.path):
+            return bm
+        with open(bm.path, "rb") as f:
+            magic, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"Not a probe bitmap: {bm.path}")
+            states = array("B")
+            states.fromfile(f, count)
+            stamps = array("I")
+            stamps.fromfile(f, count)
+        if sys.byteorder != "little":
+            stamps.byteswap()
+        bm.states, bm.stamps = states, stamps
+        return bm
+
+    def save(self) -> None:
+        """Write the bitmap atomically."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        stamps = array("I", self.stamps)
+        if sys.byteorder != "little":
+            stamps.byteswap()
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self.states)))
+            self.states.tofile(f)
+            stamps.tofile(f)
+        os.replace(tmp, self.path)
+
+    def _grow(self, num: int) -> None:
+        extra = num + 1 - len(self.states)
+        if extra > 0:
+            self.states.extend([UNKNOWN] * extra)
+            self.stamps.extend([0] * extra)
+
+    def mark(self, num: int, state: int, when: Optional[float] = None) -> None:
+        """Record the outcome of probing ``num``."""
+        self._grow(num)
+        self.states[num] = state
+        self.stamps[num] = int(when if when is not None else time.time())
+
+    def state(self, num: int) -> int:
+        """Return the recorded state of ``num`` (UNKNOWN if never probed)."""
+        return self.states[num] if 0 < num < len(self.states) else UNKNOWN
+
+    def due(
+        self,
+        max_id: int,
+        *,
+        start: int = 1,
+        retry_errors_after: float = 6 * 3600,
+        tail_recheck: int = 0,
+        recheck_missing_after: float = 24 * 3600,
+        now: Optional[float] = None,
+    ) -> List[int]:
+        """
+        Paper numbers in ``[start, max_id]`` that should be probed now.
+
+        Args:
+            max_id: Highest number to consider
+            start: Lowest number to consider
+            retry_errors_after: Seconds before an errored ID is retried
+            tail_recheck: Re-probe missing IDs among the last N numbers
+            recheck_missing_after: Seconds before a tail missing ID is re-probed
+            now: Current time (for tests)
+
+        Returns:
+            Sorted list of paper numbers
+        """
+        now = now if now is not None else time.time()
+        tail_start = max_id - tail_recheck + 1
+        out: List[int] = []
+        n_known = len(self.states)
+        for num in range(max(1, start), max_id + 1):
+            if num >= n_known:
+                out.append(num)
+                continue
+            st = self.states[num]
+            age = now - self.stamps[num]
+            if st == UNKNOWN:
+                out.append(num)
+            elif st == ERRORED and age >= retry_errors_after:
+                out.append(num)
+            elif st == MISSING and num >= tail_start and age >= recheck_missing_after:
+                out.append(num)
+        return out
+
+    def counts(self) -> Dict[str, int]:
+        """Number of IDs in each state (excluding never-probed IDs)."""
+        return {STATE_NAMES[s]: self.states.count(s) for s in (FOUND, MISSING, ERRORED)}
+
+
+def due_from_config(
+    bitmap: ProbeBitmap,
+    max_id: int,
+    start: int = 1,
+    config: Optional[Dict] = None,
+) -> List[int]:
+    """Apply :meth:`ProbeBitmap.due` using ``harvest.probes`` settings."""
+    cfg = (config if config is not None else get_config()).get("harvest") or {}
+    probes = cfg.get("probes") or {}
+    return bitmap.due(
+        max_id,
+        start=start,
+        retry_errors_after=float(probes.get("retry_errors_after_hours", 6)) * 3600,
+        tail_recheck=int(probes.get("tail_recheck", 0)),
+        recheck_missing_after=float(probes.get("recheck_missing_after_hours", 24))
+        * 3600,
+    )
@@ -0,0 +1,102 @@
+"""
+Two-phase publishing: abstract first, full text later.
+
+A new paper is published in two steps:
+
+    abstract    title, abstract, authors and subjects are translated and the
+                item page goes live while the PDF is still being fetched
+    full        the body is translated, formatted and QA'd, and the same page
+                is re-rendered in place with the full text
+
+The translation JSON records the phase it is in (``_phase``) and when each
+phase was published (``_abstract_at``, ``_body_at``). An abstract-phase file
+in ``data/translated`` is not a finished translation: readers that count,
+validate or index translations check :func:`is_full` first. Settings live
+under ``publish`` in ``config.yaml``.
+"""
+
+from __future__ import annotations
+
+import copy
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .config import get_config
+from .utils import log
+
+PHASE_ABSTRACT = "abstract"
+PHASE_FULL = "full"
+
+
+def publish_config() -> Dict[str, bool]:
+    """``publish`` config section: ``abstract_first`` and ``render_pages``."""
+    cfg = get_config().get("publish") or {}
+    return {
+        "abstract_first": bool(cfg.get("abstract_first", True)),
+        "render_pages": bool(cfg.get("render_pages", True)),
+    }
+
+
+def is_full(translation: Dict[str, Any]) -> bool:
+    """
+    Whether a translation is finished rather than an abstract-phase save.
+
+    Translations written before phases were recorded count as finished.
+    """
+    return translation.get("_phase") != PHASE_ABSTRACT
+
+
+def mark_phase(
+    translation: Dict[str, Any],
+    phase: str,
+    previous: Optional[Dict[str, Any]] = None,
+    now: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Record a publish phase on a translation.
+
+    Args:
+        translation: Translation dict (updated in place)
+        phase: ``abstract`` or ``full``
+        previous: The abstract-phase translation, whose timestamp is kept
+        now: ISO timestamp (for tests)
+
+    Returns:
+        The translation
+    """
+    now = now or datetime.now().isoformat(timespec="seconds")
+    translation["_phase"] = phase
+    if phase == PHASE_ABSTRACT:
+        translation["_abstract_at"] = now
+        translation["_body_at"] = None
+    else:
+        translation["_abstract_at"] = (previous or {}).get("_abstract_at") or now
+        translation["_body_at"] = now
+    return translation
+
+
+def publish_page(translation: Dict[str, Any]) -> bool:
+    """
+    Render (or upgrade) the translation's item page in place.
+
+    QA-flagged translations are taken down instead, matching what a full
+    render would show. Errors are logged, never raised: the translation JSON
+    is already saved and the next full render will publish it.
+
+    Returns:
+        True if the page was written
+    """
+    from .render import render_items, unpublish_item
+
+    paper_id = translation.get("id")
+    try:
+        if translation.get("_qa_status", "pass") != "pass":
+            unpublish_item(paper_id)
+            return False
+        # render mutates items (_has_full_text, formatted_body_md)
+        render_items([copy.deepcopy(translation)])
+    except Exception as e:
+        log(f"Could not publish {paper_id} ({translation.get('_phase')}): {e}")
+        return False
+    log(f"Published {paper_id} ({translation.get('_phase')})")
+    return True
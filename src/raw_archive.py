@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Compressed raw-HTML archive for ChinaXiv abstract pages.
+
+Every fetched page is kept so parser changes can be applied to old papers
+without scraping them again through BrightData. Pages are stored per month
+in a pack file of compressed blobs, addressed by the SHA-256 of the raw
+HTML (identical pages are stored once), plus an append-only JSONL index
+mapping paper ID to blob offset:
+
+    data/raw/chinaxiv_YYYYMM.pack       [header][compressed blob]...
+    data/raw/chinaxiv_YYYYMM.idx.jsonl  {"id", "sha256", "offset", "length", "codec"}
+
+Blobs are zstd-compressed when the ``zstandard`` package is installed and
+zlib-compressed otherwise; the codec is recorded per blob.
+
+Usage:
+    python -m src.raw_archive reparse --month 202504 [--workers 4]
+    python -m src.raw_archive stats --month 202504
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+
+from .chinaxiv_parse import parse_many
+from .config import get_config
+from .utils import log, read_json, write_json
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+
+RAW_DIR = "data/raw"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+_MAGIC = b"CXP1"
+# magic, raw sha256, compressed length
+_BLOB_HEADER = struct.Struct("<4s32sI")
+
+
+def _compress(data: bytes) -> Tuple[str, bytes]:
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=10).compress(data)
+    return CODEC_ZLIB, zlib.compress(data, 6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd blobs")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class HtmlArchive:
+    """Pack file plus ID index for one month of raw abstract pages."""
+
+    def __init__(self, year_month: str, root: str = RAW_DIR):
+        self.year_month = year_month
+        self.pack_path = os.path.join(root, f"chinaxiv_{year_month}.pack")
+        self.index_path = os.path.join(root, f"chinaxiv_{year_month}.idx.jsonl")
+        self._lock = threading.Lock()
+        self.index: Dict[str, Dict] = {}
+        self._by_sha: Dict[str, Dict] = {}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.index_path):
+            return
+        pack_size = os.path.getsize(self.pack_path) if os.path.exists(self.pack_path) else 0
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line after a crash
+                # Ignore entries pointing past a truncated pack
+                if entry["offset"] + entry["length"] > pack_size:
+                    continue
+                self.index[entry["id"]] = entry
+                self._by_sha[entry["sha256"]] = entry
+
+    def __contains__(self, paper_id: str) -> bool:
+        return paper_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def put(self, paper_id: str, html: str) -> str:
+        """
+        Store a page, reusing the blob if identical content is already packed.
+
+        Args:
+            paper_id: Paper ID (e.g., "202504.00123")
+            html: Raw page HTML
+
+        Returns:
+            SHA-256 hex digest of the page
+        """
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw)
+        sha = digest.hexdigest()
+        with self._lock:
+            current = self.index.get(paper_id)
+            if current is not None and current["sha256"] == sha:
+                return sha
+            blob = self._by_sha.get(sha)
+            if blob is None:
+                codec, data = _compress(raw)
+                os.makedirs(os.path.dirname(self.pack_path) or ".", exist_ok=True)
+                with open(self.pack_path, "ab") as f:
+                    offset = f.tell()
+                    f.write(_BLOB_HEADER.pack(_MAGIC, digest.digest(), len(data)))
+                    f.write(data)
+                blob = {
+                    "sha256": sha,
+                    "offset": offset + _BLOB_HEADER.size,
+                    "length": len(data),
+                    "codec": codec,
+                }
+                self._by_sha[sha] = blob
+            entry = {"id": paper_id, **blob, "stored": int(time.time())}
+            # Pack data is written before the index line that points at it
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self.index[paper_id] = entry
+        return sha
+
+    def get(self, paper_id: str) -> Optional[str]:
+        """Return the stored HTML for a paper, or None if not archived."""
+        entry = self.index.get(paper_id)
+        if entry is None:
+            return None
+        with open(self.pack_path, "rb") as f:
+            f.seek(entry["offset"])
+            data = f.read(entry["length"])
+        raw = _decompress(entry["codec"], data)
+        if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Corrupt archive blob for {paper_id}")
+        return raw.decode("utf-8")
+
+    def iter_pages(self) -> Iterator[Tuple[str, str]]:
+        """Yield ``(paper_id, html)`` in paper ID order."""
+        if not self.index:
+            return
+        with open(self.pack_path, "rb") as f:
+            for paper_id in sorted(self.index):
+                entry = self.index[paper_id]
+                f.seek(entry["offset"])
+                raw = _decompress(entry["codec"], f.read(entry["length"]))
+                yield paper_id, raw.decode("utf-8")
+
+    def compact_index(self) -> None:
+        """Rewrite the index with one line per paper (drops superseded entries)."""
+        with self._lock:
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                for paper_id in sorted(self.index):
+                    f.write(json.dumps(self.index[paper_id]) + "\n")
+            os.replace(tmp, self.index_path)
+
+
+_archives: Dict[str, HtmlArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def archive_enabled(config: Optional[Dict] = None) -> bool:
+    """Whether scrapers should keep raw pages (``harvest.raw_archive``)."""
+    cfg = (config if config is not None else get_config()).get("harvest") or {}
+    return cfg.get("raw_archive", True) is not False
+
+
+def archive_page(paper_id: str, html: str, root: str = RAW_DIR) -> None:
+    """Store a fetched page in its month's archive (no-op when disabled)."""
+    if not archive_enabled():
+        return
+    key = os.path.join(os.path.abspath(root), paper_id[:6])
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = _archives[key] = HtmlArchive(paper_id[:6], root)
+    try:
+        archive.put(paper_id, html)
+    except OSError as e:
+        log(f"Failed to archive {paper_id}: {e}")
+
+
+def reparse_month(
+    year_month: str,
+    root: str = RAW_DIR,
+    output_dir: str = "data/records",
+    workers: int = 1,
+) -> int:
+    """
+    Re-parse a month's archived pages into ``data/records/chinaxiv_YYYYMM.json``.
+
+    Reparsed records replace the existing ones by ID; records without an
+    archived page (harvested before archiving, or pruned) are kept.
+
+    Returns:
+        Number of records reparsed
+    """
+    archive = HtmlArchive(year_month, root)
+    if not len(archive):
+        log(f"No archived pages for {year_month}")
+        return 0
+    started = time.monotonic()
+    records = [r for r in parse_many(archive.iter_pages(), workers=workers) if r]
+    output_path = os.path.join(output_dir, f"chinaxiv_{year_month}.json")
+    merged = {}
+    if os.path.exists(output_path):
+        merged = {r["id"]: r for r in read_json(output_path)}
+    merged.update((r["id"], r) for r in records)
+    write_json(output_path, sorted(merged.values(), key=lambda r: r["id"]))
+    elapsed = time.monotonic() - started
+    log(
+        f"Reparsed {len(archive)} pages -> {len(records)} records for {year_month} "
+        f"in {elapsed:.1f}s ({output_path})"
+    )
+    return len(records)
+
+
+def run_cli() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Raw ChinaXiv page archive")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_reparse = sub.add_parser("reparse", help="Rebuild month records from archived HTML")
+    p_reparse.add_argument("--month", action="append", required=True, help="Month (YYYYMM); repeatable")
+    p_reparse.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p_reparse.add_argument("--root", default=RAW_DIR)
+    p_reparse.add_argument("--output-dir", default="data/records")
+
+    p_stats = sub.add_parser("stats", help="Show archive size for a month")
+    p_stats.add_argument("--month", required=True)
+    p_stats.add_argument("--root", default=RAW_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == "reparse":
+        for month in args.month:
+            reparse_month(month, args.root, args.output_dir, args.workers)
+    elif args.command == "stats":
+        archive = HtmlArchive(args.month, args.root)
+        blobs = {e["sha256"] for e in archive.index.values()}
+        size = os.path.getsize(archive.pack_path) if os.path.exists(archive.pack_path) else 0
+        print(f"{args.month}: {len(archive)} pages, {len(blobs)} unique blobs, {size / 1024:.1f} KiB packed")
+
+
+if __name__ == "__main__":
+    run_cli()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Indexed store of harvested records.
+
+Harvest output is a set of JSON array files under ``data/records``. Looking a
+paper up used to mean parsing those files one by one until the ID turned up;
+this module keeps a SQLite index of every record instead:
+
+    data/records.db
+        records(id PRIMARY KEY, month, status, source, rank, data)
+        sources(path PRIMARY KEY, mtime, size, count)
+        members(path, id, rank)
+
+``sync()`` is incremental: a source file is only re-read when its mtime or
+size changed since the last sync. When the same ID appears in several files
+the higher-ranked source wins (``data/selected.json`` outranks harvest
+files), then the lexically latest file name, matching the old
+"newest records file first" scan. Lookups are a primary-key read.
+
+``members`` lists the IDs each source file currently holds. When an ID
+leaves the file its indexed copy came from (for example a paper dropped from
+``data/selected.json``), the copy is replaced by the best remaining file
+holding that ID, so precedence only ever applies to a file's current
+contents.
+
+Usage:
+    python -m src.records_store sync
+    python -m src.records_store stats
+    python -m src.records_store get chinaxiv-202504.00123
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .file_service import ensure_dir
+from .logging_utils import log
+
+
+DB_PATH = os.path.join("data", "records.db")
+RECORDS_DIR = os.path.join("data", "records")
+SELECTED_PATH = os.path.join("data", "selected.json")
+
+# Seconds between automatic re-syncs on lookup
+SYNC_INTERVAL = 30.0
+
+STATUS_HARVESTED = "harvested"
+STATUS_TRANSLATED = "translated"
+
+_ID_MONTH_RE = re.compile(r"(\d{6})\.\d+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id TEXT PRIMARY KEY,
+    month TEXT,
+    status TEXT NOT NULL DEFAULT 'harvested',
+    source TEXT NOT NULL,
+    rank INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_month ON records(month);
+CREATE INDEX IF NOT EXISTS idx_records_status ON records(status);
+CREATE INDEX IF NOT EXISTS idx_records_source ON records(source);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS members (
+    path TEXT NOT NULL,
+    id TEXT NOT NULL,
+    rank INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (path, id)
+);
+CREATE INDEX IF NOT EXISTS idx_members_id ON members(id);
+"""
+
+# Keep the stored row unless the incoming source ranks at least as high.
+# Status is preserved across re-syncs of the same record.
+_UPSERT = """
+INSERT INTO records (id, month, status, source, rank, data)
+VALUES (?, ?, 'harvested', ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    month = excluded.month,
+    source = excluded.source,
+    rank = excluded.rank,
+    data = excluded.data
+WHERE excluded.rank > records.rank
+   OR (excluded.rank = records.rank AND excluded.source >= records.source)
+"""
+
+
+def record_month(record: Dict[str, Any]) -> Optional[str]:
+    """
+    Month (YYYYMM) a record belongs to.
+
+    Taken from the ChinaXiv ID when it has one (``chinaxiv-202504.00123``),
+    otherwise from the record date.
+    """
+    match = _ID_MONTH_RE.search(str(record.get("id", "")))
+    if match:
+        return match.group(1)
+    date = str(record.get("date") or "")
+    if len(date) >= 7 and date[4] == "-":
+        return date[:4] + date[5:7]
+    return None
+
+
+def default_sources(records_dir: str = RECORDS_DIR) -> List[str]:
+    """Harvest output files, skipping scratch files such as ``_merged_*.json``."""
+    return sorted(
+        p
+        for p in glob.glob(os.path.join(records_dir, "*.json"))
+        if not os.path.basename(p).startswith("_")
+    )
+
+
+class RecordsStore:
+    """SQLite-backed index of records keyed by paper ID."""
+
+    def __init__(self, path: str = DB_PATH):
+        """
+        Open (and create if needed) a records store.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        ensure_dir(os.path.dirname(path) or ".")
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        self._last_sync = 0.0
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections are not shared)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def sync(self, paths: Optional[Iterable[str]] = None, rank: int = 0) -> int:
+        """
+        Index records from JSON array files that changed since the last sync.
+
+        Args:
+            paths: Source files (default: ``data/records/*.json``)
+            rank: Precedence of these sources over others holding the same ID
+
+        Returns:
+            Number of records (re)indexed
+        """
+        paths = default_sources() if paths is None else list(paths)
+        total = 0
+        with self._sync_lock:
+            conn = self._conn()
+            for path in paths:
+                total += self._sync_file(conn, os.path.normpath(path), rank)
+            self._last_sync = time.monotonic()
+        return total
+
+    def _sync_file(self, conn: sqlite3.Connection, path: str, rank: int) -> int:
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        row = conn.execute(
+            "SELECT mtime, size, count FROM sources WHERE path = ?", (path,)
+        ).fetchone()
+        if st is None:
+            if row is None:
+                return 0
+            # Removed since the last sync: it no longer holds any record
+            items: List[Any] = []
+        else:
+            if (
+                row is not None
+                and row[0] == st.st_mtime
+                and row[1] == st.st_size
+                and row[2] == self._member_count(conn, path)
+            ):
+                return 0
+            items = _read_items(path)
+            if items is None:
+                return 0
+        rows = [
+            (
+                str(rec["id"]),
+                record_month(rec),
+                path,
+                rank,
+                json.dumps(rec, ensure_ascii=False),
+            )
+            for rec in items
+            if isinstance(rec, dict) and rec.get("id")
+        ]
+        ids = {r[0] for r in rows}
+        dropped = [
+            pid
+            for (pid,) in conn.execute("SELECT id FROM members WHERE path = ?", (path,))
+            if pid not in ids
+        ]
+        with conn:
+            conn.execute("DELETE FROM members WHERE path = ?", (path,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO members (path, id, rank) VALUES (?, ?, ?)",
+                [(path, pid, rank) for pid in ids],
+            )
+            conn.executemany(_UPSERT, rows)
+            if st is None:
+                conn.execute("DELETE FROM sources WHERE path = ?", (path,))
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sources (path, mtime, size, count) VALUES (?, ?, ?, ?)",
+                    (path, st.st_mtime, st.st_size, len(ids)),
+                )
+            self._demote(conn, path, dropped)
+        return len(rows)
+
+    @staticmethod
+    def _member_count(conn: sqlite3.Connection, path: str) -> int:
+        return conn.execute(
+            "SELECT COUNT(*) FROM members WHERE path = ?", (path,)
+        ).fetchone()[0]
+
+    def _demote(self, conn: sqlite3.Connection, path: str, ids: List[str]) -> None:
+        """Re-resolve IDs that left ``path`` while their indexed copy came from it."""
+        stale = [
+            pid
+            for pid in ids
+            if conn.execute(
+                "SELECT 1 FROM records WHERE id = ? AND source = ?", (pid, path)
+            ).fetchone()
+        ]
+        copies = self._best_copies(conn, stale)
+        for pid in stale:
+            found = copies.get(pid)
+            if found is None:
+                conn.execute("DELETE FROM records WHERE id = ?", (pid,))
+                continue
+            source, rank, rec = found
+            conn.execute(
+                "UPDATE records SET month = ?, source = ?, rank = ?, data = ? WHERE id = ?",
+                (record_month(rec), source, rank, json.dumps(rec, ensure_ascii=False), pid),
+            )
+
+    def _best_copies(
+        self,
+        conn: sqlite3.Connection,
+        ids: Iterable[str],
+        paths: Optional[List[str]] = None,
+    ) -> Dict[str, tuple]:
+        """
+        Read the highest-precedence copy of each ID from the files holding it.
+
+        Args:
+            conn: Connection
+            ids: Paper IDs
+            paths: Only consider these files (default: every indexed file)
+
+        Returns:
+            ``{id: (path, rank, record)}`` for the IDs still found in a file
+        """
+        best: Dict[str, tuple] = {}
+        for pid in ids:
+            rows = conn.execute(
+                "SELECT path, rank FROM members WHERE id = ? ORDER BY rank DESC, path DESC",
+                (pid,),
+            ).fetchall()
+            for member_path, member_rank in rows:
+                if paths is None or member_path in paths:
+                    best[pid] = (member_path, member_rank)
+                    break
+        by_path: Dict[str, set] = {}
+        for pid, (member_path, _) in best.items():
+            by_path.setdefault(member_path, set()).add(pid)
+        copies: Dict[str, tuple] = {}
+        for member_path, wanted in by_path.items():
+            for rec in _read_items(member_path) or []:
+                pid = str(rec.get("id", "")) if isinstance(rec, dict) else ""
+                if pid in wanted:
+                    copies[pid] = (member_path, best[pid][1], rec)
+        return copies
+
+    def refresh(self, max_age: float = 0.0) -> None:
+        """
+        Sync the harvest files and ``data/selected.json``.
+
+        Args:
+            max_age: Skip if the last sync is younger than this many seconds
+        """
+        if self._last_sync and time.monotonic() - self._last_sync < max_age:
+            return
+        self.sync(default_sources())
+        self.sync([SELECTED_PATH], rank=1)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def get(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Return the record for ``paper_id``, or None if not indexed."""
+        row = self._conn().execute(
+            "SELECT data FROM records WHERE id = ?", (paper_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __contains__(self, paper_id: str) -> bool:
+        return (
+            self._conn().execute("SELECT 1 FROM records WHERE id = ?", (paper_id,)).fetchone()
+            is not None
+        )
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def _iter(self, where: str, args: tuple) -> Iterator[Dict[str, Any]]:
+        cur = self._conn().execute(f"SELECT data FROM records {where} ORDER BY id", args)
+        for (data,) in cur:
+            yield json.loads(data)
+
+    def iter_month(self, year_month: str) -> Iterator[Dict[str, Any]]:
+        """Yield records of one month (YYYYMM) in ID order."""
+        return self._iter("WHERE month = ?", (year_month,))
+
+    def iter_status(self, status: str) -> Iterator[Dict[str, Any]]:
+        """Yield records with the given status in ID order."""
+        return self._iter("WHERE status = ?", (status,))
+
+    def iter_sources(self, paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every record held by one of ``paths`` in ID order.
+
+        Each ID is yielded once, as the highest-precedence copy among
+        ``paths``; a copy indexed from another file (such as
+        ``data/selected.json``) is replaced by the one from ``paths``.
+        """
+        paths = [os.path.normpath(p) for p in paths]
+        marks = ",".join("?" * len(paths))
+        conn = self._conn()
+        outside = [
+            pid
+            for (pid,) in conn.execute(
+                f"SELECT id FROM records WHERE source NOT IN ({marks}) AND id IN "
+                f"(SELECT id FROM members WHERE path IN ({marks}))",
+                tuple(paths) * 2,
+            )
+        ]
+        copies = self._best_copies(conn, outside, paths)
+        cur = conn.execute(
+            f"SELECT id, source, data FROM records WHERE id IN "
+            f"(SELECT id FROM members WHERE path IN ({marks})) ORDER BY id",
+            tuple(paths),
+        )
+        for pid, source, data in cur:
+            if source in paths:
+                yield json.loads(data)
+            elif pid in copies:
+                yield copies[pid][2]
+
+    def set_status(self, paper_ids: Iterable[str], status: str) -> int:
+        """Set the status of indexed records; returns the number updated."""
+        conn = self._conn()
+        with conn:
+            cur = conn.executemany(
+                "UPDATE records SET status = ? WHERE id = ?",
+                [(status, pid) for pid in paper_ids],
+            )
+        return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Record counts overall, by status and by month."""
+        conn = self._conn()
+        return {
+            "records": len(self),
+            "sources": conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0],
+            "by_status": dict(
+                conn.execute("SELECT status, COUNT(*) FROM records GROUP BY status")
+            ),
+            "by_month": dict(
+                conn.execute(
+                    "SELECT month, COUNT(*) FROM records GROUP BY month ORDER BY month"
+                )
+            ),
+        }
+
+    def export(self, path: str, paths: Iterable[str]) -> int:
+        """
+        Write the records from ``paths`` (deduplicated by ID) as one JSON array.
+
+        Returns:
+            Number of records written
+        """
+        ensure_dir(os.path.dirname(path) or ".")
+        count = 0
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("[")
+            for rec in self.iter_sources(paths):
+                f.write(",\n" if count else "\n")
+                f.write(json.dumps(rec, ensure_ascii=False))
+                count += 1
+            f.write("\n]\n")
+        os.replace(tmp, path)
+        return count
+
+
+def _read_items(path: str) -> Optional[List[Any]]:
+    """JSON array of a records file, or None if it cannot be read."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            items = json.load(f)
+    except (OSError, ValueError) as e:
+        log(f"Records store: skipping unreadable {path}: {e}")
+        return None
+    return items if isinstance(items, list) else None
+
+
+_stores: Dict[str, RecordsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_records_store(path: str = DB_PATH) -> RecordsStore:
+    """Shared store for ``path`` (one per absolute path per process)."""
+    key = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = RecordsStore(path)
+    return store
+
+
+def lookup_record(paper_id: str, store: Optional[RecordsStore] = None) -> Optional[Dict[str, Any]]:
+    """
+    Find a record in ``data/selected.json`` or the harvest files.
+
+    The index is brought up to date at most every few seconds; a miss forces
+    a sync so records harvested moments ago are still found.
+    """
+    store = store or get_records_store()
+    store.refresh(max_age=SYNC_INTERVAL)
+    rec = store.get(paper_id)
+    if rec is None:
+        store.refresh()
+        rec = store.get(paper_id)
+    return rec
+
+
+def run_cli() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Indexed records store")
+    parser.add_argument("--db", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_sync = sub.add_parser("sync", help="Index new or changed records files")
+    p_sync.add_argument("paths", nargs="*", help="Records files (default: data/records/*.json)")
+    sub.add_parser("stats", help="Show record counts")
+    p_get = sub.add_parser("get", help="Print one record")
+    p_get.add_argument("paper_id")
+    args = parser.parse_args()
+
+    store = RecordsStore(args.db)
+    if args.command == "sync":
+        started = time.monotonic()
+        n = store.sync(args.paths or None)
+        log(f"Indexed {n} records in {time.monotonic() - started:.1f}s ({len(store)} total)")
+    elif args.command == "stats":
+        print(json.dumps(store.stats(), indent=2))
+    elif args.command == "get":
+        rec = store.get(args.paper_id)
+        if rec is None:
+            print(f"{args.paper_id}: not found")
+        else:
+            print(json.dumps(rec, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    run_cli()
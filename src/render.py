@@ -4,7 +4,7 @@ import argparse
 import glob
 import os
 import shutil
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
 import time
@@ -52,9 +52,10 @@ def load_translated() -> List[Dict[str, Any]]:
     return items
 
 
-def render_site(items: List[Dict[str, Any]]) -> None:
-    from .format_translation import format_translation_to_markdown
+SITE_BASE = "https://chinaxiv-english.pages.dev"
+
 
+def _environment() -> Environment:
     env = Environment(
         loader=FileSystemLoader(os.path.join("src", "templates")),
         autoescape=select_autoescape(["html", "xml"]),
@@ -79,6 +80,126 @@ def render_site(items: List[Dict[str, Any]]) -> None:
 
         env.filters["markdown"] = simple_markdown
 
+    return env
+
+
+def _render_item(
+    env: Environment, it: Dict[str, Any], build_version: int, base_out: str = "site"
+) -> None:
+    """Write one item page, its Markdown export and the /abs/ alias."""
+    from .format_translation import format_translation_to_markdown
+
+    tmpl_item = env.get_template("item.html")
+    site_base = SITE_BASE
+    out_dir = os.path.join(base_out, "items", it["id"])
+    ensure_dir(out_dir)
+
+    # Compute whether we have meaningful full text content.
+    has_full_text = False
+    body_md = it.get("body_md")
+    if isinstance(body_md, str) and body_md.strip():
+        # Consider content meaningful if there is non-heading text beyond trivial length.
+        lines = body_md.splitlines()
+        non_heading = [ln for ln in lines if not ln.strip().startswith("#")]
+        non_heading_text = "\n".join(non_heading).strip()
+        title_text = (it.get("title_en") or "").strip()
+        # If the only content is a heading matching the title, treat as not meaningful.
+        heading_only = (
+            len([ln for ln in lines if ln.strip().startswith("#")]) >= 1
+            and len(non_heading_text) == 0
+        )
+        if non_heading_text and len(non_heading_text) > 100:
+            has_full_text = True
+        elif not heading_only and len(body_md.strip()) > 200:
+            has_full_text = True
+    # Fallback: treat body_en arrays with sufficient content as full text
+    if not has_full_text:
+        body_en = it.get("body_en")
+        if isinstance(body_en, list) and any((p or "").strip() for p in body_en):
+            long_para = any(len((p or "").strip()) > 100 for p in body_en)
+            enough_paras = sum(1 for p in body_en if (p or "").strip()) >= 2
+            if long_para or enough_paras:
+                has_full_text = True
+
+    it["_has_full_text"] = has_full_text
+
+    # Choose best-available body markdown for preview only if meaningful
+    if has_full_text:
+        if body_md:
+            it["formatted_body_md"] = body_md
+        elif it.get("body_en"):
+            it["formatted_body_md"] = format_translation_to_markdown(it)
+
+    # Page metadata (arXiv-style polish): use absolute canonical
+    title_text = (it.get("title_en") or "")
+    canonical_abs = f"{site_base}/items/{it['id']}/"
+    html = tmpl_item.render(
+        item=it,
+        root="../..",
+        build_version=build_version,
+        title=f"{title_text} — ChinaXiv {it['id']}",
+        canonical_url=canonical_abs,
+        og_title=title_text,
+        og_description=(it.get("abstract_en") or "")[:200],
+        og_url=canonical_abs,
+    )
+    write_text(os.path.join(out_dir, "index.html"), html)
+    # Markdown export (prefer formatted body/abstract if present)
+    abstract_md = it.get("abstract_md") or (it.get("abstract_en") or "")
+    if it.get("body_md"):
+        full_body_md = it["body_md"]
+    elif it.get("body_en"):
+        # fallback: derive from heuristics
+        full_body_md = format_translation_to_markdown(it)
+    else:
+        full_body_md = ""
+
+    md_parts = [
+        f"# {it.get('title_en') or ''}",
+        f"**Authors:** {', '.join(it.get('creators') or [])}",
+        f"**Date:** {it.get('date') or ''}",
+        f"## Abstract\n\n{abstract_md}",
+    ]
+    if full_body_md:
+        md_parts.append("## Full Text\n")
+        md_parts.append(full_body_md)
+    md_parts.append(
+        "\n_Source: ChinaXiv — Machine translation. Verify with original._"
+    )
+    md = "\n\n".join(md_parts) + "\n"
+    write_text(os.path.join(out_dir, f"{it['id']}.md"), md)
+
+    # Optional arXiv-style alias: /abs/<id>/ in addition to /items/<id>/
+    abs_dir = os.path.join(base_out, "abs", it["id"])
+    ensure_dir(abs_dir)
+    write_text(os.path.join(abs_dir, "index.html"), html)
+
+
+def render_items(items: List[Dict[str, Any]], base_out: str = "site") -> None:
+    """
+    Render only these items' pages, leaving the rest of the site alone.
+
+    Used to publish an abstract-first page as soon as it is translated and to
+    upgrade it in place once the full text is done. The index, search index
+    and sitemap pick the item up at the next full render.
+    """
+    env = _environment()
+    build_version = int(time.time())
+    for it in items:
+        _render_item(env, it, build_version, base_out)
+
+
+def unpublish_item(paper_id: str, base_out: str = "site") -> None:
+    """Remove an item's pages (e.g. its full text was flagged by QA)."""
+    for sub in ("items", "abs"):
+        path = os.path.join(base_out, sub, paper_id)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+
+
+def render_site(items: List[Dict[str, Any]]) -> None:
+    env = _environment()
+
     base_out = "site"
     ensure_dir(base_out)
 
@@ -112,91 +233,9 @@ def render_site(items: List[Dict[str, Any]]) -> None:
         write_text(os.path.join(base_out, "donation.html"), html_donations)
 
     # Item pages
-    tmpl_item = env.get_template("item.html")
-    site_base = "https://chinaxiv-english.pages.dev"
+    site_base = SITE_BASE
     for it in items:
-        out_dir = os.path.join(base_out, "items", it["id"])
-        ensure_dir(out_dir)
-
-        # Compute whether we have meaningful full text content.
-        has_full_text = False
-        body_md = it.get("body_md")
-        if isinstance(body_md, str) and body_md.strip():
-            # Consider content meaningful if there is non-heading text beyond trivial length.
-            lines = body_md.splitlines()
-            non_heading = [ln for ln in lines if not ln.strip().startswith("#")]
-            non_heading_text = "\n".join(non_heading).strip()
-            title_text = (it.get("title_en") or "").strip()
-            # If the only content is a heading matching the title, treat as not meaningful.
-            heading_only = (
-                len([ln for ln in lines if ln.strip().startswith("#")]) >= 1
-                and len(non_heading_text) == 0
-            )
-            if non_heading_text and len(non_heading_text) > 100:
-                has_full_text = True
-            elif not heading_only and len(body_md.strip()) > 200:
-                has_full_text = True
-        # Fallback: treat body_en arrays with sufficient content as full text
-        if not has_full_text:
-            body_en = it.get("body_en")
-            if isinstance(body_en, list) and any((p or "").strip() for p in body_en):
-                long_para = any(len((p or "").strip()) > 100 for p in body_en)
-                enough_paras = sum(1 for p in body_en if (p or "").strip()) >= 2
-                if long_para or enough_paras:
-                    has_full_text = True
-
-        it["_has_full_text"] = has_full_text
-
-        # Choose best-available body markdown for preview only if meaningful
-        if has_full_text:
-            if body_md:
-                it["formatted_body_md"] = body_md
-            elif it.get("body_en"):
-                it["formatted_body_md"] = format_translation_to_markdown(it)
-
-        # Page metadata (arXiv-style polish): use absolute canonical
-        title_text = (it.get("title_en") or "")
-        canonical_abs = f"{site_base}/items/{it['id']}/"
-        html = tmpl_item.render(
-            item=it,
-            root="../..",
-            build_version=build_version,
-            title=f"{title_text} — ChinaXiv {it['id']}",
-            canonical_url=canonical_abs,
-            og_title=title_text,
-            og_description=(it.get("abstract_en") or "")[:200],
-            og_url=canonical_abs,
-        )
-        write_text(os.path.join(out_dir, "index.html"), html)
-        # Markdown export (prefer formatted body/abstract if present)
-        abstract_md = it.get("abstract_md") or (it.get("abstract_en") or "")
-        if it.get("body_md"):
-            full_body_md = it["body_md"]
-        elif it.get("body_en"):
-            # fallback: derive from heuristics
-            full_body_md = format_translation_to_markdown(it)
-        else:
-            full_body_md = ""
-
-        md_parts = [
-            f"# {it.get('title_en') or ''}",
-            f"**Authors:** {', '.join(it.get('creators') or [])}",
-            f"**Date:** {it.get('date') or ''}",
-            f"## Abstract\n\n{abstract_md}",
-        ]
-        if full_body_md:
-            md_parts.append("## Full Text\n")
-            md_parts.append(full_body_md)
-        md_parts.append(
-            "\n_Source: ChinaXiv — Machine translation. Verify with original._"
-        )
-        md = "\n\n".join(md_parts) + "\n"
-        write_text(os.path.join(out_dir, f"{it['id']}.md"), md)
-
-        # Optional arXiv-style alias: /abs/<id>/ in addition to /items/<id>/
-        abs_dir = os.path.join(base_out, "abs", it["id"])
-        ensure_dir(abs_dir)
-        write_text(os.path.join(abs_dir, "index.html"), html)
+        _render_item(env, it, build_version, base_out)
 
     # Generate sitemap including all item and alias pages
     try:
@@ -252,11 +291,11 @@ def render_site(items: List[Dict[str, Any]]) -> None:
         log(f"Failed to generate sitemap: {e}")
 
 
-def run_cli() -> None:
+def run_cli(argv: Optional[List[str]] = None) -> None:
     parser = argparse.ArgumentParser(
         description="Render static site from translated records."
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     items = load_translated()
     render_site(items)
     log(f"Rendered site with {len(items)} items → site/")
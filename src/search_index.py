@@ -8,13 +8,15 @@ import gzip as _gzip
 
 from .utils import read_json, log
 from .models import Translation
+from .publish import is_full
 
 
 def build_index(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Build search index entries from translation dicts.
 
     Skips QA-flagged translations to align with renderer behavior
-    (renderer excludes items where _qa_status != 'pass').
+    (renderer excludes items where _qa_status != 'pass'), and abstract-phase
+    saves whose full text is still being translated.
     """
     idx: List[Dict[str, Any]] = []
     for item_data in items:
@@ -22,6 +24,8 @@ def build_index(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if qa_status != "pass":
             # Skip flagged to prevent search hits pointing to non-rendered items
             continue
+        if not is_full(item_data):
+            continue
         translation = Translation.from_dict(item_data)
         idx.append(translation.get_search_index_entry())
     return idx
@@ -76,6 +80,8 @@ def run_cli() -> None:
                 if qa_status != "pass":
                     flagged_skipped += 1
                     continue
+                if not is_full(item_data):
+                    continue
                 entry = Translation.from_dict(item_data).get_search_index_entry()
                 if not first:
                     f.write(",")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Compact store of already-selected record IDs.
+
+Selection skips records whose ID has been seen before. IDs live in an
+in-memory set loaded from:
+
+    data/seen/base.txt              sorted IDs, front-coded (see below)
+    data/seen/delta-YYYYMMDD.txt    append-only, one ID per line, per UTC day
+
+New IDs are appended to today's delta file, so the files committed by CI
+only ever grow at the end (``.gitattributes`` sets ``merge=union`` on the
+deltas, letting concurrent runs merge without conflicts). Compaction folds
+the deltas into a new base once there are more than
+``seen.compact_after_deltas`` of them. It rewrites ``base.txt``, which a
+union merge cannot reconcile, so selection runs never compact: only the
+scheduled build does (``compact --if-due``).
+
+The base file is front-coded: each line is ``<shared>\\t<suffix>`` where
+``shared`` is the length of the prefix shared with the previous ID. Sorted
+IDs like ``chinaxiv-202504.00123`` mostly differ in the last few characters,
+so the base stays small and diffs stay local.
+
+The older ``data/seen.json`` (``{"ids": [...]}``) is read on load and
+removed by the first compaction.
+
+Usage:
+    python -m src.seen_store stats
+    python -m src.seen_store compact [--if-due]
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .config import get_config
+from .file_service import ensure_dir, read_seen
+from .logging_utils import log
+
+
+SEEN_DIR = os.path.join("data", "seen")
+LEGACY_PATH = os.path.join("data", "seen.json")
+BASE_NAME = "base.txt"
+BASE_HEADER = "# seen-ids v1 front-coded"
+COMPACT_AFTER_DELTAS = 7
+
+
+def encode_sorted(ids: Iterable[str]) -> Iterator[str]:
+    """Front-code sorted IDs into ``<shared>\\t<suffix>`` lines."""
+    prev = ""
+    for rid in ids:
+        n = 0
+        limit = min(len(prev), len(rid))
+        while n < limit and prev[n] == rid[n]:
+            n += 1
+        yield f"{n}\t{rid[n:]}"
+        prev = rid
+
+
+def decode_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Inverse of :func:`encode_sorted`; skips the header and blank lines."""
+    prev = ""
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line or line.startswith("#"):
+            continue
+        shared, _, suffix = line.partition("\t")
+        prev = prev[: int(shared)] + suffix
+        yield prev
+
+
+class SeenStore:
+    """Set of seen record IDs backed by a base file and daily deltas."""
+
+    def __init__(self, root: str = SEEN_DIR, legacy_path: Optional[str] = LEGACY_PATH):
+        """
+        Load the seen IDs.
+
+        Args:
+            root: Directory holding ``base.txt`` and ``delta-*.txt``
+            legacy_path: Old ``seen.json`` to import, if present
+        """
+        self.root = root
+        self.legacy_path = legacy_path
+        self.base_path = os.path.join(root, BASE_NAME)
+        self.ids: set = set()
+        self._load()
+
+    def _delta_paths(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.root, "delta-*.txt")))
+
+    def _load(self) -> None:
+        if os.path.exists(self.base_path):
+            with open(self.base_path, "r", encoding="utf-8") as f:
+                self.ids.update(decode_lines(f))
+        for path in self._delta_paths():
+            with open(path, "r", encoding="utf-8") as f:
+                self.ids.update(line.strip() for line in f if line.strip())
+        if self.legacy_path and os.path.exists(self.legacy_path):
+            self.ids.update(read_seen(self.legacy_path).get("ids") or [])
+
+    def __contains__(self, rid: str) -> bool:
+        return rid in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, rid: str) -> bool:
+        """Mark one ID as seen; returns False if it already was."""
+        return self.add_many([rid]) == 1
+
+    def add_many(self, rids: Iterable[str]) -> int:
+        """
+        Mark IDs as seen, appending new ones to today's delta file.
+
+        Returns:
+            Number of IDs that were not seen before
+        """
+        new = []
+        for rid in rids:
+            if rid and rid not in self.ids:
+                self.ids.add(rid)
+                new.append(rid)
+        if new:
+            ensure_dir(self.root)
+            day = time.strftime("%Y%m%d", time.gmtime())
+            with open(os.path.join(self.root, f"delta-{day}.txt"), "a", encoding="utf-8") as f:
+                f.write("".join(f"{rid}\n" for rid in new))
+        return len(new)
+
+    def compact(self) -> None:
+        """Rewrite the base with every seen ID and drop the deltas."""
+        ensure_dir(self.root)
+        tmp = self.base_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(BASE_HEADER + "\n")
+            for line in encode_sorted(sorted(self.ids)):
+                f.write(line + "\n")
+        os.replace(tmp, self.base_path)
+        for path in self._delta_paths():
+            os.remove(path)
+        if self.legacy_path and os.path.exists(self.legacy_path):
+            os.remove(self.legacy_path)
+        log(f"Compacted seen store: {len(self.ids)} IDs")
+
+    def maybe_compact(self, max_deltas: Optional[int] = None) -> bool:
+        """Compact if there are too many deltas or a legacy file to fold in."""
+        if max_deltas is None:
+            cfg = get_config().get("seen") or {}
+            max_deltas = int(cfg.get("compact_after_deltas", COMPACT_AFTER_DELTAS))
+        legacy = bool(self.legacy_path and os.path.exists(self.legacy_path))
+        if legacy or len(self._delta_paths()) > max_deltas:
+            self.compact()
+            return True
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        """ID count and on-disk file count/size."""
+        files = self._delta_paths()
+        if os.path.exists(self.base_path):
+            files.append(self.base_path)
+        return {
+            "ids": len(self.ids),
+            "deltas": len(self._delta_paths()),
+            "bytes": sum(os.path.getsize(p) for p in files),
+        }
+
+
+def run_cli() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Seen record ID store")
+    parser.add_argument("command", choices=["stats", "compact"])
+    parser.add_argument("--root", default=SEEN_DIR)
+    parser.add_argument(
+        "--if-due",
+        action="store_true",
+        help="compact: only past seen.compact_after_deltas deltas (or with a legacy file)",
+    )
+    args = parser.parse_args()
+
+    store = SeenStore(args.root)
+    if args.command == "compact":
+        if args.if_due:
+            store.maybe_compact()
+        else:
+            store.compact()
+    st = store.stats()
+    print(f"{st['ids']} IDs, {st['deltas']} delta files, {st['bytes'] / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    run_cli()
@@ -0,0 +1,91 @@
+"""
+Per-paragraph skip-translation classifier.
+
+Decides for each extracted body paragraph whether it needs the LLM:
+- translate: contains Chinese text
+- passthrough: already Latin-script (English abstracts, Latin citations)
+- mask: formula, number or symbol runs with no prose to translate
+
+Only ``translate`` segments are sent to the network; the others are copied
+verbatim. The checks are a couple of regex scans per paragraph.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+from .token_utils import estimate_tokens
+
+
+TRANSLATE = "translate"
+PASSTHROUGH = "passthrough"
+MASK = "mask"
+
+CJK_RE = re.compile("[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+LATIN_RE = re.compile(r"[A-Za-z]")
+REFERENCE_HEADING_RE = re.compile(
+    r"^\s*(?:[\dIVX]+[.、\s]*)?(?:参考文献|引用文献|references|bibliography)\s*[:：]?\s*$",
+    re.IGNORECASE,
+)
+
+# Below this share of Latin letters (and no CJK), a segment is formula/numbers
+MIN_PROSE_LETTER_RATIO = 0.3
+
+
+@dataclass
+class SegmentDecision:
+    """Classifier outcome for one paragraph."""
+
+    decision: str
+    reason: str
+
+
+def classify_paragraph(text: str, in_references: bool = False) -> SegmentDecision:
+    """
+    Classify a single paragraph.
+
+    Args:
+        text: Paragraph text
+        in_references: Whether the paragraph follows a references heading
+
+    Returns:
+        SegmentDecision
+    """
+    chars = [c for c in text if not c.isspace()]
+    if not chars:
+        return SegmentDecision(PASSTHROUGH, "empty")
+    # Any Chinese at all must be translated or QA will flag it downstream
+    if CJK_RE.search(text):
+        return SegmentDecision(TRANSLATE, "reference" if in_references else "cjk")
+    letters = len(LATIN_RE.findall(text))
+    if letters / len(chars) < MIN_PROSE_LETTER_RATIO:
+        return SegmentDecision(MASK, "formula")
+    return SegmentDecision(PASSTHROUGH, "reference" if in_references else "latin")
+
+
+def classify_paragraphs(paragraphs: List[str]) -> List[SegmentDecision]:
+    """Classify paragraphs in order, tracking entry into the references section."""
+    out: List[SegmentDecision] = []
+    in_references = False
+    for p in paragraphs:
+        if REFERENCE_HEADING_RE.match(p or ""):
+            in_references = True
+            # The heading itself is translated (or passed through) normally
+            out.append(classify_paragraph(p or ""))
+            continue
+        out.append(classify_paragraph(p or "", in_references))
+    return out
+
+
+def summarize_decisions(
+    paragraphs: List[str], decisions: List[SegmentDecision]
+) -> Dict[str, int]:
+    """Count decisions and estimate the input tokens kept off the network."""
+    summary = {TRANSLATE: 0, PASSTHROUGH: 0, MASK: 0, "tokens_saved": 0}
+    for p, d in zip(paragraphs, decisions):
+        summary[d.decision] += 1
+        if d.decision != TRANSLATE:
+            summary["tokens_saved"] += estimate_tokens(p)
+    return summary
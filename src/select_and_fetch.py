@@ -2,20 +2,20 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
+from .http_client import stream_download
+from .prefetch import Prefetcher
 from .utils import (
-    ensure_dir,
     http_get,
     log,
     read_json,
-    read_seen,
     sanitize_filename,
     write_json,
-    write_seen,
 )
+from .seen_store import SeenStore
 
 
 def find_latex_archive_links(html: str, base_url: Optional[str] = None) -> List[str]:
@@ -43,79 +43,87 @@ def find_latex_archive_links(html: str, base_url: Optional[str] = None) -> List[
 
 
 def download_file(url: str, dest_path: str) -> Optional[str]:
+    """Stream ``url`` to ``dest_path``; PDFs are sniffed for ``%PDF-``."""
     try:
-        resp = http_get(url)
+        ok = stream_download(
+            url, dest_path, expect_pdf=dest_path.lower().endswith(".pdf")
+        )
     except Exception as e:
         log(f"download failed {url}: {e}")
         return None
-    # Validate PDF downloads
-    content = resp.content
-    if dest_path.lower().endswith(".pdf"):
-        headers = getattr(resp, "headers", {}) or {}
-        ctype = headers.get("Content-Type", "").lower()
-        if ("pdf" not in ctype) and (not content.startswith(b"%PDF-")):
-            log(f"skipping non-PDF content from {url}")
-            return None
-    ensure_dir(os.path.dirname(dest_path))
-    with open(dest_path, "wb") as f:
-        f.write(content)
-    return dest_path
+    return dest_path if ok else None
+
+
+def fetch_record_files(rec: Dict[str, Any], prefetcher: Prefetcher) -> Dict[str, Any]:
+    """Download the PDF and discover/download the LaTeX archive for one record."""
+    rid = rec.get("id")
+
+    # Download PDF via direct PDF URL if provided
+    pdf_path = None
+    pdf_url = rec.get("pdf_url")
+    if pdf_url:
+        fname = sanitize_filename(f"{rid}.pdf")
+        target = os.path.join("data", "pdfs", fname)
+        result = prefetcher.fetch(pdf_url, download_file, target)
+        pdf_path = result if result else None
+
+    # Try to discover LaTeX source archive from landing page
+    latex_path = None
+    if rec.get("source_url"):
+        try:
+            html = prefetcher.fetch(rec["source_url"], lambda u: http_get(u).text)
+            links = find_latex_archive_links(html, base_url=rec["source_url"]) or []
+            if links:
+                ext = ".tar.gz" if links[0].lower().endswith(".tar.gz") else ".zip"
+                lname = sanitize_filename(f"{rid}{ext}")
+                latex_path = os.path.join("data", "sources", lname)
+                prefetcher.fetch(links[0], download_file, latex_path)
+        except Exception as e:
+            log(f"source discovery failed: {e}")
+
+    return {
+        "pdf_path": pdf_path,
+        "latex_source_path": latex_path,
+        "has_latex_source": bool(latex_path),
+    }
 
 
 def process_records(
-    records_path: str, limit: Optional[int] = None
+    records_path: str,
+    limit: Optional[int] = None,
+    prefetcher: Optional[Prefetcher] = None,
+    seen: Optional[SeenStore] = None,
 ) -> List[Dict[str, Any]]:
     records: List[Dict[str, Any]] = read_json(records_path)
-    seen = read_seen()
-    processed: List[Dict[str, Any]] = []
-    count = 0
-    batch_write_every = 10
-    processed_since_flush = 0
+    seen = seen if seen is not None else SeenStore()
+    seen_ids = set()
+
+    # Pick the unseen records up front so fetches can run concurrently
+    todo: List[Tuple[int, Dict[str, Any]]] = []
     for rec in records:
-        if limit and count >= limit:
+        if limit and len(todo) >= limit:
             break
         rid = rec.get("id")
-        if not rid or rid in (seen.get("ids") or []):
+        if not rid or rid in seen or rid in seen_ids:
             continue
-
-        # Download PDF via direct PDF URL if provided
-        pdf_path = None
-        pdf_url = rec.get("pdf_url")
-        if pdf_url:
-            fname = sanitize_filename(f"{rid}.pdf")
-            target = os.path.join("data", "pdfs", fname)
-            result = download_file(pdf_url, target)
-            pdf_path = result if result else None
-
-        # Try to discover LaTeX source archive from landing page
-        latex_path = None
-        if rec.get("source_url"):
-            try:
-                html = http_get(rec["source_url"]).text
-                links = find_latex_archive_links(html, base_url=rec["source_url"]) or []
-                if links:
-                    ext = ".tar.gz" if links[0].lower().endswith(".tar.gz") else ".zip"
-                    lname = sanitize_filename(f"{rid}{ext}")
-                    latex_path = os.path.join("data", "sources", lname)
-                    download_file(links[0], latex_path)
-            except Exception as e:
-                log(f"source discovery failed: {e}")
-
-        rec["files"] = {
-            "pdf_path": pdf_path,
-            "latex_source_path": latex_path,
-            "has_latex_source": bool(latex_path),
-        }
-        processed.append(rec)
-        count += 1
-        # Mark seen immediately to avoid reprocessing
-        seen.setdefault("ids", []).append(rid)
-        processed_since_flush += 1
-        if processed_since_flush >= batch_write_every:
-            write_seen(seen)
-            processed_since_flush = 0
-    write_seen(seen)
-    return processed
+        seen_ids.add(rid)
+        todo.append((len(todo), rec))
+
+    prefetcher = prefetcher or Prefetcher.from_config()
+    processed: List[Tuple[int, Dict[str, Any]]] = []
+    for (idx, rec), files, err in prefetcher.run(
+        lambda item: fetch_record_files(item[1], prefetcher), todo
+    ):
+        if err is not None:
+            log(f"fetch failed for {rec.get('id')}: {err}")
+            files = {"pdf_path": None, "latex_source_path": None, "has_latex_source": False}
+        rec["files"] = files
+        processed.append((idx, rec))
+        # Mark seen immediately to avoid reprocessing (one appended line)
+        seen.add(rec["id"])
+    # Fetches finish out of order; keep the records file order in the output
+    processed.sort(key=lambda item: item[0])
+    return [rec for _, rec in processed]
 
 
 def run_cli() -> None:
@@ -21,6 +21,14 @@ from ..monitoring import monitoring_service, alert_critical
 from ..tex_guard import mask_math, unmask_math, verify_token_parity
 from ..body_extract import extract_body_paragraphs
 from ..token_utils import chunk_paragraphs
+from ..segment_classifier import (
+    MASK,
+    PASSTHROUGH,
+    TRANSLATE,
+    SegmentDecision,
+    classify_paragraphs,
+    summarize_decisions,
+)
 from ..cost_tracker import compute_cost, append_cost_log
 from ..logging_utils import log
 from ..models import Paper, Translation
@@ -273,6 +281,7 @@ class TranslationService:
         model: Optional[str] = None,
         dry_run: bool = False,
         glossary_override: Optional[List[Dict[str, str]]] = None,
+        decisions: Optional[List[SegmentDecision]] = None,
     ) -> List[str]:
         """
         Translate multiple paragraphs.
@@ -281,10 +290,43 @@ class TranslationService:
             paragraphs: List of paragraphs to translate
             model: Model to use (defaults to service model)
             dry_run: If True, skip actual translation
+            decisions: Precomputed classifier decisions; when skipping is
+                enabled and these are omitted they are computed here
 
         Returns:
             List of translated paragraphs
         """
+        if decisions is None and self._skip_untranslatable():
+            decisions = classify_paragraphs(paragraphs)
+        if decisions is not None:
+            # Only segments that need the LLM go to the network; the rest
+            # (English text, formula runs) are copied verbatim
+            todo = [i for i, d in enumerate(decisions) if d.decision == TRANSLATE]
+            translated = self._translate_paragraph_list(
+                [paragraphs[i] for i in todo], model, dry_run, glossary_override
+            )
+            out = list(paragraphs)
+            for i, t in zip(todo, translated):
+                out[i] = t
+            return out
+        return self._translate_paragraph_list(
+            paragraphs, model, dry_run, glossary_override
+        )
+
+    def _skip_untranslatable(self) -> bool:
+        """Whether the skip-translation classifier is enabled in config."""
+        return (self.config.get("translation") or {}).get(
+            "skip_untranslatable"
+        ) is True
+
+    def _translate_paragraph_list(
+        self,
+        paragraphs: List[str],
+        model: Optional[str],
+        dry_run: bool,
+        glossary_override: Optional[List[Dict[str, str]]],
+    ) -> List[str]:
+        """Translate every paragraph, per paragraph or in batches."""
         model = model or self.model
         glossary_eff = self.glossary if glossary_override is None else glossary_override
         # Optional batching to reduce API calls; disabled by default
@@ -328,6 +370,9 @@ class TranslationService:
         dry_run: bool = False,
         force_full_text: bool = False,
         glossary_override: Optional[List[Dict[str, str]]] = None,
+        body_paragraphs: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        with_body: bool = True,
     ) -> Dict[str, Any]:
         """
         Translate a complete record.
@@ -336,6 +381,10 @@ class TranslationService:
             record: Record to translate
             dry_run: If True, skip actual translation
             force_full_text: If True, translate full text regardless of license (always True now)
+            body_paragraphs: Already extracted body (skips extraction from the record's files)
+            metadata: Abstract-first translation of this record; its title,
+                abstract, authors and subjects are reused instead of re-translated
+            with_body: If False, translate only title, abstract, authors and subjects
 
         Returns:
             Translated record
@@ -350,7 +399,7 @@ class TranslationService:
         paper = Paper.from_dict(record)
 
         # DISABLED: Always allow full text - we don't care about licenses
-        allow_full = True
+        allow_full = with_body
 
         # Create translation from paper
         translation = Translation.from_paper(paper)
@@ -358,60 +407,87 @@ class TranslationService:
         # Translate title and abstract
         title_src = paper.title or ""
         abstract_src = paper.abstract or ""
+        if metadata is not None:
+            # Reuse the abstract-first translation (already paid for)
+            translation = Translation.from_dict(metadata)
+            translation.body_en = None
+            title_src = abstract_src = ""
+        else:
+            translation.title_en = self.translate_field(
+                title_src, dry_run=dry_run, glossary_override=glossary_override
+            )
+            translation.abstract_en = self.translate_field(
+                abstract_src, dry_run=dry_run, glossary_override=glossary_override
+            )
 
-        translation.title_en = self.translate_field(
-            title_src, dry_run=dry_run, glossary_override=glossary_override
-        )
-        translation.abstract_en = self.translate_field(
-            abstract_src, dry_run=dry_run, glossary_override=glossary_override
-        )
-
-        # Translate authors (creators)
-        if paper.creators:
-            translation.creators_en = []
-            for creator in paper.creators:
-                if creator:  # Skip empty strings
-                    try:
-                        translated_name = self.translate_field(
-                            creator, dry_run=dry_run, glossary_override=glossary_override
-                        )
-                        translation.creators_en.append(translated_name)
-                    except Exception as e:
-                        # Fallback to original if translation fails
-                        translation.creators_en.append(creator)
-
-        # Translate subjects
-        if paper.subjects:
-            translation.subjects_en = []
-            for subject in paper.subjects:
-                if subject:  # Skip empty strings
-                    try:
-                        translated_subject = self.translate_field(
-                            subject, dry_run=dry_run, glossary_override=glossary_override
-                        )
-                        translation.subjects_en.append(translated_subject)
-                    except Exception as e:
-                        # Fallback to original if translation fails
-                        translation.subjects_en.append(subject)
+            # Translate authors (creators)
+            if paper.creators:
+                translation.creators_en = []
+                for creator in paper.creators:
+                    if creator:  # Skip empty strings
+                        try:
+                            translated_name = self.translate_field(
+                                creator, dry_run=dry_run, glossary_override=glossary_override
+                            )
+                            translation.creators_en.append(translated_name)
+                        except Exception as e:
+                            # Fallback to original if translation fails
+                            translation.creators_en.append(creator)
+
+            # Translate subjects
+            if paper.subjects:
+                translation.subjects_en = []
+                for subject in paper.subjects:
+                    if subject:  # Skip empty strings
+                        try:
+                            translated_subject = self.translate_field(
+                                subject, dry_run=dry_run, glossary_override=glossary_override
+                            )
+                            translation.subjects_en.append(translated_subject)
+                        except Exception as e:
+                            # Fallback to original if translation fails
+                            translation.subjects_en.append(subject)
 
         # Translate body if allowed
         if allow_full:
-            paras = extract_body_paragraphs(record)
+            paras = (
+                body_paragraphs
+                if body_paragraphs is not None
+                else extract_body_paragraphs(record)
+            )
             if paras:
+                decisions = None
+                if self._skip_untranslatable():
+                    decisions = classify_paragraphs(paras)
+                    summary = summarize_decisions(paras, decisions)
+                    log(
+                        f"{paper.id}: segments translate={summary[TRANSLATE]} "
+                        f"passthrough={summary[PASSTHROUGH]} mask={summary[MASK]} "
+                        f"tokens_saved={summary['tokens_saved']}"
+                    )
                 translation.body_en = self.translate_paragraphs(
-                    paras, dry_run=dry_run, glossary_override=glossary_override
+                    paras,
+                    dry_run=dry_run,
+                    glossary_override=glossary_override,
+                    decisions=decisions,
                 )
 
         # Cost tracking (approximate)
         from ..token_utils import estimate_tokens
 
         in_toks = estimate_tokens(title_src) + estimate_tokens(abstract_src)
-        out_toks = estimate_tokens(translation.title_en or "") + estimate_tokens(
-            translation.abstract_en or ""
-        )
+        out_toks = 0
+        if metadata is None:
+            out_toks = estimate_tokens(translation.title_en or "") + estimate_tokens(
+                translation.abstract_en or ""
+            )
 
         if translation.body_en:
-            in_toks += sum(estimate_tokens(p) for p in paras)
+            in_toks += sum(
+                estimate_tokens(p)
+                for i, p in enumerate(paras)
+                if decisions is None or decisions[i].decision == TRANSLATE
+            )
             out_toks += sum(estimate_tokens(p) for p in translation.body_en)
 
         cost = compute_cost(self.model, in_toks, out_toks, self.config)
@@ -436,66 +512,115 @@ class TranslationService:
         Raises:
             ValueError: If paper not found
         """
-        from ..file_service import read_json, write_json
-        import glob
-        import os
+        from ..publish import PHASE_FULL, mark_phase, publish_config
+        from .formatting_service import FormattingService
 
-        # Load selected records
-        selected_path = os.path.join("data", "selected.json")
-        selected = read_json(selected_path)
+        rec = self.load_record(paper_id)
+        fmt_service = FormattingService(self.config)
 
-        # Find the record in selected.json first
-        rec = next((r for r in selected if r["id"] == paper_id), None)
+        # Abstract first, so the metadata is saved before the slow body work
+        metadata = None
+        if publish_config()["abstract_first"]:
+            metadata = self.translate_abstract(rec, fmt_service, dry_run=dry_run)
 
-        # If not found, try any harvested records under data/records
-        if not rec:
-            records_dir = os.path.join("data", "records")
-            rec_files = sorted(
-                glob.glob(os.path.join(records_dir, "*.json")), reverse=True
-            )
+        # Download PDF and extract text if requested
+        if with_full_text and rec.get("pdf_url"):
+            self.attach_full_text(rec)
 
-            for rf in rec_files:
-                try:
-                    records = read_json(rf)
-                except Exception:
-                    continue
-                rec = next((r for r in records if r.get("id") == paper_id), None)
-                if rec:
-                    break
+        # Translate (always translate full text - we don't care about licenses)
+        tr = self.translate_record(
+            rec, dry_run=dry_run, force_full_text=True, metadata=metadata
+        )
+
+        # Apply LLM formatting (mandatory)
+        tr = fmt_service.format_translation(tr, dry_run=dry_run)
+
+        tr = self.check_quality(tr, fmt_service, dry_run=dry_run)
+        mark_phase(tr, PHASE_FULL, previous=metadata)
+        return self.save_translation(tr)
+
+    def translate_abstract(
+        self, rec: Dict[str, Any], fmt_service: Any = None, dry_run: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Abstract-first phase: translate and save title, abstract and metadata.
+
+        Returns:
+            The saved abstract-phase translation, or None if QA flagged it
+            (the full phase then translates the metadata again)
+        """
+        from ..publish import PHASE_ABSTRACT, mark_phase
+
+        tr = self.translate_record(rec, dry_run=dry_run, with_body=False)
+        tr = self.check_quality(tr, fmt_service, dry_run=dry_run)
+        if tr["_qa_status"] != "pass":
+            return None
+        mark_phase(tr, PHASE_ABSTRACT)
+        self.save_translation(tr)
+        return tr
 
+    def load_record(self, paper_id: str) -> Dict[str, Any]:
+        """
+        Look up a paper's record (selected.json first, then data/records).
+
+        Raises:
+            ValueError: If paper not found
+        """
+        from ..records_store import get_records_store, lookup_record
+
+        rec = lookup_record(paper_id, get_records_store())
         if not rec:
             raise ValueError(
                 f"Paper {paper_id} not found in selected.json or data/records"
             )
+        return rec
 
-        # Download PDF and extract text if requested
-        if with_full_text and rec.get("pdf_url"):
-            from ..pdf_pipeline import process_paper
-
-            pdf_result = process_paper(paper_id, rec["pdf_url"])
-            if pdf_result:
-                # Add local pdf_path to record so extract_body_paragraphs can use it
-                if "files" not in rec:
-                    rec["files"] = {}
-                rec["files"]["pdf_path"] = pdf_result["pdf_path"]
-                log(
-                    f"Downloaded and extracted {pdf_result['num_paragraphs']} paragraphs from PDF"
-                )
+    def attach_full_text(self, rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Download the record's PDF and extract its text.
 
-        # Translate (always translate full text - we don't care about licenses)
-        tr = self.translate_record(rec, dry_run=dry_run, force_full_text=True)
+        Sets ``files.pdf_path`` on the record so body extraction can use it.
 
-        # Apply LLM formatting (mandatory)
-        from .formatting_service import FormattingService
+        Returns:
+            :func:`pdf_pipeline.process_paper` result, or None if it failed
+        """
+        from ..pdf_pipeline import process_paper
 
-        fmt_service = FormattingService(self.config)
-        tr = fmt_service.format_translation(tr, dry_run=dry_run)
+        pdf_result = process_paper(rec["id"], rec["pdf_url"])
+        if pdf_result:
+            rec.setdefault("files", {})["pdf_path"] = pdf_result["pdf_path"]
+            log(
+                f"Downloaded and extracted {pdf_result['num_paragraphs']} paragraphs from PDF"
+            )
+        return pdf_result
+
+    def check_quality(
+        self, tr: Dict[str, Any], fmt_service: Any = None, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run the QA filter on a formatted translation and store its verdict.
+
+        Retries once when a few Chinese characters slipped through, and
+        records ``_qa_*`` fields on the translation.
 
-        # Apply QA filter to check for Chinese characters
+        Args:
+            tr: Formatted translation
+            fmt_service: FormattingService used to re-format a retry
+            dry_run: If True, never retry
+
+        Returns:
+            The translation (the retry's, if it was better)
+        """
         from ..qa_filter import TranslationQAFilter
 
+        if fmt_service is None:
+            from .formatting_service import FormattingService
+
+            fmt_service = FormattingService(self.config)
+
         qa_filter = TranslationQAFilter()
         qa_result = qa_filter.check_translation(tr)
+        paper_id = tr.get("id")
 
         # Simple retry for Chinese characters or Chinese punctuation issues
         # We retry when QA flagged explicit Chinese content (ideographs)
@@ -531,13 +656,13 @@ class TranslationService:
                     tr = fmt_service.format_translation(retry_translation, dry_run=dry_run)
                     qa_result = retry_qa
                     log(
-                        f"Retry successful for {rec['id']}: {len(qa_result.chinese_chars)} Chinese chars remaining"
+                        f"Retry successful for {paper_id}: {len(qa_result.chinese_chars)} Chinese chars remaining"
                     )
                 else:
-                    log(f"Retry failed for {rec['id']}: no improvement")
+                    log(f"Retry failed for {paper_id}: no improvement")
 
             except Exception as e:
-                log(f"Retry failed for {rec['id']}: {e}")
+                log(f"Retry failed for {paper_id}: {e}")
 
             tr["_retry_attempted"] = True
 
@@ -552,17 +677,34 @@ class TranslationService:
         # Log QA results
         if qa_result.status.value != "pass":
             log(
-                f"QA Flagged {rec['id']}: {qa_result.status.value} (score: {qa_result.score:.2f})"
+                f"QA Flagged {paper_id}: {qa_result.status.value} (score: {qa_result.score:.2f})"
             )
             for issue in qa_result.issues:
                 log(f"  - {issue}")
 
-        # Save
+        return tr
+
+    def save_translation(self, tr: Dict[str, Any]) -> str:
+        """
+        Write a translation to ``data/translated``.
+
+        The record is marked translated once the full text is in (not for
+        an abstract-phase save).
+
+        Returns:
+            Path to translated JSON file
+        """
+        from ..file_service import write_json
+        from ..publish import is_full
+        from ..records_store import STATUS_TRANSLATED, get_records_store
+        import os
+
         out_dir = os.path.join("data", "translated")
         os.makedirs(out_dir, exist_ok=True)
-        out_path = os.path.join(out_dir, f"{rec['id']}.json")
+        out_path = os.path.join(out_dir, f"{tr['id']}.json")
         write_json(out_path, tr)
-
+        if is_full(tr):
+            get_records_store().set_status([tr["id"]], STATUS_TRANSLATED)
         return out_path
 
     def _retry_translate_with_prompt(
@@ -0,0 +1,182 @@
+"""
+Streaming stage graph for the paper pipeline.
+
+Items flow through a chain of stages connected by bounded queues:
+
+    source -> stage 1 -> stage 2 -> ... -> results
+
+Each stage runs ``concurrency`` threads. A full queue blocks the stage
+feeding it (backpressure), so a fast stage never runs far ahead of a slow
+one and memory stays bounded by the queue sizes. Items are handed on as soon
+as a stage finishes them, so the first item reaches the end while later ones
+are still in early stages, and total run time approaches that of the slowest
+stage rather than the sum of all stages.
+
+A stage function returns the item for the next stage, or None to drop it.
+An exception stops that item and is reported with the stage name; the other
+items keep flowing.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Marks the end of a stage's input
+_DONE = object()
+
+Result = Tuple[Any, Optional[BaseException], Optional[str]]
+
+
+@dataclass
+class Stage:
+    """One step of the graph."""
+
+    name: str
+    fn: Callable[[Any], Any]
+    concurrency: int = 1
+    queue_size: Optional[int] = None  # input queue bound (default: graph queue_size)
+    # Filled in while running
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Items processed/failed and mean seconds per item."""
+        done = self.processed + self.failed
+        return {
+            "processed": self.processed,
+            "failed": self.failed,
+            "concurrency": self.concurrency,
+            "avg_seconds": self.busy_seconds / done if done else None,
+        }
+
+
+class StageGraph:
+    """Run items through a chain of stages with bounded queues between them."""
+
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        """
+        Args:
+            stages: Stages in order
+            queue_size: Default bound of each stage's input queue
+        """
+        if not stages:
+            raise ValueError("StageGraph needs at least one stage")
+        self.stages = stages
+        for stage in stages:
+            stage.concurrency = max(1, int(stage.concurrency))
+        self._queues: List[queue.Queue] = [
+            queue.Queue(maxsize=max(1, s.queue_size or queue_size)) for s in stages
+        ]
+        self._results: "queue.Queue[Any]" = queue.Queue()
+        self._stop = threading.Event()
+
+    def _put(self, q: queue.Queue, entry: Any) -> bool:
+        """Blocking put that gives up once the graph is stopped."""
+        while not self._stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _feed(self, items: Iterable[Any]) -> None:
+        try:
+            for item in items:
+                if not self._put(self._queues[0], item):
+                    return
+        except BaseException as e:
+            self._results.put((None, e, "source"))
+        finally:
+            for _ in range(self.stages[0].concurrency):
+                self._put(self._queues[0], _DONE)
+
+    def _worker(self, index: int, remaining: List[int], lock: threading.Lock) -> None:
+        stage = self.stages[index]
+        inbox = self._queues[index]
+        last = index == len(self.stages) - 1
+        while True:
+            try:
+                item = inbox.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            if item is _DONE:
+                break
+            started = time.monotonic()
+            # BaseException too: a thread that dies without reporting would
+            # never close the next stage and the consumer would wait forever
+            try:
+                out = stage.fn(item)
+            except BaseException as e:
+                with stage._lock:
+                    stage.failed += 1
+                    stage.busy_seconds += time.monotonic() - started
+                self._results.put((item, e, stage.name))
+                continue
+            with stage._lock:
+                stage.processed += 1
+                stage.busy_seconds += time.monotonic() - started
+            if out is None:
+                continue
+            if last:
+                self._results.put((out, None, None))
+            elif not self._put(self._queues[index + 1], out):
+                return
+        # The last thread of a stage closes the next stage's input
+        with lock:
+            remaining[index] -= 1
+            closing = remaining[index] == 0
+        if closing:
+            if last:
+                self._results.put(_DONE)
+            else:
+                for _ in range(self.stages[index + 1].concurrency):
+                    self._put(self._queues[index + 1], _DONE)
+
+    def run(self, items: Iterable[Any]) -> Iterator[Result]:
+        """
+        Stream ``items`` through the stages.
+
+        Yields ``(item, error, stage_name)`` as items finish: the output of
+        the last stage with ``(None, None)``, or the failed item with the
+        exception and the stage that raised it. Closing the iterator early
+        stops all stages.
+        """
+        lock = threading.Lock()
+        remaining = [s.concurrency for s in self.stages]
+        threads = [threading.Thread(target=self._feed, args=(items,), daemon=True)]
+        for i, stage in enumerate(self.stages):
+            threads.extend(
+                threading.Thread(
+                    target=self._worker,
+                    args=(i, remaining, lock),
+                    name=f"{stage.name}-{n}",
+                    daemon=True,
+                )
+                for n in range(stage.concurrency)
+            )
+        for t in threads:
+            t.start()
+        try:
+            # Every result is queued before the last stage closes
+            while True:
+                entry = self._results.get()
+                if entry is _DONE:
+                    break
+                yield entry
+        finally:
+            self._stop.set()
+            for t in threads:
+                t.join(timeout=1.0)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage :meth:`Stage.stats`, in stage order."""
+        return {s.name: s.stats() for s in self.stages}
@@ -0,0 +1,238 @@
+"""
+Supervisor for background translation worker processes.
+
+Starts N ``python -m src.worker <i> --threads T`` processes and keeps them
+running until the queue is drained:
+
+- a worker that exits 0 has run out of jobs and is not restarted
+- a worker that crashes is restarted after an exponential backoff, which
+  resets once it has stayed up for ``stable_after`` seconds
+- SIGTERM/SIGINT stop restarts and forward SIGTERM so every worker finishes
+  the jobs it holds; stragglers are killed after ``drain_timeout`` seconds
+
+Combined throughput (jobs completed since start, per hour) is logged every
+``report_interval`` seconds and at exit. Defaults come from the ``workers``
+section of ``config.yaml``.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import job_queue
+from .config import get_config
+from .utils import log
+
+PID_DIR = Path("data/workers")
+SUPERVISOR_PID = "supervisor.pid"
+
+
+@dataclass
+class WorkerProcess:
+    """State of one supervised worker slot."""
+
+    index: int
+    proc: Optional[subprocess.Popen] = None
+    started_at: float = 0.0
+    restarts: int = 0
+    crashes: int = 0  # consecutive crashes, drives the backoff
+    restart_at: Optional[float] = None
+    finished: bool = False
+    exit_codes: List[int] = field(default_factory=list)
+
+
+class WorkerSupervisor:
+    """Run, restart and drain a pool of worker processes."""
+
+    def __init__(
+        self,
+        num_workers: int,
+        threads: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        stable_after: Optional[float] = None,
+        drain_timeout: Optional[float] = None,
+        report_interval: Optional[float] = None,
+        poll_interval: float = 1.0,
+        command: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            num_workers: Worker processes to run
+            threads: Job slots per process (default: config workers.threads)
+            backoff_base: First restart delay in seconds; doubles per crash
+            backoff_max: Upper bound for the restart delay
+            stable_after: Uptime after which a worker's crash count resets
+            drain_timeout: Seconds to wait for workers after SIGTERM
+            report_interval: Seconds between throughput reports
+            poll_interval: Seconds between process checks
+            command: Worker command prefix (the worker index and
+                ``--threads`` are appended); default ``python -m src.worker``
+        """
+        cfg = get_config().get("workers") or {}
+        self.num_workers = max(1, num_workers)
+        self.threads = max(1, int(threads or cfg.get("threads", 4)))
+        self.backoff_base = float(
+            backoff_base if backoff_base is not None else cfg.get("restart_backoff_base", 2.0)
+        )
+        self.backoff_max = float(
+            backoff_max if backoff_max is not None else cfg.get("restart_backoff_max", 120.0)
+        )
+        self.stable_after = float(
+            stable_after if stable_after is not None else cfg.get("stable_after", 60.0)
+        )
+        self.drain_timeout = float(
+            drain_timeout if drain_timeout is not None else cfg.get("drain_timeout", 300.0)
+        )
+        self.report_interval = float(
+            report_interval if report_interval is not None else cfg.get("report_interval", 60.0)
+        )
+        self.poll_interval = poll_interval
+        self.command = command or [sys.executable, "-m", "src.worker"]
+        self.workers = [WorkerProcess(i) for i in range(self.num_workers)]
+        self.stopping = False
+        self._started = 0.0
+        self._baseline = 0
+
+    # ------------------------------------------------------------------
+    # Process management
+    # ------------------------------------------------------------------
+
+    def _spawn(self, w: WorkerProcess) -> None:
+        cmd = self.command + [str(w.index), "--threads", str(self.threads)]
+        w.proc = subprocess.Popen(cmd)
+        w.started_at = time.monotonic()
+        w.restart_at = None
+        log(f"[supervisor] worker-{w.index} started as worker-{w.index}-{w.proc.pid}")
+
+    def backoff(self, crashes: int) -> float:
+        """Restart delay after ``crashes`` consecutive crashes."""
+        return min(self.backoff_max, self.backoff_base * 2 ** max(0, crashes - 1))
+
+    def _check(self, w: WorkerProcess, now: float) -> None:
+        """Reap an exited worker and schedule or perform its restart."""
+        if w.proc is not None:
+            code = w.proc.poll()
+            if code is None:
+                return
+            w.proc = None
+            w.exit_codes.append(code)
+            if code == 0 or self.stopping:
+                w.finished = True
+                log(f"[supervisor] worker-{w.index} exited ({code})")
+                return
+            uptime = now - w.started_at
+            w.crashes = 1 if uptime >= self.stable_after else w.crashes + 1
+            delay = self.backoff(w.crashes)
+            w.restart_at = now + delay
+            log(
+                f"[supervisor] worker-{w.index} crashed (exit {code}, up {uptime:.0f}s); "
+                f"restarting in {delay:.0f}s"
+            )
+        if w.restart_at is not None and now >= w.restart_at and not self.stopping:
+            w.restarts += 1
+            self._spawn(w)
+
+    def _alive(self) -> List[WorkerProcess]:
+        return [w for w in self.workers if w.proc is not None]
+
+    def handle_shutdown(self, signum, frame) -> None:
+        """Stop restarting and ask every worker to drain."""
+        if self.stopping:
+            return
+        log("[supervisor] Received shutdown signal; draining workers")
+        self.stopping = True
+        for w in self._alive():
+            try:
+                w.proc.send_signal(signal.SIGTERM)
+            except OSError:
+                pass
+
+    def _drain(self) -> None:
+        """Wait for workers to finish their jobs, then kill stragglers."""
+        deadline = time.monotonic() + self.drain_timeout
+        while self._alive() and time.monotonic() < deadline:
+            for w in self._alive():
+                self._check(w, time.monotonic())
+            time.sleep(self.poll_interval)
+        for w in self._alive():
+            log(f"[supervisor] worker-{w.index} did not drain in time; killing")
+            w.proc.kill()
+            w.proc.wait()
+            w.proc = None
+            w.finished = True
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def throughput(self) -> Dict[str, float]:
+        """Jobs completed since start and the combined rate."""
+        done = job_queue.get_stats()["completed"] - self._baseline
+        hours = max(time.monotonic() - self._started, 1e-9) / 3600
+        return {
+            "completed": done,
+            "jobs_per_hour": done / hours,
+            "running": len(self._alive()),
+            "restarts": sum(w.restarts for w in self.workers),
+        }
+
+    def _report(self, final: bool = False) -> None:
+        t = self.throughput()
+        prefix = "Finished" if final else "Progress"
+        log(
+            f"[supervisor] {prefix}: {t['completed']} jobs completed, "
+            f"{t['jobs_per_hour']:.1f} jobs/h across {self.num_workers} workers x "
+            f"{self.threads} threads ({t['running']} running, {t['restarts']} restarts)"
+        )
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def run(self) -> Dict[str, float]:
+        """
+        Supervise workers until they all finish or a shutdown is requested.
+
+        Returns:
+            Final :meth:`throughput`
+        """
+        PID_DIR.mkdir(parents=True, exist_ok=True)
+        pid_file = PID_DIR / SUPERVISOR_PID
+        pid_file.write_text(str(os.getpid()))
+        previous = {
+            sig: signal.signal(sig, self.handle_shutdown)
+            for sig in (signal.SIGTERM, signal.SIGINT)
+        }
+
+        self._started = time.monotonic()
+        self._baseline = job_queue.get_stats()["completed"]
+        log(
+            f"[supervisor] Starting {self.num_workers} workers x {self.threads} threads "
+            f"(PID: {os.getpid()})"
+        )
+        try:
+            for w in self.workers:
+                self._spawn(w)
+            next_report = time.monotonic() + self.report_interval
+            while not self.stopping and not all(w.finished for w in self.workers):
+                now = time.monotonic()
+                for w in self.workers:
+                    self._check(w, now)
+                if now >= next_report:
+                    self._report()
+                    next_report = now + self.report_interval
+                time.sleep(self.poll_interval)
+            self._drain()
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            if pid_file.exists():
+                pid_file.unlink()
+        self._report(final=True)
+        return self.throughput()
@@ -0,0 +1,113 @@
+"""
+Rolling-window throughput and ETA for the job queues.
+
+Both queues keep recent completion events ``(ts, worker_id, model,
+seconds)`` (epoch completion time, who did it, which model translated it,
+how long the job ran). :func:`summarize` turns the events inside a window
+into jobs/hour overall, per worker and per model, and an ETA for the
+remaining jobs. Work is proportional to the events in the window, not to
+the size of the queue.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .config import get_config
+
+WINDOW_SECONDS = 900.0
+
+Event = Tuple[float, Optional[str], Optional[str], Optional[float]]
+
+
+def window_seconds() -> float:
+    """Configured window (``throughput.window_seconds``)."""
+    cfg = get_config().get("throughput") or {}
+    return float(cfg.get("window_seconds", WINDOW_SECONDS))
+
+
+def iso_to_epoch(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds for an ISO timestamp written by ``datetime.now().isoformat()``."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate(events: list, now: float, window: float) -> Dict[str, Any]:
+    """Jobs/hour for events, measured from the first job's start in the window."""
+    if not events:
+        return {"completed": 0, "jobs_per_hour": 0.0, "avg_seconds": None}
+    start = min(ts - (secs or 0.0) for ts, _, _, secs in events)
+    span = min(window, max(now - start, 1.0))
+    durations = [secs for _, _, _, secs in events if secs is not None]
+    return {
+        "completed": len(events),
+        "jobs_per_hour": len(events) / span * 3600,
+        "avg_seconds": sum(durations) / len(durations) if durations else None,
+    }
+
+
+def summarize(
+    events: Iterable[Event],
+    remaining: int = 0,
+    window: Optional[float] = None,
+    now: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Throughput over the last ``window`` seconds and the ETA for ``remaining`` jobs.
+
+    Args:
+        events: Completion events ``(ts, worker_id, model, seconds)``
+        remaining: Jobs still to do (pending + in progress)
+        window: Window length in seconds (default: :func:`window_seconds`)
+        now: Current epoch time (for tests)
+
+    Returns:
+        Dict with ``window``, ``completed``, ``jobs_per_hour``,
+        ``avg_seconds``, ``by_worker``, ``by_model``, ``remaining``,
+        ``eta_seconds`` (None while nothing has completed) and ``eta``
+        (ISO timestamp or None)
+    """
+    window = window_seconds() if window is None else window
+    now = time.time() if now is None else now
+    recent = [e for e in events if e[0] >= now - window]
+    by_worker: Dict[str, list] = {}
+    by_model: Dict[str, list] = {}
+    for e in recent:
+        by_worker.setdefault(e[1] or "unknown", []).append(e)
+        by_model.setdefault(e[2] or "unknown", []).append(e)
+
+    out = {"window": window, **_rate(recent, now, window)}
+    out["by_worker"] = {k: _rate(v, now, window) for k, v in sorted(by_worker.items())}
+    out["by_model"] = {k: _rate(v, now, window) for k, v in sorted(by_model.items())}
+    out["remaining"] = remaining
+    eta = None
+    if remaining and out["jobs_per_hour"] > 0:
+        eta = remaining / out["jobs_per_hour"] * 3600
+    elif not remaining:
+        eta = 0.0
+    out["eta_seconds"] = eta
+    out["eta"] = (
+        datetime.fromtimestamp(now + eta).isoformat(timespec="seconds")
+        if eta is not None
+        else None
+    )
+    return out
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Human-readable duration such as ``3h 20m`` (``unknown`` for None)."""
+    if seconds is None:
+        return "unknown"
+    minutes = int(round(seconds / 60))
+    if minutes < 60:
+        return f"{minutes}m"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 48:
+        return f"{hours}h {minutes:02d}m"
+    return f"{hours / 24:.1f}d"
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 from src.config import get_config
+from src.pdf_pipeline import compact_ocr_report
 from src.reporting import build_markdown_report, save_validation_report
 
 logger = logging.getLogger(__name__)
@@ -27,8 +28,8 @@ def run_ocr_gate(report_dir: str = "reports") -> OCRGateSummary:
     report_path = os.path.join(report_dir, "ocr_report.json")
 
     try:
-        with open(report_path, "r", encoding="utf-8") as f:
-            records = json.load(f)
+        # Fold the per-paper append log into the aggregate before reading
+        records = compact_ocr_report(report_dir)
     except Exception:
         logger.exception("Failed to load OCR report from %s", report_path)
         records = {}
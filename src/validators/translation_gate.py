@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 from src.config import get_config
+from src.publish import is_full
 from src.reporting import build_markdown_report, save_validation_report
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,8 @@ def run_translation_gate(output_path: str = "reports/translation_report.json") -
     passed = 0
     flagged = 0
     total = 0
+    # Abstract-phase saves are checked once their full text is in
+    pending = 0
 
     files = sorted(glob.glob("data/translated/*.json"))
 
@@ -38,6 +41,10 @@ def run_translation_gate(output_path: str = "reports/translation_report.json") -
         try:
             with open(fp, "r", encoding="utf-8") as f:
                 data = json.load(f)
+            if not is_full(data):
+                total -= 1
+                pending += 1
+                continue
             res = qa.check_translation(data)
             results[os.path.basename(fp)] = {
                 "status": res.status.value,
@@ -76,6 +83,7 @@ def run_translation_gate(output_path: str = "reports/translation_report.json") -
         "passed": passed,
         "flagged": flagged,
         "flagged_ratio": round(flagged_ratio, 4),
+        "pending_full_text": pending,
         "reasons": reasons,
         "thresholds": {
             "max_flagged_ratio": max_flagged_ratio,
@@ -1,36 +1,50 @@
 """
 Background worker process for batch translation.
+
+Each worker process runs ``--threads`` job slots that claim, translate and
+complete jobs concurrently (translation is network-bound, so threads are
+enough within a process). ``src.supervisor`` starts and restarts several of
+these processes.
 """
 
 import argparse
 import os
 import signal
 import sys
+import threading
 import time
 from pathlib import Path
 
 from . import job_queue
 from .utils import log
-from .config import load_dotenv
+from .config import get_config, load_dotenv
 
 
 class BackgroundWorker:
     """Independent worker process for translation jobs."""
 
-    def __init__(self, worker_id: int):
-        self.worker_id = f"worker-{worker_id}"
+    def __init__(self, worker_id: int, threads: int = 1):
+        self.index = worker_id
         self.pid = os.getpid()
+        # Unique per process: a restarted worker must not renew the leases
+        # of the process it replaces, so those jobs expire and are reclaimed
+        self.worker_id = f"worker-{worker_id}-{self.pid}"
+        self.threads = max(1, threads)
         self.should_stop = False
         self.jobs_processed = 0
-        self.idle_cycles = 0
+        self._count_lock = threading.Lock()
         self.max_idle_cycles = 24  # 2 minutes (5s * 24)
+        # Renew leases well before they expire
+        self.heartbeat_interval = max(1.0, job_queue.job_queue.lease_seconds / 3)
+        # Recorded with each completion for per-model throughput
+        self.model = (get_config().get("models") or {}).get("default_slug")
 
     def write_pid_file(self) -> None:
         """Write PID file for process tracking."""
         pid_dir = Path("data/workers")
         pid_dir.mkdir(parents=True, exist_ok=True)
 
-        pid_file = pid_dir / f"{self.worker_id}.pid"
+        pid_file = pid_dir / f"worker-{self.index}.pid"
         with open(pid_file, "w") as f:
             f.write(str(self.pid))
 
@@ -38,7 +52,7 @@ class BackgroundWorker:
 
     def remove_pid_file(self) -> None:
         """Remove PID file on shutdown."""
-        pid_file = Path("data/workers") / f"{self.worker_id}.pid"
+        pid_file = Path("data/workers") / f"worker-{self.index}.pid"
         if pid_file.exists():
             pid_file.unlink()
 
@@ -47,6 +61,14 @@ class BackgroundWorker:
         log(f"[{self.worker_id}] Received shutdown signal")
         self.should_stop = True
 
+    def _heartbeat_loop(self, done: threading.Event) -> None:
+        """Keep this worker's leases alive while its slots are running."""
+        while not done.wait(self.heartbeat_interval):
+            try:
+                job_queue.update_heartbeat(self.worker_id)
+            except Exception as e:
+                log(f"[{self.worker_id}] Heartbeat failed: {e}")
+
     def run_translation(self, paper_id: str) -> None:
         """
         Run translation for a paper.
@@ -101,75 +123,107 @@ class BackgroundWorker:
         signal.signal(signal.SIGTERM, self.handle_shutdown)
         signal.signal(signal.SIGINT, self.handle_shutdown)
 
-        log(f"[{self.worker_id}] Ready")
+        log(f"[{self.worker_id}] Ready ({self.threads} threads)")
+        job_queue.update_heartbeat(self.worker_id)
+
+        # Long papers keep their lease for as long as we are alive
+        done = threading.Event()
+        beat = threading.Thread(target=self._heartbeat_loop, args=(done,), daemon=True)
+        beat.start()
+        slots = [
+            threading.Thread(target=self._slot_loop, args=(n,), name=f"{self.worker_id}-{n}")
+            for n in range(self.threads)
+        ]
+        for t in slots:
+            t.start()
+        try:
+            # Join with a timeout so the main thread keeps handling signals
+            while any(t.is_alive() for t in slots):
+                for t in slots:
+                    t.join(timeout=1.0)
+        finally:
+            done.set()
+            beat.join()
 
-        # Main loop
-        while not self.should_stop:
-            # Update heartbeat
-            job_queue.update_heartbeat(self.worker_id)
+        # Cleanup
+        log(f"[{self.worker_id}] Shutting down ({self.jobs_processed} jobs completed)")
+        self.remove_pid_file()
 
+    def _slot_loop(self, slot: int) -> None:
+        """Claim and process jobs until stopped or idle for too long."""
+        idle_cycles = 0
+        while not self.should_stop:
             # Claim a job
             job = job_queue.claim_job(self.worker_id)
 
             if not job:
-                self.idle_cycles += 1
+                idle_cycles += 1
 
                 # Auto-exit if idle too long
-                if self.idle_cycles >= self.max_idle_cycles:
-                    log(f"[{self.worker_id}] No jobs for 2 minutes, exiting")
+                if idle_cycles >= self.max_idle_cycles:
+                    log(f"[{self.worker_id}/{slot}] No jobs for 2 minutes, exiting")
                     break
 
                 time.sleep(5)
                 continue
 
             # Reset idle counter
-            self.idle_cycles = 0
-
-            # Process job
-            job_id = job["id"]
-            paper_id = job["paper_id"]
-            attempts = job["attempts"]
+            idle_cycles = 0
+            self.process_job(job)
 
-            log(f"[{self.worker_id}] Processing {paper_id} (attempt {attempts + 1})")
+    def process_job(self, job: dict) -> bool:
+        """
+        Translate one claimed job and record the outcome in the queue.
 
-            try:
-                # Translate
-                self.run_translation(paper_id)
+        Returns:
+            True if the job completed
+        """
+        # Job IDs are paper IDs
+        paper_id = job["id"]
+        attempts = job["attempts"]
 
-                # QA sampling (every 10th job)
-                if job_id % 10 == 0:
-                    log(f"[{self.worker_id}] Running QA for {paper_id}")
-                    self.run_qa_evaluation(paper_id)
+        log(f"[{self.worker_id}] Processing {paper_id} (attempt {attempts + 1})")
+        try:
+            # Translate
+            self.run_translation(paper_id)
 
-                # Mark complete
-                job_queue.complete_job(job_id)
-                job_queue.increment_worker_jobs(self.worker_id)
+            with self._count_lock:
                 self.jobs_processed += 1
+                processed = self.jobs_processed
 
-                log(
-                    f"[{self.worker_id}] Completed {paper_id} ({self.jobs_processed} total)"
-                )
+            # QA sampling (every 10th job)
+            if processed % 10 == 0:
+                log(f"[{self.worker_id}] Running QA for {paper_id}")
+                self.run_qa_evaluation(paper_id)
 
-            except Exception as e:
-                error_msg = str(e)
-                log(f"[{self.worker_id}] Failed {paper_id}: {error_msg}")
-                job_queue.fail_job(job_id, error_msg)
+            # Mark complete
+            job_queue.complete_job(paper_id, worker_id=self.worker_id, model=self.model)
+            job_queue.increment_worker_jobs(self.worker_id)
 
-                # Sleep on error to avoid rapid retries
-                time.sleep(2)
+            log(f"[{self.worker_id}] Completed {paper_id} ({processed} total)")
+            return True
 
-        # Cleanup
-        log(f"[{self.worker_id}] Shutting down ({self.jobs_processed} jobs completed)")
-        self.remove_pid_file()
+        except Exception as e:
+            error_msg = str(e)
+            log(f"[{self.worker_id}] Failed {paper_id}: {error_msg}")
+            job_queue.fail_job(paper_id, error_msg, worker_id=self.worker_id)
+            job_queue.increment_worker_jobs(self.worker_id, failed=True)
+
+            # Sleep on error to avoid rapid retries
+            time.sleep(2)
+            return False
 
 
 def run_cli() -> None:
     """CLI entry point for worker."""
     parser = argparse.ArgumentParser(description="Background translation worker")
     parser.add_argument("worker_id", type=int, help="Worker ID (0-based)")
+    parser.add_argument(
+        "--threads", type=int, default=1, help="Jobs processed concurrently (default: 1)"
+    )
     args = parser.parse_args()
 
-    worker = BackgroundWorker(args.worker_id)
+    worker = BackgroundWorker(args.worker_id, threads=args.threads)
     worker.run()
 
 
@@ -1,9 +1,82 @@
 import os
 import sys
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 # Ensure project root is on sys.path to import src.* modules
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+
+# Minimal page long enough to be treated as a real abstract page
+FAKE_PAGE = "<html><h1>A sufficiently long paper title</h1>" + "x" * 2000 + "</html>"
+# Body Bright Data returns for a ChinaXiv ID that does not exist
+MISSING_PAGE = "<ErrorResponseData>"
+
+
+class FakeResponse:
+    def __init__(self, status_code, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeSession:
+    """
+    Stand-in for the ``requests`` session of the Bright Data API.
+
+    By default pages are routed on the paper number at the end of the
+    requested URL: numbers in ``existing`` get ``page``, others the
+    "missing" error body. Pass ``responder(url) -> FakeResponse`` to answer
+    requests directly instead.
+    """
+
+    def __init__(self, existing=(), page=FAKE_PAGE, responder=None, delay=0.0):
+        self.existing = set(existing)
+        self.page = page
+        self.responder = responder
+        self.delay = delay
+        self.calls = []  # requested URLs
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @property
+    def ids(self):
+        """Paper numbers requested so far, in request order."""
+        return [int(url.rsplit(".", 1)[-1]) for url in self.calls]
+
+    def _respond(self, url):
+        if self.responder is not None:
+            return self.responder(url)
+        if int(url.rsplit(".", 1)[-1]) in self.existing:
+            return FakeResponse(200, self.page)
+        return FakeResponse(200, MISSING_PAGE)
+
+    def post(self, url, json=None, timeout=None):
+        with self.lock:
+            self.calls.append(json["url"])
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return self._respond(json["url"])
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def fake_session():
+    """Factory for :class:`FakeSession` (see its docstring for the arguments)."""
+    return FakeSession
+
+
+@pytest.fixture
+def fake_response():
+    """The :class:`FakeResponse` class, for custom responders."""
+    return FakeResponse
@@ -69,8 +69,10 @@ def test_pipeline_smoke_passes_all_gates(tmp_path: Path, monkeypatch: pytest.Mon
     assert result["pdf_path"].endswith(".pdf")
     assert result["paragraphs"], "Expected extracted paragraphs for native PDF"
 
+    assert (reports_dir / "ocr_report.jsonl").exists(), "process_paper should append to the OCR report log"
+    pdf_pipeline.compact_ocr_report(str(reports_dir))
     ocr_report_path = reports_dir / "ocr_report.json"
-    assert ocr_report_path.exists(), "process_paper should mirror results into reports/ocr_report.json"
+    assert ocr_report_path.exists(), "compaction should build reports/ocr_report.json"
     ocr_report = json.loads(ocr_report_path.read_text(encoding="utf-8"))
     entry = ocr_report[record_id]
     assert entry["need_ocr"] is False
@@ -159,6 +161,7 @@ def test_process_paper_records_ocr_improvement(tmp_path: Path, monkeypatch: pyte
     assert result is not None
     assert call_counter["calls"] >= 2  # Baseline extraction + post-OCR extraction
 
+    pdf_pipeline.compact_ocr_report("reports")
     report_path = Path("reports/ocr_report.json")
     record = json.loads(report_path.read_text(encoding="utf-8"))[record_id]
     assert record["need_ocr"] is True
@@ -36,3 +36,38 @@ def test_body_extract_prefers_latex(tmp_path, monkeypatch):
     paras = extract_body_paragraphs(rec)
     assert len(paras) >= 1
 
+
+
+def test_extract_from_latex_follows_includes_and_picks_main(tmp_path):
+    import zipfile
+
+    zip_path = tmp_path / "src.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("figs/readme.tex", "只是说明文件，不是正文。" * 50)
+        zf.writestr(
+            "paper/main.tex",
+            "\\documentclass{article}\n\\begin{document}\n引言段落。\n\n"
+            "\\input{sections/method}\n% \\input{sections/unused}\n\\end{document}\n",
+        )
+        zf.writestr("paper/sections/method.tex", "方法部分的内容。\n\n\\include{appendix}")
+        zf.writestr("appendix.tex", "附录内容。")
+        zf.writestr("paper/sections/unused.tex", "不应出现。")
+
+    paras = extract_from_latex(str(zip_path))
+    text = "\n".join(paras)
+    assert "引言段落" in text and "方法部分" in text and "附录内容" in text
+    assert "不应出现" not in text
+    assert "说明文件" not in text
+
+
+def test_extract_from_latex_caches_by_mtime(tmp_path, monkeypatch):
+    from src import body_extract
+
+    tar_path = make_tex_tar(tmp_path)
+    first = extract_from_latex(tar_path)
+
+    def boom(_path):
+        raise AssertionError("archive should not be re-read")
+
+    monkeypatch.setattr(body_extract, "_read_tex_sources", boom)
+    assert extract_from_latex(tar_path) == first
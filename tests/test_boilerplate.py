@@ -0,0 +1,57 @@
+from src import body_extract
+from src.boilerplate import strip_page_furniture
+
+
+TOPICS = ["模型", "数据", "实验", "方法", "结果", "讨论", "结论", "引言"]
+
+
+def _pages(n: int):
+    pages = []
+    for i in range(1, n + 1):
+        topic = TOPICS[i - 1]
+        header = "中国科学院大学学报 第 42 卷" if i % 2 else "张三等：深度学习在遥感中的应用"
+        pages.append(
+            [
+                header,
+                f"正文关于{topic}的第一段，内容各不相同。" * 3,
+                f"正文关于{topic}的第二段。",
+                "http://www.chinaxiv.org  DOI: 10.12074/2025.00001",
+                f"- {i} -",
+            ]
+        )
+    return pages
+
+
+def test_strip_page_furniture_drops_headers_footers_and_numbers():
+    result = strip_page_furniture(_pages(8))
+
+    assert len(result.paragraphs) == 16
+    assert all("正文" in p for p in result.paragraphs)
+    assert len(result.dropped) == 8 * 3
+    assert result.tokens_saved > 0
+    assert 0 < result.saved_ratio < 1
+
+
+def test_strip_page_furniture_keeps_short_documents_and_body_repeats():
+    # Too few pages to judge repetition; only bare page numbers go
+    pages = [["标题行", "正文。"], ["标题行", "更多正文。", "2"]]
+    result = strip_page_furniture(pages)
+    assert result.paragraphs == ["标题行", "正文。", "标题行", "更多正文。"]
+
+    # A repeated block in the middle of the page is body text, not furniture
+    mid = [["a", "b", "c", "重复的正文句子。", "d", "e", "f"] for _ in range(5)]
+    kept = strip_page_furniture(mid, min_pages=3).paragraphs
+    assert kept.count("重复的正文句子。") == 5
+
+
+def test_extract_from_pdf_strips_furniture(tmp_path, monkeypatch):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    text = "\f".join("\n\n".join(page) for page in _pages(6))
+
+    import pdfminer.high_level
+
+    monkeypatch.setattr(pdfminer.high_level, "extract_text", lambda _p: text)
+    paras = body_extract.extract_from_pdf(str(pdf))
+    assert len(paras) == 12
+    assert not any("DOI" in p for p in paras)
@@ -312,6 +312,14 @@ class TestBatchTranslateBugs:
                 'pending': 3,
                 'failed': 0
             }
+            mock_queue.get_worker_stats.return_value = []
+            mock_queue.get_throughput.return_value = {
+                'window': 900.0,
+                'jobs_per_hour': 120.0,
+                'by_worker': {},
+                'by_model': {},
+                'eta_seconds': 150.0,
+            }
             
             # Should not crash
             show_status()
@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.chinaxiv_parse import parse_abstract_page, parse_many
+from src.fetch_engine import BrightDataEngine
+from src.harvest_chinaxiv_smart import SmartChinaXivScraper
+
+PAGES = Path(__file__).parent / "fixtures" / "harvest" / "abs_pages"
+CASES = sorted(p.stem for p in PAGES.glob("*.html"))
+
+
+def _load(paper_id):
+    html = (PAGES / f"{paper_id}.html").read_text(encoding="utf-8")
+    golden = json.loads((PAGES / f"{paper_id}.json").read_text(encoding="utf-8"))
+    return html, golden
+
+
+@pytest.mark.parametrize("paper_id", CASES)
+def test_parse_matches_golden(paper_id):
+    html, golden = _load(paper_id)
+    assert parse_abstract_page(html, paper_id) == golden
+
+
+def test_scraper_parse_paper_uses_fast_parser():
+    engine = BrightDataEngine("key", "parse-zone", session=object())
+    scraper = SmartChinaXivScraper("key", "parse-zone", engine=engine)
+    html, golden = _load(CASES[0])
+    assert scraper.parse_paper(html, CASES[0]) == golden
+
+
+def test_parse_many_on_process_pool():
+    pages = [(pid, _load(pid)[0]) for pid in CASES]
+    expected = [_load(pid)[1] for pid in CASES]
+    assert list(parse_many(pages, workers=2, chunksize=1)) == expected
@@ -0,0 +1,277 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.cloud_job_queue import CloudJobQueue, JobStatus, lane_of
+
+
+def _queue(tmp_path, **kwargs):
+    return CloudJobQueue(str(tmp_path / "cloud_jobs.json"), **kwargs)
+
+
+def test_claim_complete_fail_and_stats(tmp_path):
+    q = _queue(tmp_path)
+    assert q.add_jobs(["p1", "p2", "p3"]) == 3
+    assert q.add_jobs(["p1"]) == 0
+
+    batch = q.claim_batch("w1", batch_size=2)
+    assert [j["paper_id"] for j in batch] == ["p1", "p2"]
+    assert all(j["status"] == JobStatus.IN_PROGRESS and j["attempts"] == 1 for j in batch)
+
+    q.complete_job("p1")
+    q.complete_job("p2", qa_passed=False)
+    q.fail_job("p3", "never claimed")
+    assert q.get_stats() == {
+        "total": 3,
+        "pending": 1,
+        "in_progress": 0,
+        "completed": 1,
+        "failed": 0,
+        "qa_flagged": 1,
+    }
+    assert q.get_job("p3")["error"] == "never claimed"
+
+
+def test_other_processes_see_log_and_compaction(tmp_path):
+    a = _queue(tmp_path)
+    b = _queue(tmp_path)  # separate index, as in another process
+    a.add_jobs(["p1", "p2"])
+    assert [j["paper_id"] for j in b.claim_batch("wb", batch_size=1)] == ["p1"]
+    # a catches up on b's claim before claiming
+    assert [j["paper_id"] for j in a.claim_batch("wa")] == ["p2"]
+
+    a.compact()
+    assert (tmp_path / "cloud_jobs.log.jsonl").stat().st_size == 0
+    with open(tmp_path / "cloud_jobs.json") as f:
+        snapshot = json.load(f)
+    assert {j["paper_id"]: j["worker_id"] for j in snapshot["jobs"]} == {"p1": "wb", "p2": "wa"}
+
+    # b reloads from the new snapshot after a's compaction
+    b.complete_job("p2")
+    assert b.get_stats()["completed"] == 1
+    assert _queue(tmp_path).get_job("p2")["status"] == JobStatus.COMPLETED
+
+
+def test_automatic_compaction_and_torn_log_line(tmp_path):
+    q = _queue(tmp_path, compact_every=3)
+    q.add_jobs(["p1", "p2", "p3"])  # 3 events -> compacted
+    assert (tmp_path / "cloud_jobs.log.jsonl").stat().st_size == 0
+    q.complete_job("p1")
+    with open(tmp_path / "cloud_jobs.log.jsonl", "a") as f:
+        f.write('{"job": {"paper_id": "p2", "sta')  # crashed mid-append
+    fresh = _queue(tmp_path)
+    assert fresh.get_stats()["completed"] == 1
+    assert fresh.get_job("p2")["status"] == JobStatus.PENDING
+
+    # The next append starts on a fresh line instead of completing the torn one
+    fresh.complete_job("p3")
+    again = _queue(tmp_path)
+    assert again.get_stats()["completed"] == 2
+    assert again.get_job("p3")["status"] == JobStatus.COMPLETED
+
+
+def test_concurrent_completions_are_not_lost(tmp_path):
+    q = _queue(tmp_path)
+    ids = [f"p{i:05d}" for i in range(2000)]
+    q.add_jobs(ids)
+    claimed = q.claim_batch("w", batch_size=len(ids))
+    assert len(claimed) == len(ids)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(q.complete_job, ids))
+    elapsed = time.perf_counter() - started
+
+    assert _queue(tmp_path).get_stats()["completed"] == len(ids)
+    assert elapsed < 5.0
+
+
+def test_sharded_queue_routes_claims_and_steals(tmp_path):
+    from src.cloud_job_queue import ShardedCloudQueue, owned_shard, shard_of
+
+    ids = [f"chinaxiv-202504.{i:05d}" for i in range(40)]
+    q = ShardedCloudQueue(4, str(tmp_path / "shards"))
+    assert q.add_jobs(ids) == 40
+    assert owned_shard("gh-1-1-shard-2", 4) == 2
+
+    own = [p for p in ids if shard_of(p, 4) == 2]
+    batch = q.claim_batch("gh-1-1-shard-2", batch_size=len(own))
+    assert sorted(j["paper_id"] for j in batch) == sorted(own)
+
+    # Own shard is dry: separate checkouts stop there, shared ones steal
+    assert q.claim_batch("gh-1-1-shard-2", batch_size=5) == []
+    stolen = q.claim_batch("gh-1-1-shard-2", batch_size=5, steal=True)
+    assert len(stolen) == 5 and all(shard_of(j["paper_id"], 4) != 2 for j in stolen)
+
+    for job in batch + stolen:
+        q.complete_job(job["paper_id"])
+    assert q.get_stats()["completed"] == len(own) + 5
+    assert q.get_stats()["total"] == 40
+
+
+def test_split_and_merge_round_trip(tmp_path):
+    from src.cloud_job_queue import ShardedCloudQueue
+
+    single = _queue(tmp_path)
+    single.add_jobs([f"p{i}" for i in range(20)])
+    single.claim_batch("w", batch_size=3)
+
+    sharded = ShardedCloudQueue.split(single, 3, str(tmp_path / "shards"))
+    assert sharded.get_stats()["in_progress"] == 3
+    for job in sharded.claim_batch("runner-x", batch_size=20, steal=True):
+        sharded.complete_job(job["paper_id"])
+
+    out = tmp_path / "merged.json"
+    assert sharded.merge(str(out)) == 20
+    merged = CloudJobQueue(str(out))
+    assert merged.get_stats()["completed"] == 17
+    assert merged.get_stats()["in_progress"] == 3
+
+
+def test_claim_policies_and_work_budget(tmp_path):
+    q = _queue(tmp_path)
+    costs = {"small": 20.0, "big": 600.0, "medium": 120.0, "unknown": None}
+    q.add_jobs(
+        list(costs),
+        estimates={pid: {"est_seconds": s} for pid, s in costs.items() if s},
+    )
+
+    # Jobs without an estimate count as DEFAULT_EST_SECONDS (60)
+    lpt = [j["paper_id"] for j in q.claim_batch("w", batch_size=2, policy="lpt")]
+    assert lpt == ["big", "medium"]
+    spt = [j["paper_id"] for j in q.claim_batch("w", batch_size=1, policy="spt")]
+    assert spt == ["small"]
+
+    q.set_estimates({"unknown": {"est_seconds": 900.0, "est_basis": "pages"}})
+    assert q.get_job("unknown")["est_basis"] == "pages"
+    assert q.set_estimates({"unknown": {"est_seconds": 900.0}}) == 0
+
+    try:
+        q.claim_batch("w", policy="random")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown policy accepted")
+
+    # A budget stops the batch once the estimated work reaches it, but
+    # always hands out at least one job
+    q2 = _queue(tmp_path / "budget")
+    q2.add_jobs(
+        [f"p{i}" for i in range(10)],
+        estimates={f"p{i}": {"est_seconds": 100.0} for i in range(10)},
+    )
+    assert len(q2.claim_batch("w", batch_size=10, work_budget=250)) == 3
+    assert len(q2.claim_batch("w", batch_size=10, work_budget=1)) == 1
+
+
+def test_lanes_reserve_fresh_share_and_weight_the_rest(tmp_path):
+    q = _queue(tmp_path)
+    q.add_jobs([f"b{i}" for i in range(10)])
+    q.claim_batch("w", batch_size=1)  # b0
+    q.complete_job("b0", qa_passed=False)
+    q.add_jobs([f"f{i}" for i in range(10)], lane="fresh")
+    assert q.requeue_flagged() == 1
+    assert lane_of(q.get_job("b0")) == "rework"
+
+    # Default config: 25% reserved for fresh, then weights 4/2/3/1
+    batch = q.claim_batch("w", batch_size=8)
+    lanes = [j["lane"] for j in batch]
+    assert lanes[:2] == ["fresh", "fresh"]
+    assert lanes.count("fresh") == 5
+    assert lanes.count("backfill") == 2
+    assert lanes.count("rework") == 1
+
+    # A failed backfill job moves to the retry lane; fresh stays fresh
+    q.fail_job("b1", "timeout")
+    q.fail_job("f0", "timeout")
+    assert lane_of(q.get_job("b1")) == "retry"
+    assert lane_of(q.get_job("f0")) == "fresh"
+    stats = q.get_lane_stats()
+    assert stats["retry"]["pending"] == 1
+    assert stats["fresh"]["pending"] == 6
+    assert stats["rework"] == {"pending": 0, "oldest": None}
+    assert sum(s["pending"] for s in stats.values()) == q.get_stats()["pending"]
+
+    # Empty lanes give their share to the others
+    q2 = _queue(tmp_path / "backfill")
+    q2.add_jobs([f"p{i}" for i in range(5)])
+    assert [j["paper_id"] for j in q2.claim_batch("w", batch_size=5)] == [
+        f"p{i}" for i in range(5)
+    ]
+
+
+def test_set_estimates_keeps_fifo_order(tmp_path):
+    q = _queue(tmp_path)
+    q.add_jobs(["p1", "p2", "p3"])
+    q.set_estimates({"p1": {"est_seconds": 30.0}})
+    assert [j["paper_id"] for j in q.claim_batch("w", batch_size=3)] == ["p1", "p2", "p3"]
+
+    # Replaying the log (another process) gives the same order
+    q2 = _queue(tmp_path / "other")
+    q2.add_jobs(["p1", "p2", "p3"])
+    q2.set_estimates({"p1": {"est_seconds": 30.0}})
+    reopened = CloudJobQueue(q2.queue_file)
+    assert [j["paper_id"] for j in reopened.claim_batch("w", batch_size=3)] == [
+        "p1",
+        "p2",
+        "p3",
+    ]
+
+
+def test_job_estimates_use_best_known_size(tmp_path):
+    from src.job_estimates import DEFAULTS, estimate_job, estimate_paper, pdf_page_count
+
+    pdf = tmp_path / "p1.pdf"
+    pdf.write_bytes(
+        b"%PDF-1.4\n1 0 obj << /Type /Pages /Count 3 >>\n"
+        + b"<< /Type /Page >>\n" * 3
+        + b"%%EOF"
+    )
+    assert pdf_page_count(str(pdf)) == 3
+    assert pdf_page_count(str(tmp_path / "missing.pdf")) is None
+
+    record = {"abstract": "x" * 400}
+    guess = estimate_paper("p0", record, pdf_dir=str(tmp_path), cfg=DEFAULTS)
+    paged = estimate_paper("p1", record, pdf_dir=str(tmp_path), cfg=DEFAULTS)
+    extracted = estimate_paper(
+        "p1", record, {"post_ocr_chars": 400_000, "num_paragraphs": 900},
+        pdf_dir=str(tmp_path), cfg=DEFAULTS,
+    )
+    assert guess["est_basis"] == "abstract"
+    assert paged["est_basis"] == "pages" and paged["est_tokens"] == 100 + 3 * 900
+    assert extracted["est_basis"] == "text" and extracted["est_tokens"] == 100_100
+    assert paged["est_seconds"] < guess["est_seconds"] < extracted["est_seconds"]
+    assert estimate_job(paragraphs=10, cfg=DEFAULTS)["est_tokens"] == 1500
+
+
+def test_estimates_read_the_unfolded_extraction_log(tmp_path):
+    from src.job_estimates import estimate_papers
+    from src.pdf_pipeline import _write_ocr_record
+
+    reports = tmp_path / "reports"
+    _write_ocr_record(str(reports), "p1", {"post_ocr_chars": 400_000})
+    assert not (reports / "ocr_report.json").exists()
+
+    est = estimate_papers(
+        ["p1"], {"p1": {"abstract": "x"}}, pdf_dir=str(tmp_path),
+        report_path=str(reports / "ocr_report.json"),
+    )
+    assert est["p1"]["est_basis"] == "text"
+
+
+def test_throughput_from_recent_completions(tmp_path):
+    q = _queue(tmp_path)
+    q.add_jobs(["p1", "p2", "p3", "done"])
+    for job in q.claim_batch("w1", batch_size=2):
+        q.complete_job(job["paper_id"], model="m1")
+    q.complete_job("done")  # never claimed: not counted
+
+    rate = q.get_throughput(window=900)
+    assert rate["completed"] == 2
+    assert rate["remaining"] == 1
+    assert set(rate["by_worker"]) == {"w1"}
+    assert set(rate["by_model"]) == {"m1"}
+    assert rate["eta_seconds"] is not None
+
+    # Another process rebuilds the same window from the log
+    assert _queue(tmp_path).get_throughput(window=900)["completed"] == 2
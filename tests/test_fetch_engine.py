@@ -0,0 +1,61 @@
+import requests
+
+from src.fetch_engine import BrightDataEngine, ZoneBudget
+
+PAGE = "<html>" + "x" * 2000 + "</html>"
+
+
+def _engine(session, zone="test-zone", **kw):
+    ZoneBudget._registry.pop(zone, None)
+    kw.setdefault("rate_per_sec", 0)
+    kw.setdefault("backoff_base", 0)
+    return BrightDataEngine("key", zone, session=session, **kw)
+
+
+def test_fetch_classifies_and_retries(fake_session, fake_response):
+    attempts = {"n": 0}
+
+    def responder(url):
+        if url.endswith("flaky"):
+            attempts["n"] += 1
+            if attempts["n"] < 3:
+                return fake_response(503)
+            return fake_response(200, PAGE)
+        if url.endswith("missing"):
+            return fake_response(200, "<ErrorResponseData>")
+        if url.endswith("timeout"):
+            raise requests.exceptions.Timeout("slow")
+        return fake_response(403, "denied")
+
+    engine = _engine(fake_session(responder=responder), max_retries=3)
+
+    ok = engine.fetch("https://chinaxiv.org/abs/flaky")
+    assert ok.status == "ok" and ok.html == PAGE and ok.attempts == 3
+    assert engine.fetch("https://chinaxiv.org/abs/missing").status == "missing"
+    assert engine.fetch("https://chinaxiv.org/abs/denied").attempts == 1
+    timed_out = engine.fetch("https://chinaxiv.org/abs/timeout")
+    assert timed_out.status == "error" and timed_out.attempts == 4
+
+    metrics = engine.metrics()
+    assert metrics["requests"] == 4
+    assert metrics["retries"] == 2 + 3
+    assert "latency_p95" in metrics
+
+
+def test_fetch_many_is_concurrent_and_ordered(fake_session):
+    session = fake_session(range(1, 21), page=PAGE, delay=0.01)
+    engine = _engine(session, concurrency=4)
+    urls = [f"https://chinaxiv.org/abs/202501.{i:05d}" for i in range(1, 21)]
+
+    out = [url for url, result in engine.fetch_many(urls)]
+
+    assert out == urls
+    assert 1 < session.peak <= 4
+
+
+def test_zone_budget_is_shared_and_strictest():
+    ZoneBudget._registry.pop("shared", None)
+    a = ZoneBudget.for_zone("shared", 10.0)
+    b = ZoneBudget.for_zone("shared", 2.0)
+    assert a is b
+    assert a.min_interval == 0.5
@@ -0,0 +1,49 @@
+import os
+
+from src.fetch_engine import BrightDataEngine
+from src.harvest_checkpoint import CheckpointLog, load_checkpoint
+from src.harvest_chinaxiv import ChinaXivScraper
+
+
+def test_log_replay_dedupes_and_skips_torn_line(tmp_path):
+    path = str(tmp_path / "ckpt.jsonl")
+    with CheckpointLog(path, fsync_every=2) as log:
+        log.append(1, {"id": "a", "v": 1})
+        log.append(3, {"id": "b"})
+        log.append(4, {"id": "a", "v": 2})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"n": 9, "paper": {"id"')
+
+    state = load_checkpoint(path)
+    assert state["last_id_num"] == 4
+    assert sorted(p["id"] for p in state["papers"]) == ["a", "b"]
+    assert {p["id"]: p for p in state["papers"]}["a"]["v"] == 2
+
+    # A fresh run truncates the old log
+    CheckpointLog(path, reset=True).close()
+    assert load_checkpoint(path) == {"papers": [], "last_id_num": 0}
+
+
+def test_scrape_resume_and_compact(tmp_path, monkeypatch, fake_session):
+    monkeypatch.chdir(tmp_path)
+    engine = BrightDataEngine(
+        "key", "ckpt-zone", session=fake_session({1, 2, 3}), rate_per_sec=0
+    )
+    scraper = ChinaXivScraper("key", "ckpt-zone", engine=engine)
+
+    scraper.scrape_month("202504", max_consecutive_404s=3)
+    ckpt_path = scraper._checkpoint_paths("202504")[0]
+    assert os.path.exists(ckpt_path)
+
+    checkpoint = scraper._load_checkpoint("202504")
+    assert checkpoint["last_id_num"] == 3
+    assert len(checkpoint["papers"]) == 3
+
+    # Resume continues after the last checkpointed ID and keeps earlier papers
+    engine.session.existing.add(5)
+    scraper.stats["consecutive_404s"] = 0
+    papers = scraper.scrape_month("202504", checkpoint=checkpoint, max_consecutive_404s=3)
+    assert [p["oai_identifier"][-2:] for p in papers] == ["01", "02", "03", "05"]
+
+    scraper.save_results("202504", papers)
+    assert not os.path.exists(ckpt_path)
@@ -0,0 +1,31 @@
+from src.fetch_engine import BrightDataEngine
+from src.harvest_chinaxiv_optimized import (
+    OptimizedChinaXivScraper,
+    load_max_ids,
+)
+
+
+def _scraper(fake_session, existing, zone):
+    session = fake_session(existing)
+    engine = BrightDataEngine(
+        "key", zone, session=session, concurrency=16, rate_per_sec=0
+    )
+    return OptimizedChinaXivScraper("key", zone, engine=engine), session
+
+
+def test_find_max_id_tolerates_gaps_and_remembers(tmp_path, monkeypatch, fake_session):
+    monkeypatch.chdir(tmp_path)
+    # 412 papers with a few withdrawn IDs, including just below the end
+    existing = set(range(1, 413)) - {57, 200, 372, 403, 407, 411}
+    scraper, session = _scraper(fake_session, existing, "maxid-a")
+
+    assert scraper.find_max_id("202504") == 412
+    assert len(session.calls) < 100
+    assert load_max_ids() == {"202504": 412}
+
+    # Next run starts from the remembered max and only gallops over new IDs
+    existing |= set(range(413, 431))
+    scraper, session = _scraper(fake_session, existing, "maxid-b")
+    assert scraper.find_max_id("202504") == 430
+    assert len(session.calls) <= 64
+    assert load_max_ids()["202504"] == 430
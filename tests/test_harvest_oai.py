@@ -1,6 +1,8 @@
-from src.harvest_oai import normalize_record
+import pytest
 from lxml import etree
 
+from src.harvest_oai import normalize_record
+
 
 def test_normalize_record_dc_minimal():
     xml = """
@@ -29,3 +31,119 @@ def test_normalize_record_dc_minimal():
     assert rec["title"] == "示例标题"
     assert rec["license"]["raw"].startswith("CC-BY") or rec["license"]["raw"].startswith("CC BY")
 
+
+
+def _page(ids, token=None):
+    records = "".join(
+        f"""
+        <record>
+          <header><identifier>oai:chinaxiv.org:{i}</identifier><datestamp>2025-10-02</datestamp></header>
+          <metadata><dc:title>T {i}</dc:title></metadata>
+        </record>"""
+        for i in ids
+    )
+    tok = f"<resumptionToken>{token}</resumptionToken>" if token else "<resumptionToken/>"
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+    <OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+      <ListRecords>{records}{tok}</ListRecords>
+    </OAI-PMH>"""
+
+
+def test_harvest_sets_streams_concurrently_and_resumes(tmp_path, monkeypatch):
+    import json
+
+    from src import harvest_oai
+
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("a", None): _page(["2025-1", "2025-2"], token="a2"),
+        ("a", "a2"): _page(["2025-3"]),
+        ("b", None): _page(["2025-4"], token="b2"),
+        ("b", "b2"): _page(["2025-5"]),
+    }
+    calls = []
+    fail_b2 = {"on": True}
+
+    def fake_request(base_url, **params):
+        token = params.get("resumptionToken")
+        set_spec = params.get("set") or token[0]
+        calls.append((set_spec, token))
+        if token == "b2" and fail_b2["on"]:
+            raise RuntimeError("timeout")
+        return pages[(set_spec, token)]
+
+    monkeypatch.setattr(harvest_oai, "oai_request", fake_request)
+
+    def run(resume=False):
+        sink = harvest_oai.JsonlSink("data/records/w.jsonl", append=resume)
+        try:
+            return harvest_oai.harvest_sets(
+                "http://oai",
+                "oai_dc",
+                "2025-10-01",
+                "2025-10-02",
+                ["a", "b"],
+                sink,
+                page_delay=0,
+                resume=resume,
+            )
+        finally:
+            sink.close()
+
+    with pytest.raises(harvest_oai.HarvestError) as err:
+        run()
+    # set b failed after its first page; a still finished
+    assert err.value.counts == {"a": 3}
+    assert list(err.value.failed) == ["b"]
+
+    # A plain rerun starts b over instead of reusing its saved token
+    calls.clear()
+    with pytest.raises(harvest_oai.HarvestError):
+        run()
+    assert ("b", None) in calls
+
+    # Resumed run: a is done, b restarts from its saved token
+    fail_b2["on"] = False
+    calls.clear()
+    assert run(resume=True) == {"a": 0, "b": 1}
+    assert calls == [("b", "b2")]
+
+    n = harvest_oai.jsonl_to_json_array("data/records/w.jsonl", "data/records/w.json")
+    with open("data/records/w.json", encoding="utf-8") as f:
+        ids = sorted(r["id"] for r in json.load(f))
+    assert n == 5
+    assert ids == ["2025-1", "2025-2", "2025-3", "2025-4", "2025-5"]
+
+    # Without --resume a finished window is harvested again from scratch,
+    # replacing the stream instead of appending to it
+    pages[("a", None)] = pages[("a", None)].replace("T 2025-1", "T 2025-1 v2")
+    calls.clear()
+    assert run() == {"a": 3, "b": 2}
+    assert sorted(calls, key=str) == sorted(
+        [("a", None), ("a", "a2"), ("b", None), ("b", "b2")], key=str
+    )
+    with open("data/records/w.jsonl", encoding="utf-8") as f:
+        assert len(f.readlines()) == 5
+    harvest_oai.jsonl_to_json_array("data/records/w.jsonl", "data/records/w.json")
+    with open("data/records/w.json", encoding="utf-8") as f:
+        titles = {r["id"]: r["title"] for r in json.load(f)}
+    assert titles["2025-1"] == "T 2025-1 v2"
+
+
+def test_jsonl_to_json_array_keeps_last_copy(tmp_path):
+    import json
+
+    from src.harvest_oai import jsonl_to_json_array
+
+    stream = tmp_path / "w.jsonl"
+    stream.write_text(
+        "\n".join(
+            json.dumps(r)
+            for r in [{"id": "1", "v": 1}, {"id": "2", "v": 1}, {"id": "1", "v": 2}]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    assert jsonl_to_json_array(str(stream), str(tmp_path / "w.json")) == 2
+    with open(tmp_path / "w.json", encoding="utf-8") as f:
+        assert json.load(f) == [{"id": "2", "v": 1}, {"id": "1", "v": 2}]
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from src import http_client
+from src.http_client import HttpError, stream_download
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status: int = 200, headers=None, fail_after=None):
+        self.body = body
+        self.status_code = status
+        self.headers = headers or {}
+        self.fail_after = fail_after
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        sent = 0
+        for i in range(0, len(self.body), 4):
+            if self.fail_after is not None and sent >= self.fail_after:
+                raise http_client.requests.ConnectionError("connection reset")
+            chunk = self.body[i : i + 4]
+            sent += len(chunk)
+            yield chunk
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs.get("headers") or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    monkeypatch.setattr(stream_download.retry, "sleep", lambda _s: None)
+    monkeypatch.setattr(http_client, "get_proxies", lambda: (None, "none"))
+
+
+def test_stream_download_writes_pdf(tmp_path, monkeypatch, no_retry_wait):
+    body = b"%PDF-1.4 hello world"
+    monkeypatch.setattr(http_client, "get_session", lambda: FakeSession([FakeResponse(body)]))
+
+    dest = tmp_path / "out" / "a.pdf"
+    assert stream_download("https://x/a.pdf", str(dest), expect_pdf=True)
+    assert dest.read_bytes() == body
+    assert not Path(f"{dest}.part").exists()
+
+
+def test_stream_download_rejects_non_pdf_and_oversize(tmp_path, monkeypatch, no_retry_wait):
+    session = FakeSession(
+        [
+            FakeResponse(b"<html>error page</html>"),
+            FakeResponse(b"%PDF-" + b"x" * 100),
+        ]
+    )
+    monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+    dest = tmp_path / "a.pdf"
+    assert not stream_download("https://x/a.pdf", str(dest), expect_pdf=True)
+    assert not stream_download("https://x/a.pdf", str(dest), expect_pdf=True, max_bytes=50)
+    assert not dest.exists()
+    assert not Path(f"{dest}.part").exists()
+
+
+def test_stream_download_resumes_with_range(tmp_path, monkeypatch, no_retry_wait):
+    body = b"%PDF-" + bytes(range(60))
+    session = FakeSession(
+        [
+            FakeResponse(body, fail_after=20),
+            FakeResponse(
+                body[20:],
+                status=206,
+                headers={"Content-Range": f"bytes 20-{len(body) - 1}/{len(body)}"},
+            ),
+        ]
+    )
+    monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+    dest = tmp_path / "a.pdf"
+    assert stream_download("https://x/a.pdf", str(dest), expect_pdf=True)
+    assert dest.read_bytes() == body
+    assert "Range" not in session.calls[0]
+    assert session.calls[1]["Range"] == "bytes=20-"
+
+
+def test_stream_download_raises_after_retries(tmp_path, monkeypatch, no_retry_wait):
+    monkeypatch.setattr(
+        http_client,
+        "get_session",
+        lambda: FakeSession([FakeResponse(b"", status=503) for _ in range(5)]),
+    )
+    with pytest.raises(HttpError):
+        stream_download("https://x/a.pdf", str(tmp_path / "a.pdf"))
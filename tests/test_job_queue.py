@@ -5,7 +5,6 @@ import pytest
 import tempfile
 import os
 import json
-from pathlib import Path
 from unittest.mock import patch
 from src.job_queue import JobQueue, add_jobs, claim_job, complete_job, fail_job, get_stats
 
@@ -17,10 +16,9 @@ class TestJobQueue:
     def temp_queue(self):
         """Create a temporary job queue for testing."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            with patch('src.job_queue.Path') as mock_path:
-                mock_path.return_value = Path(temp_dir)
-                queue = JobQueue()
-                yield queue
+            queue = JobQueue(os.path.join(temp_dir, "job_queue.db"))
+            yield queue
+            queue.close()
     
     def test_add_jobs(self, temp_queue):
         """Test adding jobs to queue."""
@@ -116,6 +114,47 @@ class TestJobQueue:
         stats = temp_queue.get_stats()
         assert stats["total"] == 0
 
+    def test_claims_are_exclusive_across_threads(self, temp_queue):
+        """Concurrent workers never receive the same job."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        temp_queue.add_jobs([f"paper{i:03d}" for i in range(50)])
+
+        def _drain(worker):
+            got = []
+            while True:
+                job = temp_queue.claim_job(worker)
+                if job is None:
+                    return got
+                got.append(job["id"])
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            claimed = [j for ids in ex.map(_drain, ["w1", "w2", "w3", "w4"]) for j in ids]
+        assert sorted(claimed) == [f"paper{i:03d}" for i in range(50)]
+        assert temp_queue.get_stats()["in_progress"] == 50
+
+    def test_migrate_from_files(self, temp_queue, tmp_path):
+        """Jobs from the old data/jobs/*.json layout are imported once."""
+        jobs_dir = tmp_path / "jobs"
+        jobs_dir.mkdir()
+        legacy = [
+            {"id": "b", "status": "pending", "created_at": "2025-01-02T00:00:00", "attempts": 1},
+            {"id": "a", "status": "completed", "created_at": "2025-01-01T00:00:00",
+             "attempts": 0, "completed_at": "2025-01-01T01:00:00", "worker_id": "w"},
+            {"id": "c", "status": "failed", "created_at": "2025-01-03T00:00:00",
+             "attempts": 3, "last_error": "boom"},
+        ]
+        for job in legacy:
+            (jobs_dir / f"{job['id']}.json").write_text(json.dumps(job))
+        (jobs_dir / "broken.json").write_text("{")
+
+        assert temp_queue.migrate_from_files(str(jobs_dir)) == 3
+        assert temp_queue.migrate_from_files(str(jobs_dir)) == 0
+        stats = temp_queue.get_stats()
+        assert (stats["pending"], stats["completed"], stats["failed"]) == (1, 1, 1)
+        assert temp_queue.get_failed_jobs() == [{"paper_id": "c", "attempts": 3, "error": "boom"}]
+        assert temp_queue.claim_job("w1")["attempts"] == 1
+
 
 class TestConvenienceFunctions:
     """Test convenience functions."""
@@ -144,13 +183,13 @@ class TestConvenienceFunctions:
     def test_complete_job_function(self, mock_queue):
         """Test complete_job convenience function."""
         complete_job("paper1")
-        mock_queue.complete_job.assert_called_once_with("paper1")
+        mock_queue.complete_job.assert_called_once_with("paper1", worker_id=None, model=None)
     
     @patch('src.job_queue.job_queue')
     def test_fail_job_function(self, mock_queue):
         """Test fail_job convenience function."""
         fail_job("paper1", "Test error")
-        mock_queue.fail_job.assert_called_once_with("paper1", "Test error")
+        mock_queue.fail_job.assert_called_once_with("paper1", "Test error", worker_id=None)
     
     @patch('src.job_queue.job_queue')
     def test_get_stats_function(self, mock_queue):
@@ -160,4 +199,122 @@ class TestConvenienceFunctions:
         stats = get_stats()
         assert stats["total"] == 1
         assert stats["pending"] == 1
-        mock_queue.get_stats.assert_called_once()
\ No newline at end of file
+        mock_queue.get_stats.assert_called_once()
+
+class TestLeases:
+    """Lease-based claiming, heartbeats and reclaim."""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        queue = JobQueue(str(tmp_path / "job_queue.db"), lease_seconds=60)
+        yield queue
+        queue.close()
+
+    def test_expired_lease_is_reclaimed_on_next_claim(self, queue):
+        queue.add_jobs(["paper1"])
+        job = queue.claim_job("w1")
+        assert job["lease_expires_at"] > 0
+        assert queue.claim_job("w2") is None  # still leased
+
+        with patch("src.job_queue.time.time", return_value=job["lease_expires_at"] + 1):
+            again = queue.claim_job("w2")
+        assert again["id"] == "paper1"
+        assert again["worker_id"] == "w2"
+        assert again["attempts"] == 1
+        assert "lease expired" in again["last_error"]
+
+        # The crashed worker's late failure report is ignored
+        queue.fail_job("paper1", "late", worker_id="w1")
+        assert queue.get_job("paper1")["status"] == "in_progress"
+
+    def test_heartbeat_renews_lease(self, queue):
+        queue.add_jobs(["paper1"])
+        job = queue.claim_job("w1")
+        later = job["lease_expires_at"] + 30
+        with patch("src.job_queue.time.time", return_value=later - 60 + 1):
+            assert queue.update_heartbeat("w1") == 1
+        with patch("src.job_queue.time.time", return_value=later):
+            assert queue.claim_job("w2") is None
+            # Long-running job is not reset by the old blanket timeout either
+            assert queue.reset_stuck_jobs(timeout_minutes=0) == 0
+
+    def test_worker_counters(self, queue):
+        queue.add_jobs(["paper1", "paper2"])
+        for _ in range(2):
+            queue.claim_job("w1")
+        queue.complete_job("paper1", worker_id="w1")
+        queue.increment_worker_jobs("w1")
+        queue.fail_job("paper2", "boom", worker_id="w1")
+        queue.increment_worker_jobs("w1", failed=True)
+
+        (w,) = queue.get_worker_stats()
+        assert (w["worker_id"], w["jobs_completed"], w["jobs_failed"]) == ("w1", 1, 1)
+        assert w["active"]
+        assert queue.get_stats()["pending"] == 1
+
+
+class TestCountersAndThroughput:
+    """Materialized status counters and rolling throughput."""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return JobQueue(str(tmp_path / "job_queue.db"))
+
+    def _recount(self, queue):
+        rows = queue._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        counted = {"total": 0, "pending": 0, "in_progress": 0, "completed": 0, "failed": 0}
+        for status, n in rows:
+            counted[status] = n
+            counted["total"] += n
+        return counted
+
+    def test_counters_follow_every_transition(self, queue):
+        queue.add_jobs(["p1", "p2", "p3", "p4"])
+        queue.add_jobs(["p1"])  # ignored duplicate
+        queue.claim_job("w1")
+        queue.claim_job("w1")
+        queue.complete_job("p1", worker_id="w1")
+        queue.fail_job("p2", "boom", worker_id="w1")
+        queue._conn().execute("UPDATE jobs SET completed_at = '2000-01-01' WHERE id = 'p1'")
+        queue.cleanup_completed(days=1)
+        assert queue.get_stats() == self._recount(queue)
+        assert queue.get_stats()["total"] == 3
+
+    def test_counters_seeded_for_existing_database(self, tmp_path):
+        path = str(tmp_path / "old.db")
+        queue = JobQueue(path)
+        queue.add_jobs(["p1", "p2"])
+        queue.claim_job("w1")
+        # Simulate a database from before the counters existed
+        conn = queue._conn()
+        for name in ("trg_jobs_count_insert", "trg_jobs_count_delete", "trg_jobs_count_update"):
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("DROP TABLE job_counts")
+        queue.close()
+
+        reopened = JobQueue(path)
+        assert reopened.get_stats() == {
+            "total": 2, "pending": 1, "in_progress": 1, "completed": 0, "failed": 0,
+        }
+
+    def test_throughput_and_eta(self, queue):
+        queue.add_jobs([f"p{i}" for i in range(6)])
+        start = 1_000_000.0
+        with patch("src.job_queue.time.time", return_value=start):
+            for _ in range(2):
+                queue.claim_job("w1")
+        for i, t in enumerate((start + 60, start + 120)):
+            with patch("src.job_queue.time.time", return_value=t):
+                queue.complete_job(f"p{i}", worker_id="w1", model="m1")
+        # Unclaimed jobs marked done do not count as throughput
+        queue.complete_job("p5")
+
+        with patch("src.job_queue.time.time", return_value=start + 120):
+            rate = queue.get_throughput(window=900)
+        assert rate["completed"] == 2
+        assert rate["remaining"] == 3
+        assert rate["by_model"]["m1"]["completed"] == 2
+        assert set(rate["by_worker"]) == {"w1"}
+        # Two jobs in the two minutes since the first one started
+        assert rate["jobs_per_hour"] == pytest.approx(60.0)
+        assert rate["eta_seconds"] == pytest.approx(180.0)
@@ -4,7 +4,9 @@ import shutil
 import tempfile
 from pathlib import Path
 
+from src import pipeline
 from src.pipeline import run_cli as pipeline_run
+from src.stage_graph import Stage, StageGraph
 
 
 def _chdir_tmp():
@@ -19,6 +21,11 @@ def _restore_tmp(tmp: str, cwd: str):
     shutil.rmtree(tmp, ignore_errors=True)
 
 
+def _fake_publish() -> None:
+    Path("site").mkdir(parents=True, exist_ok=True)
+    (Path("site") / "index.html").write_text("<html></html>", encoding="utf-8")
+
+
 def test_pipeline_dry_run_skip_selection(monkeypatch):
     tmp, cwd = _chdir_tmp()
     try:
@@ -28,7 +35,7 @@ def test_pipeline_dry_run_skip_selection(monkeypatch):
             {
                 "id": "test-1",
                 "title": "Title",
-                "abstract": "Abstract",
+                "abstract": "An abstract long enough to pass the QA length check.",
                 "license": {"raw": "", "derivatives_allowed": True},
                 "source_url": "",
             }
@@ -36,19 +43,12 @@ def test_pipeline_dry_run_skip_selection(monkeypatch):
         with open("data/selected.json", "w", encoding="utf-8") as f:
             json.dump(selected, f, ensure_ascii=False)
 
-        # Stub os.system calls for render/index/pdf to avoid spawning module subprocesses
-        import os as _os
-        def _fake_system(cmd: str) -> int:
-            # Simulate successful render/index/pdf and create minimal site output
-            if "src.render" in cmd or "src.search_index" in cmd or "src.make_pdf" in cmd:
-                Path("site").mkdir(parents=True, exist_ok=True)
-                (Path("site")/"index.html").write_text("<html></html>", encoding="utf-8")
-                return 0
-            # Allow select_and_fetch if called (should not be for skip-selection)
-            if "src.select_and_fetch" in cmd:
-                return 0
-            return 0
-        monkeypatch.setattr(_os, "system", _fake_system)
+        # Stub render/index/pdf (templates live in the repo, not the temp dir)
+        monkeypatch.setattr(pipeline, "publish_site", _fake_publish)
+        published = []
+        monkeypatch.setattr(
+            pipeline, "publish_page", lambda tr: published.append(tr["_phase"])
+        )
 
         # Invoke pipeline with skip-selection and dry-run so no external calls happen
         import sys
@@ -64,6 +64,11 @@ def test_pipeline_dry_run_skip_selection(monkeypatch):
         # Expect translation artifact and site output
         assert Path("data/translated/test-1.json").exists()
         assert Path("site/index.html").exists()
+        # Abstract page first, upgraded in place with the full text
+        assert published == ["abstract", "full"]
+        saved = json.loads(Path("data/translated/test-1.json").read_text())
+        assert saved["_phase"] == "full"
+        assert saved["_abstract_at"] and saved["_body_at"]
     finally:
         _restore_tmp(tmp, cwd)
 
@@ -84,17 +89,8 @@ def test_pipeline_records_merge_and_limit(monkeypatch):
         with open("data/records/b.json", "w", encoding="utf-8") as f:
             json.dump(rec_b, f, ensure_ascii=False)
 
-        # Stub os.system to short-circuit render/index/pdf
-        import os as _os
-        def _fake_system(cmd: str) -> int:
-            if "src.render" in cmd or "src.search_index" in cmd or "src.make_pdf" in cmd:
-                Path("site").mkdir(parents=True, exist_ok=True)
-                (Path("site")/"index.html").write_text("<html></html>", encoding="utf-8")
-                return 0
-            if "src.select_and_fetch" in cmd:
-                return 0
-            return 0
-        monkeypatch.setattr(_os, "system", _fake_system)
+        # Stub render/index/pdf (templates live in the repo, not the temp dir)
+        monkeypatch.setattr(pipeline, "publish_site", _fake_publish)
 
         # Run pipeline with explicit records merge and limit 1
         import sys
@@ -115,5 +111,108 @@ def test_pipeline_records_merge_and_limit(monkeypatch):
         files = list(out_dir.glob("*.json")) if out_dir.exists() else []
         assert len(files) == 1
         assert Path("site/index.html").exists()
+        # Selection is recorded and deduplicated for the next run
+        assert [r["id"] for r in json.loads(Path("data/selected.json").read_text())] == [
+            files[0].stem
+        ]
+    finally:
+        _restore_tmp(tmp, cwd)
+
+
+def test_pipeline_retries_papers_that_fail_after_the_abstract(monkeypatch):
+    tmp, cwd = _chdir_tmp()
+    try:
+        os.makedirs("data/records", exist_ok=True)
+        records = [
+            {
+                "id": "test-1",
+                "title": "Title",
+                "abstract": "An abstract long enough to pass the QA length check.",
+                "license": {"raw": ""},
+                "source_url": "",
+            }
+        ]
+        with open("data/records/a.json", "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+        monkeypatch.setattr(pipeline, "publish_site", _fake_publish)
+        monkeypatch.setattr(pipeline, "publish_page", lambda tr: None)
+
+        def broken_download(self, work):
+            raise OSError("connection reset")
+
+        import sys
+
+        argv = ["pipeline", "--records", "data/records/a.json", "--dry-run"]
+        with monkeypatch.context() as m:
+            m.setattr(pipeline.PaperStages, "download", broken_download)
+            sys.argv = list(argv)
+            pipeline_run()
+        saved = json.loads(Path("data/translated/test-1.json").read_text())
+        assert saved["_phase"] == "abstract"
+
+        from src.seen_store import SeenStore
+
+        # Not marked seen, so the next run picks it up and finishes it
+        assert "test-1" not in SeenStore()
+        sys.argv = list(argv)
+        pipeline_run()
+        saved = json.loads(Path("data/translated/test-1.json").read_text())
+        assert saved["_phase"] == "full"
+        assert "test-1" in SeenStore()
     finally:
         _restore_tmp(tmp, cwd)
+
+
+def test_stage_graph_streams_with_backpressure():
+    import threading
+    import time
+
+    events = []
+    lock = threading.Lock()
+    in_flight = {"fast": 0, "max_ahead": 0}
+
+    def fast(x):
+        with lock:
+            in_flight["fast"] += 1
+            events.append(("fast", x))
+        return x
+
+    def slow(x):
+        time.sleep(0.02)
+        with lock:
+            ahead = in_flight["fast"] - sum(1 for e in events if e[0] == "slow")
+            in_flight["max_ahead"] = max(in_flight["max_ahead"], ahead)
+            events.append(("slow", x))
+        if x == 3:
+            raise ValueError("bad item")
+        return x * 10
+
+    graph = StageGraph(
+        [Stage("fast", fast, 1), Stage("slow", slow, 2, queue_size=2)], queue_size=2
+    )
+    results = list(graph.run(range(20)))
+
+    ok = sorted(item for item, err, _ in results if err is None)
+    failed = [(item, stage) for item, err, stage in results if err is not None]
+    assert ok == [x * 10 for x in range(20) if x != 3]
+    assert failed == [(3, "slow")]
+    # The first result streams out long before the source is exhausted
+    first_slow = events.index(next(e for e in events if e[0] == "slow"))
+    assert first_slow < 10
+    # Bounded queue: fast stage never runs far ahead of the slow one
+    assert in_flight["max_ahead"] <= 2 + 2 + 2
+    stats = graph.stats()
+    assert stats["slow"]["processed"] == 19 and stats["slow"]["failed"] == 1
+
+
+def test_stage_graph_reports_base_exceptions():
+    def stage(x):
+        if x == 1:
+            raise SystemExit(2)
+        return x
+
+    results = list(StageGraph([Stage("only", stage, 2)]).run(range(3)))
+    assert sorted(item for item, err, _ in results if err is None) == [0, 2]
+    assert [(item, type(err)) for item, err, _ in results if err is not None] == [
+        (1, SystemExit)
+    ]
@@ -0,0 +1,84 @@
+import threading
+import time
+
+from src.prefetch import Prefetcher
+
+
+def test_fetch_deduplicates_inflight_urls():
+    pf = Prefetcher(max_workers=4, per_host=4, rate_per_sec=0)
+    calls = []
+    gate = threading.Event()
+
+    def slow_fetch(url):
+        calls.append(url)
+        gate.wait(1)
+        return f"body:{url}"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pf.fetch("https://a/x", slow_fetch)))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert calls == ["https://a/x"]
+    assert results == ["body:https://a/x"] * 3
+
+
+def test_per_host_limit_is_enforced():
+    pf = Prefetcher(max_workers=6, per_host=2, rate_per_sec=0)
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+    lock = threading.Lock()
+
+    def fetch(url):
+        host = url.split("/")[2]
+        with lock:
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+        time.sleep(0.02)
+        with lock:
+            active[host] -= 1
+        return url
+
+    urls = [f"https://{h}/{i}" for i in range(6) for h in ("a", "b")]
+    out = list(pf.run(lambda u: pf.fetch(u, fetch), urls))
+
+    assert sorted(r for _, r, _ in out) == sorted(urls)
+    assert peak["a"] <= 2 and peak["b"] <= 2
+
+
+def test_run_reports_errors_and_stops_early():
+    pf = Prefetcher(max_workers=2, per_host=2, rate_per_sec=0, queue_size=1)
+
+    def task(n):
+        if n == 3:
+            raise ValueError("boom")
+        return n * 2
+
+    out = {item: (res, err) for item, res, err in pf.run(task, range(5))}
+    assert out[2] == (4, None)
+    assert isinstance(out[3][1], ValueError)
+
+    # Closing the iterator early must not hang the pool
+    it = pf.run(task, range(100))
+    next(it)
+    it.close()
+
+
+def test_run_reports_base_exceptions():
+    pf = Prefetcher(max_workers=2, per_host=2, rate_per_sec=0, queue_size=1)
+
+    def task(n):
+        if n == 1:
+            raise SystemExit(2)
+        return n
+
+    out = {item: (res, err) for item, res, err in pf.run(task, range(3))}
+    assert len(out) == 3
+    assert isinstance(out[1][1], SystemExit)
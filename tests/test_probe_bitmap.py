@@ -0,0 +1,85 @@
+from src.fetch_engine import BrightDataEngine
+from src.harvest_chinaxiv_optimized import OptimizedChinaXivScraper
+from src.probe_bitmap import ERRORED, FOUND, MISSING, UNKNOWN, ProbeBitmap
+
+
+def test_bitmap_roundtrip_and_due(tmp_path):
+    path = str(tmp_path / "202504.bin")
+    bm = ProbeBitmap("202504", path)
+    bm.mark(1, FOUND, when=1000)
+    bm.mark(2, MISSING, when=1000)
+    bm.mark(3, ERRORED, when=1000)
+    bm.mark(9, MISSING, when=1000)
+    bm.save()
+
+    loaded = ProbeBitmap.load("202504", path)
+    assert [loaded.state(n) for n in (1, 2, 3, 4, 9, 50)] == [
+        FOUND,
+        MISSING,
+        ERRORED,
+        UNKNOWN,
+        MISSING,
+        UNKNOWN,
+    ]
+    assert loaded.counts() == {"found": 1, "missing": 2, "errored": 1}
+
+    # Errored IDs wait for their retry delay; found/missing are skipped
+    assert loaded.due(10, retry_errors_after=3600, now=2000) == [4, 5, 6, 7, 8, 10]
+    assert loaded.due(10, retry_errors_after=3600, now=5000) == [3, 4, 5, 6, 7, 8, 10]
+    # Tail recheck re-probes old missing IDs near the top
+    due = loaded.due(10, tail_recheck=2, recheck_missing_after=60, now=2000)
+    assert 9 in due and 2 not in due
+
+
+def test_rescrape_probes_only_new_ids(tmp_path, monkeypatch, fake_session):
+    monkeypatch.chdir(tmp_path)
+    session = fake_session({1, 2, 4})
+    engine = BrightDataEngine("key", "probe-zone", session=session, rate_per_sec=0)
+    scraper = OptimizedChinaXivScraper("key", "probe-zone", engine=engine)
+
+    papers = scraper.scrape_month_optimized("202504", 5)
+    scraper.save_results("202504", papers)
+    assert sorted(session.ids) == [1, 2, 3, 4, 5]
+
+    session.calls.clear()
+    session.existing.add(6)
+    papers = scraper.scrape_month_optimized("202504", 6)
+    scraper.save_results("202504", papers)
+    assert session.ids == [6]
+
+    from src.utils import read_json
+
+    saved = read_json("data/records/chinaxiv_202504.json")
+    assert [r["oai_identifier"] for r in saved] == [
+        "202504.00001",
+        "202504.00002",
+        "202504.00004",
+        "202504.00006",
+    ]
+
+
+def test_found_ids_persist_only_with_their_records(tmp_path, monkeypatch, fake_session):
+    monkeypatch.chdir(tmp_path)
+    session = fake_session({1, 2})
+    engine = BrightDataEngine("key", "probe-zone", session=session, rate_per_sec=0)
+    scraper = OptimizedChinaXivScraper("key", "probe-zone", engine=engine)
+
+    # Dry run: nothing recorded, so the next run probes everything again
+    scraper.scrape_month_optimized("202504", 3, dry_run=True)
+    assert ProbeBitmap.load("202504").state(1) == UNKNOWN
+
+    # Scraped but never saved: found IDs are not persisted
+    session.calls.clear()
+    scraper.scrape_month_optimized("202504", 3)
+    bitmap = ProbeBitmap.load("202504")
+    assert bitmap.state(1) == UNKNOWN
+    assert bitmap.state(3) == MISSING
+
+    # A found ID whose record is gone is probed again
+    bitmap.mark(2, FOUND)
+    bitmap.save()
+    session.calls.clear()
+    papers = scraper.scrape_month_optimized("202504", 3)
+    assert sorted(session.ids) == [1, 2]
+    scraper.save_results("202504", papers)
+    assert ProbeBitmap.load("202504").state(2) == FOUND
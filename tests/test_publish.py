@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from src.publish import PHASE_ABSTRACT, PHASE_FULL, mark_phase, publish_page
+from src import publish
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _item(**extra):
+    return {
+        "id": "chinaxiv-202510.00001",
+        "title_en": "A Study of Things",
+        "abstract_en": "We study things.",
+        "creators": ["Li Hua"],
+        "date": "2025-10-01",
+        "source_url": "https://chinaxiv.org/abs/202510.00001",
+        "pdf_url": None,
+        "_qa_status": "pass",
+        **extra,
+    }
+
+
+def test_mark_phase_keeps_abstract_timestamp():
+    abstract = mark_phase(_item(), PHASE_ABSTRACT, now="2025-10-01T10:00:00")
+    assert abstract["_phase"] == "abstract"
+    assert abstract["_abstract_at"] == "2025-10-01T10:00:00"
+    assert abstract["_body_at"] is None
+
+    full = mark_phase(
+        _item(body_en=["Body."]), PHASE_FULL, previous=abstract, now="2025-10-01T10:20:00"
+    )
+    assert full["_phase"] == "full"
+    assert full["_abstract_at"] == "2025-10-01T10:00:00"
+    assert full["_body_at"] == "2025-10-01T10:20:00"
+
+
+def test_item_page_is_upgraded_in_place(tmp_path, monkeypatch):
+    from src import render
+
+    # Templates are loaded from src/templates relative to the working directory
+    monkeypatch.chdir(REPO_ROOT)
+    site = tmp_path / "site"
+    render_items, unpublish_item = render.render_items, render.unpublish_item
+    monkeypatch.setattr(render, "render_items", lambda items: render_items(items, str(site)))
+    monkeypatch.setattr(render, "unpublish_item", lambda pid: unpublish_item(pid, str(site)))
+    page = site / "items" / "chinaxiv-202510.00001" / "index.html"
+
+    abstract = mark_phase(_item(), PHASE_ABSTRACT)
+    assert publish_page(abstract)
+    html = page.read_text(encoding="utf-8")
+    assert "We study things." in html
+    assert "being translated" in html
+
+    body = ["This paragraph is long enough to count as real full text content. " * 3] * 3
+    full = mark_phase(_item(body_en=body), PHASE_FULL, previous=abstract)
+    assert publish_page(full)
+    html = page.read_text(encoding="utf-8")
+    assert "being translated" not in html
+    assert "Full Text" in html
+    assert "_has_full_text" not in full  # the saved translation is not mutated
+
+    # A flagged full text takes the page down
+    assert not publish_page({**full, "_qa_status": "flag_chinese"})
+    assert not page.exists()
+
+
+def test_publish_errors_are_logged_not_raised(monkeypatch):
+    from src import render
+
+    def boom(items):
+        raise RuntimeError("no templates")
+
+    monkeypatch.setattr(render, "render_items", boom)
+    assert publish.publish_page(_item(_phase="abstract")) is False
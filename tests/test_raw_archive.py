@@ -0,0 +1,59 @@
+import json
+import os
+from pathlib import Path
+
+from src.raw_archive import HtmlArchive, archive_page, reparse_month
+
+PAGES = Path(__file__).parent / "fixtures" / "harvest" / "abs_pages"
+
+
+def test_put_get_dedupes_and_survives_reopen(tmp_path):
+    root = str(tmp_path / "raw")
+    archive = HtmlArchive("202504", root)
+    html = "<html><h1>同一页面内容</h1></html>" * 50
+
+    sha1 = archive.put("202504.00001", html)
+    sha2 = archive.put("202504.00002", html)
+    archive.put("202504.00003", "<html>other</html>")
+    assert sha1 == sha2
+    assert archive.index["202504.00001"]["offset"] == archive.index["202504.00002"]["offset"]
+    # Compressed well below the raw size
+    assert os.path.getsize(archive.pack_path) < len(html.encode("utf-8"))
+
+    # A torn index line from a crash is ignored on reopen
+    with open(archive.index_path, "a", encoding="utf-8") as f:
+        f.write('{"id": "202504.0')
+
+    reopened = HtmlArchive("202504", root)
+    assert len(reopened) == 3
+    assert reopened.get("202504.00002") == html
+    assert reopened.get("202504.09999") is None
+
+
+def test_reparse_rebuilds_month_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    expected = []
+    for page in sorted(PAGES.glob("202504.*.html")):
+        archive_page(page.stem, page.read_text(encoding="utf-8"))
+        expected.append(json.loads(page.with_suffix(".json").read_text(encoding="utf-8")))
+
+    assert reparse_month("202504") == len(expected)
+    with open("data/records/chinaxiv_202504.json", encoding="utf-8") as f:
+        assert json.load(f) == expected
+
+
+def test_reparse_keeps_records_without_archived_pages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    page = sorted(PAGES.glob("202504.*.html"))[0]
+    archive_page(page.stem, page.read_text(encoding="utf-8"))
+    reparsed = json.loads(page.with_suffix(".json").read_text(encoding="utf-8"))
+
+    os.makedirs("data/records")
+    older = {"id": "chinaxiv-202504.99999", "title": "Harvested before archiving"}
+    stale = dict(reparsed, title="Parsed by an older parser")
+    with open("data/records/chinaxiv_202504.json", "w", encoding="utf-8") as f:
+        json.dump([stale, older], f)
+
+    assert reparse_month("202504") == 1
+    with open("data/records/chinaxiv_202504.json", encoding="utf-8") as f:
+        assert json.load(f) == sorted([reparsed, older], key=lambda r: r["id"])
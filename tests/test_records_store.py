@@ -0,0 +1,128 @@
+import json
+import os
+
+from src.records_store import (
+    STATUS_TRANSLATED,
+    RecordsStore,
+    lookup_record,
+    record_month,
+)
+
+
+def _write(path, items):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False)
+
+
+def _rec(pid, title="T", **extra):
+    return {"id": pid, "title": title, **extra}
+
+
+def test_record_month_from_id_or_date():
+    assert record_month({"id": "chinaxiv-202504.00123"}) == "202504"
+    assert record_month({"id": "oai:x", "date": "2024-11-02T00:00:00Z"}) == "202411"
+    assert record_month({"id": "x"}) is None
+
+
+def test_sync_get_and_iterate(tmp_path):
+    a = str(tmp_path / "records" / "chinaxiv_202504.json")
+    b = str(tmp_path / "records" / "chinaxiv_202505.json")
+    _write(a, [_rec("chinaxiv-202504.00001"), _rec("chinaxiv-202504.00002")])
+    _write(b, [_rec("chinaxiv-202505.00001", "标题")])
+
+    store = RecordsStore(str(tmp_path / "records.db"))
+    assert store.sync([a, b]) == 3
+    assert store.get("chinaxiv-202505.00001")["title"] == "标题"
+    assert store.get("missing") is None
+    assert [r["id"] for r in store.iter_month("202504")] == [
+        "chinaxiv-202504.00001",
+        "chinaxiv-202504.00002",
+    ]
+
+    store.set_status(["chinaxiv-202504.00002"], STATUS_TRANSLATED)
+    assert [r["id"] for r in store.iter_status(STATUS_TRANSLATED)] == ["chinaxiv-202504.00002"]
+    assert store.stats()["by_month"] == {"202504": 2, "202505": 1}
+
+
+def test_sync_is_incremental_and_keeps_status(tmp_path):
+    a = str(tmp_path / "a.json")
+    _write(a, [_rec("p1")])
+    store = RecordsStore(str(tmp_path / "records.db"))
+    assert store.sync([a]) == 1
+    assert store.sync([a]) == 0  # unchanged file is not re-read
+
+    store.set_status(["p1"], STATUS_TRANSLATED)
+    _write(a, [_rec("p1", "Updated title"), _rec("p2")])
+    assert store.sync([a]) == 2
+    assert store.get("p1")["title"] == "Updated title"
+    assert [r["id"] for r in store.iter_status(STATUS_TRANSLATED)] == ["p1"]
+
+    # A fresh connection sees the persisted index
+    assert len(RecordsStore(str(tmp_path / "records.db"))) == 2
+
+
+def test_precedence_and_export(tmp_path):
+    old = str(tmp_path / "chinaxiv_202504.json")
+    new = str(tmp_path / "chinaxiv_202505.json")
+    _write(new, [_rec("p1", "newer")])
+    _write(old, [_rec("p1", "older"), _rec("p2")])
+    store = RecordsStore(str(tmp_path / "records.db"))
+    store.sync([new])
+    store.sync([old])
+    # Later file name wins regardless of sync order
+    assert store.get("p1")["title"] == "newer"
+
+    out = str(tmp_path / "merged.json")
+    assert store.export(out, [old, new]) == 2
+    with open(out, encoding="utf-8") as f:
+        merged = json.load(f)
+    assert [r["id"] for r in merged] == ["p1", "p2"]
+
+
+def test_lookup_prefers_selected_and_finds_new_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write("data/records/chinaxiv_202504.json", [_rec("p1", "harvested")])
+    _write("data/selected.json", [_rec("p1", "selected", files={"pdf_path": "x.pdf"})])
+    store = RecordsStore("data/records.db")
+
+    assert lookup_record("p1", store)["title"] == "selected"
+
+    # Written after the last sync: a miss forces a re-sync
+    _write("data/records/chinaxiv_202505.json", [_rec("p9")])
+    assert lookup_record("p9", store)["id"] == "p9"
+    assert lookup_record("nope", store) is None
+
+
+def test_export_keeps_records_overridden_by_selected(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    a = "data/records/chinaxiv_202504.json"
+    _write(a, [_rec("p1", "harvested"), _rec("p2")])
+    _write("data/selected.json", [_rec("p1", "selected")])
+    store = RecordsStore("data/records.db")
+    store.refresh()
+    assert store.get("p1")["title"] == "selected"
+
+    assert store.export("out.json", [a]) == 2
+    with open("out.json", encoding="utf-8") as f:
+        merged = json.load(f)
+    assert [(r["id"], r["title"]) for r in merged] == [("p1", "harvested"), ("p2", "T")]
+
+
+def test_selected_precedence_follows_its_current_contents(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write("data/records/chinaxiv_202504.json", [_rec("p1", "harvested")])
+    _write("data/selected.json", [_rec("p1", "selected"), _rec("p2", "only selected")])
+    store = RecordsStore("data/records.db")
+    store.refresh()
+    store.set_status(["p1"], STATUS_TRANSLATED)
+
+    _write("data/selected.json", [_rec("p3", "selected later")])
+    store.refresh()
+    assert store.get("p1")["title"] == "harvested"
+    assert store.get("p2") is None
+    assert [r["id"] for r in store.iter_status(STATUS_TRANSLATED)] == ["p1"]
+
+    os.remove("data/selected.json")
+    store.refresh()
+    assert store.get("p3") is None
@@ -8,3 +8,12 @@ def test_build_index_fields():
     idx = build_index(items)
     assert idx and set(idx[0].keys()) == {"id", "title", "authors", "abstract", "subjects", "date"}
 
+
+
+def test_build_index_skips_abstract_phase():
+    items = [
+        {"id": "1", "title_en": "Done", "_phase": "full"},
+        {"id": "2", "title_en": "Body pending", "_phase": "abstract"},
+        {"id": "3", "title_en": "Before phases"},
+    ]
+    assert [e["id"] for e in build_index(items)] == ["1", "3"]
@@ -0,0 +1,56 @@
+import json
+import os
+
+from src.seen_store import SeenStore, decode_lines, encode_sorted
+
+
+def test_front_coding_round_trip():
+    ids = sorted(["chinaxiv-202504.00001", "chinaxiv-202504.00002", "chinaxiv-202505.00010", "oai:x"])
+    lines = list(encode_sorted(ids))
+    assert lines[1] == "20\t2"
+    assert list(decode_lines(["# header\n"] + [line + "\n" for line in lines])) == ids
+
+
+def test_add_appends_daily_delta_and_reloads(tmp_path):
+    root = str(tmp_path / "seen")
+    store = SeenStore(root, legacy_path=None)
+    assert store.add("a")
+    assert not store.add("a")
+    assert store.add_many(["b", "c", "a"]) == 2
+
+    deltas = [f for f in os.listdir(root) if f.startswith("delta-")]
+    assert len(deltas) == 1
+    with open(os.path.join(root, deltas[0])) as f:
+        assert f.read() == "a\nb\nc\n"
+
+    reloaded = SeenStore(root, legacy_path=None)
+    assert len(reloaded) == 3 and "b" in reloaded
+
+
+def test_compaction_and_legacy_import(tmp_path):
+    root = str(tmp_path / "seen")
+    legacy = tmp_path / "seen.json"
+    legacy.write_text(json.dumps({"ids": ["old-1", "old-2"]}))
+    store = SeenStore(root, legacy_path=str(legacy))
+    assert "old-1" in store
+    store.add("new-1")
+
+    assert store.maybe_compact(max_deltas=7)  # legacy file forces a compaction
+    assert not legacy.exists()
+    assert os.listdir(root) == ["base.txt"]
+    assert not store.maybe_compact(max_deltas=7)
+
+    reloaded = SeenStore(root, legacy_path=str(legacy))
+    assert sorted(reloaded.ids) == ["new-1", "old-1", "old-2"]
+
+
+def test_compacts_when_deltas_exceed_limit(tmp_path):
+    root = tmp_path / "seen"
+    root.mkdir()
+    for day in ("20250101", "20250102", "20250103"):
+        (root / f"delta-{day}.txt").write_text(f"id-{day}\n")
+    store = SeenStore(str(root), legacy_path=None)
+    assert not store.maybe_compact(max_deltas=3)
+    store.add("today")
+    assert store.maybe_compact(max_deltas=3)
+    assert len(SeenStore(str(root), legacy_path=None)) == 4
@@ -0,0 +1,53 @@
+from src.segment_classifier import (
+    MASK,
+    PASSTHROUGH,
+    TRANSLATE,
+    classify_paragraphs,
+    summarize_decisions,
+)
+from src.services.translation_service import TranslationService
+
+
+PARAS = [
+    "本文提出了一种新的方法。",
+    "In this paper we propose a new method for remote sensing.",
+    "$x^2 + y^2 = 1$  (3.14, 2.71)",
+    "参考文献",
+    "[1] Smith J, Doe A. Deep learning. Nature, 2015, 521: 436-444.",
+    "[2] 张三. 深度学习[J]. 计算机学报, 2020.",
+]
+
+
+def test_classify_paragraphs():
+    decisions = classify_paragraphs(PARAS)
+    assert [d.decision for d in decisions] == [
+        TRANSLATE,
+        PASSTHROUGH,
+        MASK,
+        TRANSLATE,
+        PASSTHROUGH,
+        TRANSLATE,
+    ]
+    assert decisions[4].reason == "reference"
+    assert decisions[5].reason == "reference"
+
+    summary = summarize_decisions(PARAS, decisions)
+    assert summary[TRANSLATE] == 3
+    assert summary["tokens_saved"] > 0
+
+
+def test_translate_paragraphs_skips_untranslatable(monkeypatch):
+    svc = TranslationService(config={"translation": {"skip_untranslatable": True}})
+    sent = []
+
+    def fake_translate_field(text, model=None, dry_run=False, glossary_override=None):
+        sent.append(text)
+        return f"EN:{text}"
+
+    monkeypatch.setattr(svc, "translate_field", fake_translate_field)
+    out = svc.translate_paragraphs(PARAS)
+
+    assert sent == [PARAS[0], PARAS[3], PARAS[5]]
+    assert out[0] == f"EN:{PARAS[0]}"
+    assert out[1:3] == PARAS[1:3]
+    assert out[4] == PARAS[4]
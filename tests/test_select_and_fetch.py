@@ -42,14 +42,22 @@ def test_select_and_fetch_marks_seen(tmp_path, monkeypatch):
 
         return Resp()
 
+    def fake_stream_download(url, dest_path, expect_pdf=False, **kwargs):
+        Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(dest_path).write_bytes(b"%PDF-1.4")
+        return True
+
     monkeypatch.setattr(saf, "http_get", fake_http_get)
+    monkeypatch.setattr(saf, "stream_download", fake_stream_download)
 
     out = process_records(str(rec_path))
 
-    seen_path = Path("data/seen.json")
-    assert seen_path.exists()
-    seen = json.loads(seen_path.read_text())
-    assert "R1" in seen.get("ids", []) and "R2" in seen.get("ids", [])
+    from src.seen_store import SeenStore
+
+    seen = SeenStore()
+    assert "R1" in seen and "R2" in seen
+    # A second pass selects nothing
+    assert process_records(str(rec_path)) == []
     # Check files paths captured
     assert out[0]["files"]["pdf_path"].endswith("R1.pdf")
 
@@ -71,7 +79,12 @@ def test_download_skips_non_pdf(tmp_path, monkeypatch):
 
         return Resp()
 
+    def fake_stream_download(url, dest_path, expect_pdf=False, **kwargs):
+        # Mirrors the real sniff: HTML body is not a PDF
+        return False
+
     monkeypatch.setattr(saf, "http_get", fake_http_get)
+    monkeypatch.setattr(saf, "stream_download", fake_stream_download)
     import json
 
     tmp_path.joinpath("data").mkdir()
@@ -0,0 +1,97 @@
+import sys
+import threading
+
+import pytest
+
+from src import supervisor as sup_mod
+from src.supervisor import WorkerSupervisor
+
+# Fake worker: argv is [index, "--threads", T]. Crashes on its first run,
+# exits cleanly on the second.
+CRASH_ONCE = """
+import os, sys
+marker = f"ran-{sys.argv[1]}"
+if not os.path.exists(marker):
+    open(marker, "w").close()
+    sys.exit(3)
+open(f"done-{sys.argv[1]}-threads-{sys.argv[3]}", "w").close()
+"""
+
+# Fake worker: runs until SIGTERM, then records that it drained.
+UNTIL_TERM = """
+import signal, sys, time
+stop = []
+signal.signal(signal.SIGTERM, lambda *a: stop.append(1))
+open(f"up-{sys.argv[1]}", "w").close()
+while not stop:
+    time.sleep(0.05)
+open(f"drained-{sys.argv[1]}", "w").close()
+"""
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    completed = iter(range(0, 1000, 5))
+    monkeypatch.setattr(
+        sup_mod.job_queue, "get_stats", lambda: {"completed": next(completed)}
+    )
+    return tmp_path
+
+
+def _supervisor(script, n, **kwargs):
+    return WorkerSupervisor(
+        n,
+        threads=2,
+        backoff_base=0.1,
+        backoff_max=0.2,
+        stable_after=60,
+        report_interval=60,
+        poll_interval=0.05,
+        command=[sys.executable, "-c", script],
+        **kwargs,
+    )
+
+
+def test_backoff_doubles_and_caps():
+    s = WorkerSupervisor(1, backoff_base=2, backoff_max=30)
+    assert [s.backoff(n) for n in (1, 2, 3, 4, 5, 6)] == [2, 4, 8, 16, 30, 30]
+
+
+def test_restarts_crashed_workers_until_they_finish(workdir):
+    s = _supervisor(CRASH_ONCE, 3)
+    result = s.run()
+
+    assert result["restarts"] == 3
+    assert [w.exit_codes for w in s.workers] == [[3, 0]] * 3
+    assert sorted(p.name for p in workdir.glob("done-*")) == [
+        f"done-{i}-threads-2" for i in range(3)
+    ]
+    assert not (workdir / "data" / "workers" / "supervisor.pid").exists()
+
+
+def test_shutdown_drains_workers(workdir):
+    s = _supervisor(UNTIL_TERM, 2, drain_timeout=10)
+
+    def _stop_when_up():
+        while len(list(workdir.glob("up-*"))) < 2:
+            threading.Event().wait(0.05)
+        s.handle_shutdown(None, None)
+
+    threading.Thread(target=_stop_when_up, daemon=True).start()
+    s.run()
+
+    assert sorted(p.name for p in workdir.glob("drained-*")) == ["drained-0", "drained-1"]
+    assert all(w.finished and w.restarts == 0 for w in s.workers)
+
+
+def test_restarted_worker_gets_a_new_queue_id(monkeypatch):
+    from src import worker as worker_mod
+
+    monkeypatch.setattr(worker_mod.os, "getpid", lambda: 101)
+    first = worker_mod.BackgroundWorker(0)
+    monkeypatch.setattr(worker_mod.os, "getpid", lambda: 202)
+    restarted = worker_mod.BackgroundWorker(0)
+    # The replacement must not renew the leases of the crashed process
+    assert first.worker_id == "worker-0-101"
+    assert restarted.worker_id == "worker-0-202"
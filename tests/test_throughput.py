@@ -0,0 +1,33 @@
+import pytest
+
+from src.throughput import format_eta, summarize
+
+
+def test_summarize_rates_by_worker_and_model():
+    now = 10_000.0
+    events = [
+        (now - 3000, "w1", "m1", 60.0),  # outside the window
+        (now - 540, "w1", "m1", 60.0),
+        (now - 300, "w2", "m2", 30.0),
+        (now - 60, "w1", "m1", 60.0),
+    ]
+    out = summarize(events, remaining=30, window=900, now=now)
+
+    assert out["completed"] == 3
+    # First job in the window started 600s ago
+    assert out["jobs_per_hour"] == pytest.approx(18.0)
+    assert out["by_worker"]["w1"]["completed"] == 2
+    assert out["by_model"]["m2"]["avg_seconds"] == 30.0
+    assert out["eta_seconds"] == pytest.approx(6000.0)
+
+
+def test_eta_unknown_without_completions_and_zero_when_done():
+    assert summarize([], remaining=5, window=900, now=1.0)["eta_seconds"] is None
+    assert summarize([], remaining=0, window=900, now=1.0)["eta_seconds"] == 0.0
+
+
+def test_format_eta():
+    assert format_eta(None) == "unknown"
+    assert format_eta(600) == "10m"
+    assert format_eta(3 * 3600 + 20 * 60) == "3h 20m"
+    assert format_eta(72 * 3600) == "3.0d"
@@ -81,3 +81,26 @@ def test_translation_gate_allows_small_flagged_ratio(tmp_path, monkeypatch):
     assert summary.total == 2
     assert summary.flagged == 1
     assert summary.passed == 1
+
+
+def test_translation_gate_skips_abstract_phase_saves(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    translated_dir = Path("data/translated")
+    translated_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(TRANSLATION_FIXTURE, translated_dir / "sample_translation.json")
+    # Title and abstract only: its full text has not been translated yet
+    (translated_dir / "partial.json").write_text(
+        json.dumps(
+            {
+                "id": "paper-partial",
+                "title_en": "Partial Sample",
+                "abstract_en": "Only the abstract has been translated so far.",
+                "_phase": "abstract",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    summary = run_translation_gate(output_path="reports/translation_report.json")
+    assert summary.total == 1
+    assert summary.passed == 1
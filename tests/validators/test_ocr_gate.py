@@ -52,3 +52,32 @@ def test_gate_passes_with_improvements(tmp_path: Path) -> None:
     assert summary.pass_threshold_met
     assert summary.improved == 1
     assert summary.reasons == []
+
+
+def test_gate_compacts_append_log(tmp_path: Path) -> None:
+    """Per-paper log entries are folded into the aggregate report before gating."""
+    from src.pdf_pipeline import _write_ocr_record
+
+    write_json(
+        tmp_path / "ocr_report.json",
+        {"paper-1": {"need_ocr": True, "pre_ocr_chars": 100, "ran_ocr": False, "post_ocr_chars": 100}},
+    )
+    # A later entry for paper-1 supersedes the stale aggregate entry
+    _write_ocr_record(
+        str(tmp_path),
+        "paper-1",
+        {"need_ocr": True, "pre_ocr_chars": 100, "ran_ocr": True, "post_ocr_chars": 1000},
+    )
+    _write_ocr_record(
+        str(tmp_path),
+        "paper-2",
+        {"need_ocr": False, "pre_ocr_chars": 2000, "ran_ocr": False, "post_ocr_chars": 2000},
+    )
+
+    summary = run_ocr_gate(report_dir=str(tmp_path))
+    assert summary.pass_threshold_met
+    assert summary.improved == 1
+
+    aggregate = json.loads((tmp_path / "ocr_report.json").read_text(encoding="utf-8"))
+    assert set(aggregate) == {"paper-1", "paper-2"}
+    assert (tmp_path / "ocr_report.jsonl").read_text(encoding="utf-8") == ""